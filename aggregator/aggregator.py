@@ -1,41 +1,81 @@
+import asyncio
 import concurrent.futures
+import contextlib
 import datetime
+import functools
+import inspect
 import logging
 import random
+import threading
 import time
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from django.conf import settings
 from django.core.cache import cache
 
-from providers.alansari.integration import AlAnsariProvider
-from providers.dahabshiil.integration import DahabshiilProvider
-from providers.instarem.integration import InstaRemProvider
-from providers.intermex.integration import IntermexProvider
-from providers.koronapay.integration import KoronaPayProvider
-from providers.mukuru.integration import MukuruProvider
-from providers.orbitremit.integration import OrbitRemitProvider
-from providers.pangea.integration import PangeaProvider
-from providers.paysend.integration import PaysendProvider
-from providers.placid.integration import PlacidProvider
-from providers.remitbee.integration import RemitbeeProvider
-from providers.remitguru.integration import RemitGuruProvider
-from providers.remitly.integration import RemitlyProvider
-from providers.rewire.integration import RewireProvider
-from providers.ria.integration import RIAProvider
-from providers.sendwave.integration import SendwaveProvider
-from providers.singx.integration import SingXProvider
-from providers.transfergo.integration import TransferGoProvider
-from providers.westernunion.integration import WesternUnionProvider
-from providers.wirebarley.integration import WireBarleyProvider
-from providers.wise.integration import WiseProvider
-from providers.xe.integration import XEProvider
-from providers.xoom.integration import XoomProvider
+from aggregator.circuit_breaker import STATE_CLOSED, provider_breakers
+from aggregator.exceptions import ProviderLaneFullError
+from aggregator.executor import get_provider_executor
+from aggregator.hedging import get_hedge_config, hedge_budget, latency_tracker
+from aggregator.metrics import (
+    OUTCOME_CACHE_HIT,
+    OUTCOME_ERROR,
+    OUTCOME_SKIPPED,
+    OUTCOME_TIMEOUT,
+    classify_error,
+    classify_outcome,
+    corridor_label,
+    provider_metrics,
+)
+from aggregator.negative_cache import unsupported_corridors
+from aggregator.quote_table import select_quotes
+from aggregator.rate_governor import provider_governor
+from aggregator.registry import LazyProviderList, ProviderRegistry, provider_registry
+from aggregator.routing import CORRIDOR_RULES, CorridorRoutingIndex
+from aggregator.scheduler import FairScheduler
+from aggregator.volatility import rate_volatility
+from providers.base.http_stats import instrument_provider, track_call
+from providers.base.quote import Quote
 
 logger = logging.getLogger(__name__)
 
 
+# Stands in for the amount when mapping a corridor onto get_quotes_for_amounts arguments
+_BATCH_AMOUNT = object()
+
+_blocking_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_blocking_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Return the process-wide pool used for blocking cache I/O from the event loop.
+
+    The pool is created on first use and sized by AGGREGATOR_BLOCKING_POOL_SIZE.
+    Blocking provider calls themselves run on the per-provider lanes of the
+    provider executor (see aggregator.executor).
+    """
+    global _blocking_executor
+    if _blocking_executor is None:
+        with _blocking_executor_lock:
+            if _blocking_executor is None:
+                _blocking_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=getattr(settings, "AGGREGATOR_BLOCKING_POOL_SIZE", 32),
+                    thread_name_prefix="aggregator-blocking",
+                )
+    return _blocking_executor
+
+
 # Add cache key generator function at the top level
 def get_provider_quote_cache_key(
     provider_name, source_country, dest_country, source_currency, dest_currency, amount
@@ -46,32 +86,19 @@ def get_provider_quote_cache_key(
     return f"provider_quote:{provider_name_upper}:{source_country}:{dest_country}:{source_currency}:{dest_currency}:{float(amount)}"
 
 
+def get_revalidation_lease_cache_key(cache_key):
+    """Generate the cache key of the lease held while a stale provider quote is refreshed."""
+    return f"revalidate:{cache_key}"
+
+
 class Aggregator:
-    PROVIDERS = [
-        XEProvider(),
-        RemitlyProvider(),
-        RIAProvider(),
-        WiseProvider(),
-        TransferGoProvider(),
-        WesternUnionProvider(),
-        XoomProvider(),
-        SingXProvider(),
-        PaysendProvider(),
-        AlAnsariProvider(),
-        RemitbeeProvider(),
-        InstaRemProvider(),
-        PangeaProvider(),
-        KoronaPayProvider(),
-        MukuruProvider(),
-        RewireProvider(),
-        SendwaveProvider(),
-        WireBarleyProvider(),
-        OrbitRemitProvider(),
-        DahabshiilProvider(),
-        IntermexProvider(),
-        PlacidProvider(),
-        RemitGuruProvider(),
-    ]
+    # Providers come from the lazy registry (aggregator.registry) and are imported and
+    # instantiated on first dispatch. Iterating PROVIDERS loads all of them; assigning a
+    # list of instances replaces the registry.
+    PROVIDERS = LazyProviderList(provider_registry)
+
+    # Compiled once from the providers' static corridor tables
+    ROUTING_INDEX = CorridorRoutingIndex(provider_registry.names(), CORRIDOR_RULES)
 
     PROVIDER_PARAMS = {
         "REMITLYPROVIDER": {
@@ -276,225 +303,1674 @@ class Aggregator:
     }
 
     @classmethod
-    def get_all_quotes(
+    def _get_timeout(cls) -> float:
+        """Return the overall fan-out timeout in seconds."""
+        try:
+            from aggregator.configurator import get_configured_aggregator_params
+
+            config_params = get_configured_aggregator_params()
+            return config_params.get("timeout", 20)
+        except ImportError:
+            logger.warning("Could not import configurator, using default timeout")
+            return 20
+
+    @classmethod
+    def _build_provider_params(
         cls,
+        provider_name: str,
         source_country: str,
         dest_country: str,
         source_currency: str,
         dest_currency: str,
         amount: Decimal,
-        sort_by: Optional[str] = "best_rate",
-        exclude_providers: Optional[List[str]] = None,
-        max_workers: int = 10,
-        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
-        max_delivery_time_minutes: Optional[int] = None,
-        max_fee: Optional[float] = None,
-        use_cache: bool = True,  # New parameter to control caching
     ) -> Dict[str, Any]:
-        exclude_providers = exclude_providers or []
-        providers_to_call = [
-            p for p in cls.PROVIDERS if p.__class__.__name__ not in exclude_providers
-        ]
+        """Map the standard quote arguments onto a provider's get_quote signature."""
+        provider_params = {
+            "amount": amount,
+            "source_currency": source_currency,
+            "dest_currency": dest_currency,
+            "source_country": source_country,
+            "dest_country": dest_country,
+        }
 
-        logger.info(
-            f"Aggregator: Starting quotes for {amount:.2f} {source_currency} -> {dest_currency}, "
-            f"corridor {source_country}->{dest_country}"
-        )
-        logger.info(f"Total providers to call: {len(providers_to_call)}")
+        if (
+            provider_name in cls.PROVIDER_PARAMS
+            and "get_quote" in cls.PROVIDER_PARAMS[provider_name]
+        ):
+            param_map = cls.PROVIDER_PARAMS[provider_name]["get_quote"]
+            mapped_params = {}
+            for target_param, source_param in param_map.items():
+                mapped_params[target_param] = provider_params.get(source_param)
+            provider_params = mapped_params
 
-        start_time = time.time()
-        all_quotes = []
-        all_provider_results = []
+        return provider_params
+
+    @classmethod
+    def _get_registry(cls) -> Optional[ProviderRegistry]:
+        """The registry providers are loaded from, or None when PROVIDERS was overridden."""
+        providers_attr = inspect.getattr_static(cls, "PROVIDERS")
+        if isinstance(providers_attr, LazyProviderList):
+            return providers_attr.registry
+        return None
+
+    @classmethod
+    @contextlib.contextmanager
+    def _lease_provider(cls, provider) -> Iterator[Any]:
+        """Lease a pooled instance of provider for one call (see ProviderRegistry.lease)."""
+        registry = cls._get_registry()
+        lease = contextlib.nullcontext(provider) if registry is None else registry.lease(provider)
+        with lease as instance:
+            # Count the instance's HTTP traffic in the metrics of the call
+            instrument_provider(instance)
+            yield instance
 
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _alease_provider(cls, provider) -> AsyncIterator[Any]:
+        """_lease_provider for coroutines; a full pool is waited on in the blocking pool."""
+        lease = cls._lease_provider(provider)
+        checkout = asyncio.get_running_loop().run_in_executor(
+            get_blocking_executor(), lease.__enter__
+        )
         try:
-            from aggregator.configurator import get_configured_aggregator_params
+            instance = await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            # The checkout still completes; give the instance back when it does
+            def release(future):
+                if not future.cancelled() and future.exception() is None:
+                    lease.__exit__(None, None, None)
 
-            config_params = get_configured_aggregator_params()
-            timeout = config_params.get("timeout", 20)
-        except ImportError:
-            timeout = 20
-            logger.warning("Could not import configurator, using default timeout")
+            checkout.add_done_callback(release)
+            raise
+        with contextlib.ExitStack() as stack:
+            stack.push(lease)
+            yield instance
 
-        def call_provider(provider):
-            provider_name = provider.__class__.__name__
-            provider_id = getattr(provider, "provider_id", provider_name)
+    @classmethod
+    def _get_providers_to_call(
+        cls,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        exclude_providers: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """
+        Return the providers to dispatch to for a corridor.
 
-            # Check cache first if caching is enabled
-            if use_cache:
-                cache_key = get_provider_quote_cache_key(
-                    provider_name,
+        Excluded providers are dropped, as are providers the routing index knows cannot
+        serve the corridor and providers that recently answered that they do not serve it
+        (see aggregator.negative_cache). Set AGGREGATOR_CORRIDOR_ROUTING to False to call
+        them all. Registry providers are imported and instantiated only once they are
+        selected; a provider that fails to load is skipped.
+        """
+        exclude_providers = exclude_providers or []
+        registry = cls._get_registry()
+        if registry is not None:
+            # (name, instance) pairs; registry instances are built once selected
+            candidates = [(name, None) for name in registry.names()]
+        else:
+            candidates = [(p.__class__.__name__, p) for p in cls.PROVIDERS]
+        candidates = [c for c in candidates if c[0] not in exclude_providers]
+
+        if getattr(settings, "AGGREGATOR_CORRIDOR_ROUTING", True):
+            corridor = (source_country, dest_country, source_currency, dest_currency)
+            names = [name for name, _ in candidates]
+            routed = {name for name in names if cls.ROUTING_INDEX.supports(name, *corridor)}
+            routed -= unsupported_corridors.get_skipped(routed, *corridor)
+
+            skipped = [name for name in names if name not in routed]
+            if skipped:
+                logger.info(
+                    f"Routing: {source_country}->{dest_country} "
+                    f"({source_currency}->{dest_currency}) not served by {skipped}"
+                )
+            candidates = [c for c in candidates if c[0] in routed]
+
+        # Only now import and build the providers that will actually be called
+        providers = []
+        for name, instance in candidates:
+            if instance is None:
+                try:
+                    instance = registry.get(name)
+                except Exception as e:
+                    logger.exception(f"Could not load provider {name}: {str(e)}")
+                    continue
+            providers.append(instance)
+        return providers
+
+    @classmethod
+    def _get_cached_provider_result(
+        cls,
+        provider_name: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        provider=None,
+    ) -> Optional[Quote]:
+        """
+        Return the cached result for a provider, if any.
+
+        Successful quotes are cached as (fresh_until, quote). Past fresh_until (the
+        soft TTL) the quote is still returned until the entry expires (the hard TTL);
+        when provider is given, a background refresh of the entry is scheduled too.
+        """
+        cache_key = get_provider_quote_cache_key(
+            provider_name,
+            source_country,
+            dest_country,
+            source_currency,
+            dest_currency,
+            amount,
+        )
+        cached = cache.get(cache_key)
+        if not cached:
+            return None
+        if isinstance(cached, tuple):
+            fresh_until, cached = cached
+            if provider is not None and time.time() >= fresh_until:
+                cls._schedule_revalidation(
+                    provider,
+                    cache_key,
                     source_country,
                     dest_country,
                     source_currency,
                     dest_currency,
                     amount,
                 )
-                cached_result = cache.get(cache_key)
-                if cached_result:
-                    logger.info(f"Cache hit for provider {provider_id}")
-                    if cached_result.get("success", False):
-                        all_quotes.append(cached_result)
-                    return cached_result
+        # Entries written before quotes were records are still plain dicts
+        return Quote.from_dict(cached)
+
+    @classmethod
+    def _schedule_revalidation(
+        cls,
+        provider,
+        cache_key: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+    ) -> None:
+        """
+        Refresh a stale provider quote on the provider's lane, without waiting for it.
+
+        A lease in the shared cache makes sure only one refresh per entry runs at a
+        time across all workers. If the lane is full the refresh is skipped; the
+        next read of the stale entry tries again.
+        """
+        corridor = (source_country, dest_country, source_currency, dest_currency, amount)
+        provider_name = provider.__class__.__name__
+        lease_key = get_revalidation_lease_cache_key(cache_key)
+        lease_seconds = getattr(settings, "PROVIDER_CACHE_REVALIDATE_LEASE", 60)
+        try:
+            if not cache.add(lease_key, True, timeout=lease_seconds):
+                return
+        except Exception as e:
+            logger.warning(f"Could not schedule refresh of {cache_key}: {str(e)}")
+            return
 
+        def revalidate():
             try:
-                provider_params = {
-                    "amount": amount,
-                    "source_currency": source_currency,
-                    "dest_currency": dest_currency,
-                    "source_country": source_country,
-                    "dest_country": dest_country,
-                }
-
-                if (
-                    provider_name in cls.PROVIDER_PARAMS
-                    and "get_quote" in cls.PROVIDER_PARAMS[provider_name]
-                ):
-                    param_map = cls.PROVIDER_PARAMS[provider_name]["get_quote"]
-                    mapped_params = {}
-                    for target_param, source_param in param_map.items():
-                        mapped_params[target_param] = provider_params.get(source_param)
-                    provider_params = mapped_params
-
-                logger.info(f"Calling {provider_id}.get_quote(...) with {provider_params}")
-                result = provider.get_quote(**provider_params)
-
-                if "provider_id" not in result:
-                    result["provider_id"] = provider_id
-
-                # Store successful results in cache with TTL and jitter
-                if use_cache and result.get("success", False):
-                    cache_key = get_provider_quote_cache_key(
-                        provider_name,
-                        source_country,
-                        dest_country,
-                        source_currency,
-                        dest_currency,
-                        amount,
-                    )
-                    try:
-                        # Get TTL from settings or use default
-                        provider_ttl = getattr(
-                            settings, "PROVIDER_CACHE_TTL", 60 * 60 * 24
-                        )  # 24 hours default
-                        jitter = random.randint(
-                            -getattr(settings, "JITTER_MAX_SECONDS", 60),
-                            getattr(settings, "JITTER_MAX_SECONDS", 60),
-                        )
-                        ttl = provider_ttl + jitter
-
-                        cache.set(cache_key, result, timeout=ttl)
-                        logger.info(f"Cached result for provider {provider_id} for {ttl} seconds")
-                    except Exception as cache_error:
-                        logger.warning(
-                            f"Error caching result for {provider_id}: {str(cache_error)}"
-                        )
-
-                if result.get("success", False):
-                    all_quotes.append(result)
-
-                return result
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "provider_id": provider_id,
-                    "error_message": f"Exception: {str(e)}",
-                    "source_currency": source_currency,
-                    "destination_currency": dest_currency,
-                    "source_country": source_country,
-                    "dest_country": dest_country,
-                    "amount": float(amount),
-                }
-
-                # Cache failures briefly to prevent hammering APIs that are down
-                if use_cache:
-                    try:
-                        cache_key = get_provider_quote_cache_key(
-                            provider_name,
-                            source_country,
-                            dest_country,
-                            source_currency,
-                            dest_currency,
-                            amount,
-                        )
-                        # Shorter TTL for failures
-                        cache.set(cache_key, error_result, timeout=300)  # 5 minutes
-                    except Exception:
-                        pass  # Ignore caching errors for failures
-
-                logger.exception(f"Error calling {provider_id}: {str(e)}")
-                return error_result
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(max_workers, len(providers_to_call))
-        ) as executor:
-            future_to_provider = {
-                executor.submit(call_provider, provider): provider for provider in providers_to_call
+                cls._call_provider(provider, *corridor, revalidate=True)
+            finally:
+                cache.delete(lease_key)
+
+        try:
+            get_provider_executor().submit(provider_name, revalidate)
+            logger.info(f"Serving stale quote for {provider_name}, refreshing {cache_key}")
+        except ProviderLaneFullError:
+            cache.delete(lease_key)
+
+    @classmethod
+    def _store_provider_result(
+        cls,
+        provider_name: str,
+        provider_id: str,
+        result: Quote,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+    ) -> None:
+        """
+        Cache a provider result; failures briefly, successes with a soft and a hard TTL.
+
+        Successes are served as they are for their soft TTL, then served stale while they
+        are refreshed in the background, until PROVIDER_CACHE_TTL. The soft TTL adapts to
+        the observed volatility of the provider's rate for the pair, falling back to
+        PROVIDER_CACHE_SOFT_TTL.
+        """
+        cache_key = get_provider_quote_cache_key(
+            provider_name,
+            source_country,
+            dest_country,
+            source_currency,
+            dest_currency,
+            amount,
+        )
+
+        if not result.get("success", False):
+            # Cache failures briefly to prevent hammering APIs that are down
+            try:
+                cache.set(cache_key, result, timeout=300)  # 5 minutes
+            except Exception:
+                pass  # Ignore caching errors for failures
+            return
+
+        try:
+            # Get TTL from settings or use default
+            provider_ttl = getattr(settings, "PROVIDER_CACHE_TTL", 60 * 60 * 24)  # 24 hours default
+            jitter = random.randint(
+                -getattr(settings, "JITTER_MAX_SECONDS", 60),
+                getattr(settings, "JITTER_MAX_SECONDS", 60),
+            )
+            ttl = provider_ttl + jitter
+            soft_ttl = rate_volatility.ttl(
+                provider_id,
+                source_currency,
+                dest_currency,
+                default=getattr(settings, "PROVIDER_CACHE_SOFT_TTL", provider_ttl),
+            )
+            soft_ttl += jitter
+            soft_ttl = min(soft_ttl, ttl)
+
+            cache.set(cache_key, (time.time() + soft_ttl, result), timeout=ttl)
+            logger.info(
+                f"Cached result for provider {provider_id} for {ttl} seconds, "
+                f"fresh for {soft_ttl}"
+            )
+        except Exception as cache_error:
+            logger.warning(f"Error caching result for {provider_id}: {str(cache_error)}")
+
+    @staticmethod
+    def _observe_rate(
+        provider_id: str, result: Quote, source_currency: str, dest_currency: str
+    ) -> None:
+        """Feed the rate of a fresh successful result to the volatility estimate."""
+        if result.get("success", False):
+            rate_volatility.observe(
+                provider_id, source_currency, dest_currency, result.get("exchange_rate")
+            )
+
+    @classmethod
+    def _provider_error_result(
+        cls,
+        provider_id: str,
+        error: Exception,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+    ) -> Quote:
+        """Build the standard failure result for a provider that raised."""
+        return Quote.from_dict(
+            {
+                "success": False,
+                "provider_id": provider_id,
+                "error_message": f"Exception: {str(error)}",
+                "source_currency": source_currency,
+                "destination_currency": dest_currency,
+                "source_country": source_country,
+                "dest_country": dest_country,
+                "amount": float(amount),
             }
+        )
 
-            for future in concurrent.futures.as_completed(future_to_provider, timeout=timeout):
-                provider = future_to_provider[future]
-                provider_name = provider.__class__.__name__
-                try:
-                    result = future.result()
-                    if result:
-                        if provider_name == "RemitGuruProvider":
-                            logger.info(f"RemitGuru result from future: {result}")
+    @classmethod
+    def _circuit_open_result(
+        cls,
+        provider_id: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+    ) -> Quote:
+        """Build the result reported for a provider skipped by its open circuit breaker."""
+        return Quote.from_dict(
+            {
+                "success": False,
+                "circuit_open": True,
+                "provider_id": provider_id,
+                "error_message": "Provider temporarily unavailable (circuit open)",
+                "source_currency": source_currency,
+                "destination_currency": dest_currency,
+                "source_country": source_country,
+                "dest_country": dest_country,
+                "amount": float(amount),
+            }
+        )
 
-                        all_provider_results.append(result)
-                        if result.get("success", False):
-                            all_quotes.append(result)
-                except Exception as exc:
-                    logger.error(f"Provider {provider_name} generated an exception: {exc}")
+    @classmethod
+    def _over_budget_result(
+        cls,
+        provider_name: str,
+        provider_id: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        use_cache: bool = True,
+    ) -> Quote:
+        """
+        Build the result for a call over the provider's outbound rate budget.
 
-        if filter_fn:
-            all_quotes = [q for q in all_quotes if filter_fn(q)]
+        The provider's cached quote is served if there is one, even when the caller
+        asked to bypass the cache; otherwise the call fails fast.
+        """
+        corridor = (source_country, dest_country, source_currency, dest_currency, amount)
+        if not use_cache:
+            cached_result = cls._get_cached_provider_result(provider_name, *corridor)
+            if cached_result:
+                logger.info(f"Serving cached quote for rate limited provider {provider_id}")
+                return cached_result
+        return Quote.from_dict(
+            {
+                "success": False,
+                "rate_limited": True,
+                "provider_id": provider_id,
+                "error_message": "Provider temporarily unavailable (rate limit reached)",
+                "source_currency": source_currency,
+                "destination_currency": dest_currency,
+                "source_country": source_country,
+                "dest_country": dest_country,
+                "amount": float(amount),
+            }
+        )
 
-        if max_delivery_time_minutes is not None:
-            all_quotes = [
-                q
-                for q in all_quotes
-                if q.get("delivery_time_minutes", float("inf")) <= max_delivery_time_minutes
-            ]
+    @classmethod
+    def _is_slow_call(cls, provider_name: str, started: float) -> bool:
+        """Whether a call that started at started (monotonic) counts as a failure."""
+        threshold = provider_breakers.get_config(provider_name)["slow_call_seconds"]
+        return time.monotonic() - started >= threshold
 
-        if max_fee is not None:
-            all_quotes = [q for q in all_quotes if q.get("fee", float("inf")) <= max_fee]
-
-        if all_quotes and sort_by:
-            if sort_by == "best_rate":
-                all_quotes.sort(key=lambda q: (-(q.get("exchange_rate", 0) or 0)))
-            elif sort_by == "lowest_fee":
-                all_quotes.sort(key=lambda q: (q.get("fee", float("inf")) or float("inf")))
-            elif sort_by == "fastest_time":
-                all_quotes.sort(
-                    key=lambda q: (q.get("delivery_time_minutes", float("inf")) or float("inf"))
+    @classmethod
+    def _call_succeeded(cls, provider_name: str, outcome: str, started: float) -> bool:
+        """
+        Whether a call that returned counts as a success for the circuit breaker.
+
+        Error results count as failures like calls that raised, so a half-open probe
+        answered with one doesn't close the breaker; an unsupported corridor doesn't.
+        """
+        if outcome in (OUTCOME_ERROR, OUTCOME_TIMEOUT):
+            return False
+        return not cls._is_slow_call(provider_name, started)
+
+    @classmethod
+    def _timed_out_result(
+        cls,
+        provider,
+        timeout: float,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+    ) -> Quote:
+        """Build the result reported for a provider that missed the request deadline."""
+        provider_id = getattr(provider, "provider_id", provider.__class__.__name__)
+        provider_metrics.record_outcome(
+            provider_id, corridor_label(source_country, dest_country), OUTCOME_TIMEOUT
+        )
+        return Quote.from_dict(
+            {
+                "success": False,
+                "timed_out": True,
+                "provider_id": provider_id,
+                "error_message": f"Provider did not respond within {timeout} seconds",
+                "source_currency": source_currency,
+                "destination_currency": dest_currency,
+                "source_country": source_country,
+                "dest_country": dest_country,
+                "amount": float(amount),
+            }
+        )
+
+    @classmethod
+    def _call_provider(
+        cls,
+        provider,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        use_cache: bool = True,
+        revalidate: bool = False,
+    ) -> Quote:
+        """
+        Fetch one provider's quote, going through the provider cache when enabled.
+
+        revalidate refreshes a stale cache entry: the cache is not read, and only a
+        successful quote replaces the entry.
+        """
+        provider_name = provider.__class__.__name__
+        provider_id = getattr(provider, "provider_id", provider_name)
+        corridor = (source_country, dest_country, source_currency, dest_currency, amount)
+        metrics_corridor = corridor_label(source_country, dest_country)
+        use_cache = use_cache or revalidate
+
+        # Check cache first if caching is enabled
+        if use_cache and not revalidate:
+            cached_result = cls._get_cached_provider_result(
+                provider_name, *corridor, provider=provider
+            )
+            if cached_result:
+                logger.info(f"Cache hit for provider {provider_id}")
+                provider_metrics.record_outcome(provider_id, metrics_corridor, OUTCOME_CACHE_HIT)
+                return cached_result
+
+        if not provider_governor.acquire(provider_name):
+            result = cls._over_budget_result(
+                provider_name, provider_id, *corridor, use_cache=use_cache
+            )
+            provider_metrics.record_outcome(
+                provider_id,
+                metrics_corridor,
+                OUTCOME_CACHE_HIT if result.get("success", False) else OUTCOME_SKIPPED,
+            )
+            return result
+
+        permit = provider_breakers.acquire(provider_name)
+        if permit is None:
+            provider_metrics.record_outcome(provider_id, metrics_corridor, OUTCOME_SKIPPED)
+            return cls._circuit_open_result(provider_id, *corridor)
+
+        started = time.monotonic()
+        call_stats = None
+        try:
+            provider_params = cls._build_provider_params(provider_name, *corridor)
+
+            logger.info(f"Calling {provider_id}.get_quote(...) with {provider_params}")
+            # Each call gets its own pooled instance, never one another thread is using
+            with track_call() as call_stats, cls._lease_provider(provider) as instance:
+                result = instance.get_quote(**provider_params)
+            latency_tracker.record(provider_name, time.monotonic() - started)
+
+            result = Quote.from_dict(result, provider_id=provider_id)
+
+        except Exception as e:
+            logger.exception(f"Error calling {provider_id}: {str(e)}")
+            provider_metrics.record_call(
+                provider_id,
+                metrics_corridor,
+                classify_error(e),
+                time.monotonic() - started,
+                call_stats,
+            )
+            provider_breakers.record(provider_name, permit, success=False)
+            provider_governor.record_error(provider_name, e)
+            result = cls._provider_error_result(provider_id, e, *corridor)
+            # A failed refresh keeps serving the stale quote rather than the failure
+            if use_cache and not revalidate:
+                cls._store_provider_result(provider_name, provider_id, result, *corridor)
+            return result
+
+        outcome = classify_outcome(result)
+        provider_metrics.record_call(
+            provider_id, metrics_corridor, outcome, time.monotonic() - started, call_stats
+        )
+        provider_breakers.record(
+            provider_name, permit, success=cls._call_succeeded(provider_name, outcome, started)
+        )
+        provider_governor.record(provider_name, result)
+        unsupported_corridors.record(provider_name, result, *corridor[:4])
+        cls._observe_rate(provider_id, result, *corridor[2:4])
+
+        # Store successful results in cache with TTL and jitter
+        if use_cache and result.get("success", False):
+            cls._store_provider_result(provider_name, provider_id, result, *corridor)
+
+        return result
+
+    @classmethod
+    def _call_provider_for_amounts(
+        cls,
+        provider,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amounts: List[Decimal],
+        use_cache: bool = True,
+    ) -> List[Quote]:
+        """
+        Fetch one provider's quotes for several amounts with one get_quotes_for_amounts call.
+
+        Amounts already in the provider cache are served from it; the rest are quoted
+        together under a single circuit breaker permit and pooled instance. Results are
+        returned in the order of amounts.
+        """
+        provider_name = provider.__class__.__name__
+        provider_id = getattr(provider, "provider_id", provider_name)
+        corridor = (source_country, dest_country, source_currency, dest_currency)
+        metrics_corridor = corridor_label(source_country, dest_country)
+
+        results: List[Optional[Quote]] = [None] * len(amounts)
+        if use_cache:
+            for i, amount in enumerate(amounts):
+                results[i] = cls._get_cached_provider_result(
+                    provider_name, *corridor, amount, provider=provider
                 )
-            elif sort_by == "best_value":
+        missing = [i for i, result in enumerate(results) if not result]
+        if len(missing) < len(amounts):
+            provider_metrics.record_outcome(
+                provider_id, metrics_corridor, OUTCOME_CACHE_HIT, len(amounts) - len(missing)
+            )
+        if not missing:
+            logger.info(f"Cache hit for provider {provider_id} for every amount")
+            return results
 
-                def value_score(quote):
-                    rate_score = quote.get("exchange_rate", 0) or 0
-                    fee_score = 100 - (quote.get("fee", 0) or 0) * 10
-                    time_score = 100 - min(100, ((quote.get("delivery_time_minutes", 0) or 0) / 30))
-                    return rate_score * 0.5 + fee_score * 0.3 + time_score * 0.2
+        # One batched call takes one token of the provider's outbound budget
+        if not provider_governor.acquire(provider_name):
+            for i in missing:
+                results[i] = cls._over_budget_result(
+                    provider_name, provider_id, *corridor, amounts[i], use_cache=use_cache
+                )
+                provider_metrics.record_outcome(
+                    provider_id,
+                    metrics_corridor,
+                    OUTCOME_CACHE_HIT if results[i].get("success", False) else OUTCOME_SKIPPED,
+                )
+            return results
 
-                all_quotes.sort(key=value_score, reverse=True)
+        permit = provider_breakers.acquire(provider_name)
+        if permit is None:
+            provider_metrics.record_outcome(
+                provider_id, metrics_corridor, OUTCOME_SKIPPED, len(missing)
+            )
+            for i in missing:
+                results[i] = cls._circuit_open_result(provider_id, *corridor, amounts[i])
+            return results
 
-        logger.info(f"Final quotes count: {len(all_quotes)}")
-        for i, quote in enumerate(all_quotes):
-            logger.info(f"Quote {i+1}: {quote.get('provider_id')} - {quote.get('success')}")
+        started = time.monotonic()
+        call_stats = None
+        missing_amounts = [amounts[i] for i in missing]
+        try:
+            provider_params = {
+                name: value
+                for name, value in cls._build_provider_params(
+                    provider_name, *corridor, _BATCH_AMOUNT
+                ).items()
+                if value is not _BATCH_AMOUNT
+            }
 
-        end_time = time.time()
-        execution_time = end_time - start_time
+            logger.info(
+                f"Calling {provider_id}.get_quotes_for_amounts({missing_amounts}) "
+                f"with {provider_params}"
+            )
+            with track_call() as call_stats, cls._lease_provider(provider) as instance:
+                fresh = instance.get_quotes_for_amounts(missing_amounts, **provider_params)
+
+        except Exception as e:
+            logger.exception(f"Error calling {provider_id}: {str(e)}")
+            provider_metrics.record_call(
+                provider_id,
+                metrics_corridor,
+                classify_error(e),
+                time.monotonic() - started,
+                call_stats,
+            )
+            provider_breakers.record(provider_name, permit, success=False)
+            provider_governor.record_error(provider_name, e)
+            for i in missing:
+                results[i] = cls._provider_error_result(provider_id, e, *corridor, amounts[i])
+                if use_cache:
+                    cls._store_provider_result(
+                        provider_name, provider_id, results[i], *corridor, amounts[i]
+                    )
+            return results
+
+        seconds = time.monotonic() - started
+        # Whether the corridor is served doesn't depend on the amount
+        verdict = next((r for r in fresh if r.get("success", False)), fresh[0]) if fresh else None
+        outcome = classify_outcome(verdict)
+        provider_breakers.record(
+            provider_name, permit, success=cls._call_succeeded(provider_name, outcome, started)
+        )
+        provider_governor.record_batch(provider_name, fresh)
+        provider_metrics.record_call(provider_id, metrics_corridor, outcome, seconds, call_stats)
+        for i, result in zip(missing, fresh):
+            result = Quote.from_dict(result, provider_id=provider_id)
+            if use_cache and result.get("success", False):
+                cls._store_provider_result(
+                    provider_name, provider_id, result, *corridor, amounts[i]
+                )
+            results[i] = result
+
+        if verdict is not None:
+            unsupported_corridors.record(provider_name, verdict, *corridor)
+            cls._observe_rate(provider_id, verdict, *corridor[2:4])
+
+        return results
+
+    @classmethod
+    def _submit_provider_call(
+        cls,
+        provider,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        use_cache: bool = True,
+    ) -> concurrent.futures.Future:
+        """
+        Schedule a blocking provider call on that provider's lane of the shared executor.
+
+        If the lane is saturated (e.g. the provider is hanging) the call is not queued;
+        the returned future is already resolved with a failure result instead. Calls to
+        providers configured for hedging go through _hedge_provider_call.
+        """
+        corridor = (source_country, dest_country, source_currency, dest_currency, amount)
+        provider_name = provider.__class__.__name__
+        try:
+            future = get_provider_executor().submit(
+                provider_name, cls._call_provider, provider, *corridor, use_cache=use_cache
+            )
+        except ProviderLaneFullError as e:
+            logger.warning(f"Skipping {provider_name}: {e.message} {e.details}")
+            # A saturated lane means the provider isn't keeping up; let the breaker know
+            provider_breakers.record(provider_name, STATE_CLOSED, success=False)
+            future = concurrent.futures.Future()
+            future.set_result(
+                cls._provider_error_result(
+                    getattr(provider, "provider_id", provider_name), e, *corridor
+                )
+            )
+            return future
+
+        hedge_config = get_hedge_config(provider_name)
+        if hedge_config:
+            return cls._hedge_provider_call(provider, future, hedge_config, corridor, use_cache)
+        return future
+
+    @classmethod
+    def _submit_amounts_call(
+        cls,
+        provider,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amounts: List[Decimal],
+        use_cache: bool = True,
+    ) -> concurrent.futures.Future:
+        """
+        Schedule _call_provider_for_amounts on the provider's lane.
+
+        Like _submit_provider_call, a saturated lane resolves the future at once with
+        one failure result per amount.
+        """
+        corridor = (source_country, dest_country, source_currency, dest_currency)
+        provider_name = provider.__class__.__name__
+        try:
+            return get_provider_executor().submit(
+                provider_name,
+                cls._call_provider_for_amounts,
+                provider,
+                *corridor,
+                amounts,
+                use_cache=use_cache,
+            )
+        except ProviderLaneFullError as e:
+            logger.warning(f"Skipping {provider_name}: {e.message} {e.details}")
+            provider_breakers.record(provider_name, STATE_CLOSED, success=False)
+            provider_id = getattr(provider, "provider_id", provider_name)
+            future = concurrent.futures.Future()
+            future.set_result(
+                [cls._provider_error_result(provider_id, e, *corridor, a) for a in amounts]
+            )
+            return future
+
+    @classmethod
+    def _hedge_provider_call(
+        cls,
+        provider,
+        primary: concurrent.futures.Future,
+        hedge_config: Dict[str, Any],
+        corridor: Tuple,
+        use_cache: bool,
+    ) -> concurrent.futures.Future:
+        """
+        Fire a second attempt if the primary call outlives the provider's usual latency.
+
+        The hedge delay is the configured percentile of the provider's recent
+        latencies. The hedge leases its own instance from the provider's pool, since
+        the primary attempt still holds one, and only fires if the global hedge budget
+        allows it. The first attempt to finish
+        resolves the returned future; cancelling that future cancels both attempts.
+        """
+        provider_name = provider.__class__.__name__
+        hedge_budget.record_call()
+        delay = latency_tracker.percentile(
+            provider_name, hedge_config["percentile"], hedge_config["min_samples"]
+        )
+        if delay is None:
+            return primary
+
+        outcome = concurrent.futures.Future()
+        lock = threading.Lock()
+        attempts = [primary]
+
+        def settle(attempt, hedged=False):
+            if attempt.cancelled():
+                return
+            with lock:
+                if outcome.done():
+                    return
+                try:
+                    result = attempt.result()
+                except Exception as exc:
+                    outcome.set_exception(exc)
+                    return
+                if hedged:
+                    logger.info(f"Hedged attempt won for {provider_name}")
+                    result = result.replace(hedged=True)
+                outcome.set_result(result)
+
+        def fire_hedge():
+            if primary.done() or outcome.done() or not hedge_budget.try_acquire():
+                return
+            try:
+                hedge = get_provider_executor().submit(
+                    provider_name, cls._call_provider, provider, *corridor, use_cache=use_cache
+                )
+            except ProviderLaneFullError:
+                return
+            logger.info(f"{provider_name} slower than {delay:.2f}s, firing hedged attempt")
+            attempts.append(hedge)
+            hedge.add_done_callback(lambda f: settle(f, hedged=True))
+
+        timer = threading.Timer(delay, fire_hedge)
+        timer.daemon = True
+        primary.add_done_callback(lambda f: timer.cancel())
+        primary.add_done_callback(settle)
+
+        def cancel_attempts(f):
+            if f.cancelled():
+                timer.cancel()
+                for attempt in attempts:
+                    attempt.cancel()
+
+        outcome.add_done_callback(cancel_attempts)
+        timer.start()
+        return outcome
+
+    @classmethod
+    async def _acall_provider(
+        cls,
+        provider,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        use_cache: bool = True,
+    ) -> Quote:
+        """
+        Fetch one provider's quote on the running event loop.
+
+        Providers that implement a native ``aget_quote`` coroutine are awaited directly.
+        Everything else still blocks on ``requests`` and runs on the provider's lane of
+        the shared provider executor; cache reads and writes go through the blocking pool.
+        """
+        loop = asyncio.get_running_loop()
+        executor = get_blocking_executor()
+        corridor = (source_country, dest_country, source_currency, dest_currency, amount)
+
+        native_quote = getattr(provider, "aget_quote", None)
+        if not asyncio.iscoroutinefunction(native_quote):
+            return await asyncio.wrap_future(
+                cls._submit_provider_call(provider, *corridor, use_cache=use_cache)
+            )
+
+        provider_name = provider.__class__.__name__
+        provider_id = getattr(provider, "provider_id", provider_name)
+        metrics_corridor = corridor_label(source_country, dest_country)
+
+        if use_cache:
+            cached_result = await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    cls._get_cached_provider_result, provider_name, *corridor, provider=provider
+                ),
+            )
+            if cached_result:
+                logger.info(f"Cache hit for provider {provider_id}")
+                provider_metrics.record_outcome(provider_id, metrics_corridor, OUTCOME_CACHE_HIT)
+                return cached_result
+
+        within_budget = await loop.run_in_executor(
+            executor, functools.partial(provider_governor.acquire, provider_name)
+        )
+        if not within_budget:
+            result = await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    cls._over_budget_result,
+                    provider_name,
+                    provider_id,
+                    *corridor,
+                    use_cache=use_cache,
+                ),
+            )
+            provider_metrics.record_outcome(
+                provider_id,
+                metrics_corridor,
+                OUTCOME_CACHE_HIT if result.get("success", False) else OUTCOME_SKIPPED,
+            )
+            return result
+
+        permit = await loop.run_in_executor(
+            executor, functools.partial(provider_breakers.acquire, provider_name)
+        )
+        if permit is None:
+            provider_metrics.record_outcome(provider_id, metrics_corridor, OUTCOME_SKIPPED)
+            return cls._circuit_open_result(provider_id, *corridor)
+
+        started = time.monotonic()
+        call_stats = None
+        try:
+            provider_params = cls._build_provider_params(provider_name, *corridor)
+
+            logger.info(f"Awaiting {provider_id}.aget_quote(...) with {provider_params}")
+            # Like the blocking path, the call gets its own pooled instance
+            with track_call() as call_stats:
+                async with cls._alease_provider(provider) as instance:
+                    result = await instance.aget_quote(**provider_params)
+
+            result = Quote.from_dict(result, provider_id=provider_id)
+
+            outcome = classify_outcome(result)
+            call_succeeded = cls._call_succeeded(provider_name, outcome, started)
+            await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    unsupported_corridors.record, provider_name, result, *corridor[:4]
+                ),
+            )
+            await loop.run_in_executor(
+                executor, functools.partial(provider_governor.record, provider_name, result)
+            )
+            await loop.run_in_executor(
+                executor,
+                functools.partial(cls._observe_rate, provider_id, result, *corridor[2:4]),
+            )
+            cache_result = result.get("success", False)
+
+        except asyncio.CancelledError:
+            # Deadline reached; the call neither succeeded nor failed
+            raise
+        except Exception as e:
+            logger.exception(f"Error calling {provider_id}: {str(e)}")
+            provider_governor.record_error(provider_name, e)
+            result = cls._provider_error_result(provider_id, e, *corridor)
+            call_succeeded = False
+            cache_result = True
+            outcome = classify_error(e)
+
+        provider_metrics.record_call(
+            provider_id, metrics_corridor, outcome, time.monotonic() - started, call_stats
+        )
+        await loop.run_in_executor(
+            executor,
+            functools.partial(provider_breakers.record, provider_name, permit, call_succeeded),
+        )
+
+        if use_cache and cache_result:
+            await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    cls._store_provider_result, provider_name, provider_id, result, *corridor
+                ),
+            )
+
+        return result
+
+    @classmethod
+    def _filter_criteria(
+        cls, max_delivery_time_minutes: Optional[int], max_fee: Optional[float]
+    ) -> List[Tuple[str, Any]]:
+        """The explicit filter arguments as QuoteTable criteria."""
+        criteria = []
+        if max_delivery_time_minutes is not None:
+            criteria.append(("max_delivery_time", max_delivery_time_minutes))
+        if max_fee is not None:
+            criteria.append(("max_fee", max_fee))
+        return criteria
+
+    @classmethod
+    def _passes_filters(
+        cls,
+        quote: Quote,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]],
+        max_delivery_time_minutes: Optional[int],
+        max_fee: Optional[float],
+    ) -> bool:
+        """Check a single successful quote against the caller's filters."""
+        return bool(
+            select_quotes(
+                [quote],
+                criteria=cls._filter_criteria(max_delivery_time_minutes, max_fee),
+                filter_fn=filter_fn,
+            )
+        )
+
+    @classmethod
+    def _finalize_quotes(
+        cls,
+        all_quotes: List[Quote],
+        sort_by: Optional[str],
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]],
+        max_delivery_time_minutes: Optional[int],
+        max_fee: Optional[float],
+    ) -> List[Quote]:
+        """Apply the requested filters and sort order to the successful quotes."""
+        all_quotes = select_quotes(
+            all_quotes,
+            sort_by=sort_by,
+            criteria=cls._filter_criteria(max_delivery_time_minutes, max_fee),
+            filter_fn=filter_fn,
+        )
+
+        logger.info(f"Final quotes count: {len(all_quotes)}")
+        for i, quote in enumerate(all_quotes):
+            logger.info(f"Quote {i+1}: {quote.get('provider_id')} - {quote.get('success')}")
+
+        return all_quotes
+
+    @classmethod
+    def get_all_quotes(
+        cls,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        sort_by: Optional[str] = "best_rate",
+        exclude_providers: Optional[List[str]] = None,
+        max_workers: int = 10,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_delivery_time_minutes: Optional[int] = None,
+        max_fee: Optional[float] = None,
+        use_cache: bool = True,  # New parameter to control caching
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch quotes from all providers in parallel and return them filtered and sorted.
+
+        timeout is an overall deadline in seconds for the whole fan-out (defaults to the
+        configured aggregator timeout). Quotes received before the deadline are returned;
+        providers still pending are reported in all_results with timed_out set and listed
+        in timed_out_providers.
+
+        Provider calls run on the process-wide provider executor, one bounded lane per
+        provider, so a hung provider cannot starve the others. max_workers is accepted
+        for backwards compatibility; lane sizes are configured in settings.
+        """
+        providers_to_call = cls._get_providers_to_call(
+            source_country, dest_country, source_currency, dest_currency, exclude_providers
+        )
+
+        logger.info(
+            f"Aggregator: Starting quotes for {amount:.2f} {source_currency} -> {dest_currency}, "
+            f"corridor {source_country}->{dest_country}"
+        )
+        logger.info(f"Total providers to call: {len(providers_to_call)}")
+
+        start_time = time.time()
+        all_quotes = []
+        all_provider_results = []
+        timed_out_providers = []
+        if timeout is None:
+            timeout = cls._get_timeout()
+
+        future_to_provider = {
+            cls._submit_provider_call(
+                provider,
+                source_country,
+                dest_country,
+                source_currency,
+                dest_currency,
+                amount,
+                use_cache,
+            ): provider
+            for provider in providers_to_call
+        }
+
+        try:
+            for future in concurrent.futures.as_completed(future_to_provider, timeout=timeout):
+                provider = future_to_provider[future]
+                provider_name = provider.__class__.__name__
+                try:
+                    result = future.result()
+                    if result:
+                        if provider_name == "RemitGuruProvider":
+                            logger.info(f"RemitGuru result from future: {result}")
+
+                        all_provider_results.append(result)
+                        if result.get("success", False):
+                            all_quotes.append(result)
+                except Exception as exc:
+                    logger.error(f"Provider {provider_name} generated an exception: {exc}")
+        except concurrent.futures.TimeoutError:
+            for future, provider in future_to_provider.items():
+                if future.done():
+                    continue
+                timed_out_result = cls._timed_out_result(
+                    provider,
+                    timeout,
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount,
+                )
+                all_provider_results.append(timed_out_result)
+                timed_out_providers.append(timed_out_result["provider_id"])
+            logger.warning(
+                f"Deadline of {timeout}s reached, returning partial results without: "
+                f"{timed_out_providers}"
+            )
+        finally:
+            # Don't wait for stragglers: queued calls are cancelled, running ones finish
+            # in the background on their own lane and only fill the provider cache.
+            for future in future_to_provider:
+                future.cancel()
+
+        all_quotes = cls._finalize_quotes(
+            all_quotes, sort_by, filter_fn, max_delivery_time_minutes, max_fee
+        )
+
+        end_time = time.time()
+        execution_time = end_time - start_time
+
+        return {
+            "success": len(all_quotes) > 0,
+            "results": all_quotes,
+            "all_results": all_provider_results,
+            "execution_time": execution_time,
+            "providers_called": len(providers_to_call),
+            "successful_providers": len(all_quotes),
+            "timed_out_providers": timed_out_providers,
+            "timestamp": datetime.datetime.now().isoformat(),
+        }
+
+    @classmethod
+    def get_quotes_for_amounts(
+        cls,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amounts: List[Decimal],
+        sort_by: Optional[str] = "best_rate",
+        exclude_providers: Optional[List[str]] = None,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_delivery_time_minutes: Optional[int] = None,
+        max_fee: Optional[float] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch quotes for several amounts of one corridor in a single fan-out.
+
+        Providers implementing ``get_quotes_for_amounts`` (pricing that doesn't depend on
+        the amount, e.g. Pangea's Fees & FX or Rewire's pricing tiers) are called once
+        for all amounts. Every other provider gets one call per amount, all submitted
+        at once on its lane. Duplicate amounts are quoted once.
+
+        Returns the fields of get_all_quotes with one entry per amount: results[i] and
+        all_results[i] belong to amounts[i], and matrix maps each provider_id to its
+        result for every amount (None where the provider timed out).
+        """
+        amounts = list(dict.fromkeys(Decimal(str(amount)) for amount in amounts))
+        corridor = (source_country, dest_country, source_currency, dest_currency)
+        providers_to_call = cls._get_providers_to_call(*corridor, exclude_providers)
+
+        logger.info(
+            f"Aggregator: Starting quotes for amounts {[float(a) for a in amounts]} "
+            f"{source_currency} -> {dest_currency}, corridor {source_country}->{dest_country}"
+        )
+        logger.info(f"Total providers to call: {len(providers_to_call)}")
+
+        start_time = time.time()
+        if timeout is None:
+            timeout = cls._get_timeout()
+
+        # future -> (provider, indexes of the amounts it answers)
+        future_to_call = {}
+        for provider in providers_to_call:
+            if callable(getattr(provider, "get_quotes_for_amounts", None)):
+                future = cls._submit_amounts_call(provider, *corridor, amounts, use_cache)
+                future_to_call[future] = (provider, list(range(len(amounts))))
+            else:
+                for i, amount in enumerate(amounts):
+                    future = cls._submit_provider_call(provider, *corridor, amount, use_cache)
+                    future_to_call[future] = (provider, [i])
+
+        # id(provider) -> result per amount
+        rows: Dict[int, List[Optional[Quote]]] = {
+            id(provider): [None] * len(amounts) for provider in providers_to_call
+        }
+        timed_out_providers = []
+        all_provider_results: List[List[Quote]] = [[] for _ in amounts]
+
+        def place(provider, indexes, results):
+            row = rows[id(provider)]
+            for i, result in zip(indexes, results):
+                if result:
+                    row[i] = result
+                    all_provider_results[i].append(result)
+
+        try:
+            for future in concurrent.futures.as_completed(future_to_call, timeout=timeout):
+                provider, indexes = future_to_call[future]
+                try:
+                    result = future.result()
+                    place(provider, indexes, result if isinstance(result, list) else [result])
+                except Exception as exc:
+                    logger.error(
+                        f"Provider {provider.__class__.__name__} generated an exception: {exc}"
+                    )
+        except concurrent.futures.TimeoutError:
+            for future, (provider, indexes) in future_to_call.items():
+                if future.done():
+                    continue
+                place(
+                    provider,
+                    indexes,
+                    [
+                        cls._timed_out_result(provider, timeout, *corridor, amounts[i])
+                        for i in indexes
+                    ],
+                )
+                provider_id = getattr(provider, "provider_id", provider.__class__.__name__)
+                if provider_id not in timed_out_providers:
+                    timed_out_providers.append(provider_id)
+            logger.warning(
+                f"Deadline of {timeout}s reached, returning partial results without: "
+                f"{timed_out_providers}"
+            )
+        finally:
+            for future in future_to_call:
+                future.cancel()
+
+        results = [
+            cls._finalize_quotes(
+                [r for r in amount_results if r.get("success", False)],
+                sort_by,
+                filter_fn,
+                max_delivery_time_minutes,
+                max_fee,
+            )
+            for amount_results in all_provider_results
+        ]
+
+        matrix = {}
+        for provider in providers_to_call:
+            row = rows[id(provider)]
+            provider_id = next(
+                (r["provider_id"] for r in row if r and r.get("provider_id")),
+                getattr(provider, "provider_id", provider.__class__.__name__),
+            )
+            matrix[provider_id] = row
+
+        return {
+            "success": any(results),
+            "amounts": [float(amount) for amount in amounts],
+            "results": results,
+            "all_results": all_provider_results,
+            "matrix": matrix,
+            "execution_time": time.time() - start_time,
+            "providers_called": len(providers_to_call),
+            "provider_calls": len(future_to_call),
+            "successful_providers": [len(amount_results) for amount_results in results],
+            "timed_out_providers": timed_out_providers,
+            "timestamp": datetime.datetime.now().isoformat(),
+        }
+
+    @classmethod
+    def _bulk_provider_limit(cls, provider_name: str) -> int:
+        """Calls a bulk fan-out runs at once for a provider: one per worker of its lane."""
+        return get_provider_executor().get_lane(provider_name).size
+
+    @classmethod
+    def get_quotes_bulk(
+        cls,
+        items: List[Dict[str, Any]],
+        sort_by: Optional[str] = "best_rate",
+        exclude_providers: Optional[List[str]] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch quotes for many (corridor, amount) items in one scheduled fan-out.
+
+        Each item is a dict with source_country, dest_country, source_currency,
+        dest_currency, amount and an optional id (defaults to its position). Identical
+        provider calls are made once: items with the same corridor and amount share
+        every call, and providers implementing ``get_quotes_for_amounts`` get a single
+        call per corridor for all of its amounts.
+
+        Calls run through a FairScheduler: at most max_concurrency at once
+        (AGGREGATOR_BULK_MAX_CONCURRENCY), admitted round-robin across providers and
+        never more per provider than its lane has workers. timeout
+        (AGGREGATOR_BULK_TIMEOUT) is the deadline for the whole sweep; calls unfinished
+        by then are reported with timed_out set.
+
+        Returns:
+            items maps each item id to the fields of get_all_quotes for that item.
+            provider_calls counts the calls made, requested_provider_calls the calls
+            the same items would have made as separate comparisons.
+        """
+        start_time = time.time()
+        if timeout is None:
+            timeout = getattr(settings, "AGGREGATOR_BULK_TIMEOUT", 60)
+        if max_concurrency is None:
+            max_concurrency = getattr(settings, "AGGREGATOR_BULK_MAX_CONCURRENCY", 32)
+
+        # corridor -> distinct amounts, in the order items asked for them
+        corridor_amounts: Dict[Tuple[str, str, str, str], List[Decimal]] = {}
+        item_keys = []
+        for position, item in enumerate(items):
+            corridor = tuple(
+                item[field].upper()
+                for field in ("source_country", "dest_country", "source_currency", "dest_currency")
+            )
+            amount = Decimal(str(item["amount"]))
+            amounts = corridor_amounts.setdefault(corridor, [])
+            if amount not in amounts:
+                amounts.append(amount)
+            item_keys.append((str(item.get("id", position)), corridor, amount))
+
+        logger.info(
+            f"Aggregator: Starting bulk quotes for {len(items)} items "
+            f"over {len(corridor_amounts)} corridors"
+        )
+
+        scheduler = FairScheduler(max_concurrency, cls._bulk_provider_limit)
+        # call key -> (provider, corridor, amounts it answers)
+        calls: Dict[int, Tuple[Any, Tuple[str, str, str, str], List[Decimal]]] = {}
+        providers_per_corridor = {}
+        for corridor, amounts in corridor_amounts.items():
+            providers = cls._get_providers_to_call(*corridor, exclude_providers)
+            providers_per_corridor[corridor] = len(providers)
+            for provider in providers:
+                provider_name = provider.__class__.__name__
+                if callable(getattr(provider, "get_quotes_for_amounts", None)):
+                    key = len(calls)
+                    calls[key] = (provider, corridor, amounts)
+                    submit = functools.partial(
+                        cls._submit_amounts_call, provider, *corridor, amounts, use_cache
+                    )
+                    scheduler.add(provider_name, key, submit)
+                    continue
+                for amount in amounts:
+                    key = len(calls)
+                    calls[key] = (provider, corridor, [amount])
+                    submit = functools.partial(
+                        cls._submit_provider_call, provider, *corridor, amount, use_cache
+                    )
+                    scheduler.add(provider_name, key, submit)
+
+        logger.info(f"Total provider calls to make: {len(calls)}")
+        call_results, unfinished = scheduler.run(timeout)
+
+        # (corridor, amount) -> every provider result, and the providers that timed out
+        all_provider_results = {
+            (corridor, amount): []
+            for corridor, amounts in corridor_amounts.items()
+            for amount in amounts
+        }
+        timed_out_providers = {key: [] for key in all_provider_results}
+        unfinished = set(unfinished)
+        for key, (provider, corridor, amounts) in calls.items():
+            if key in unfinished:
+                results = [
+                    cls._timed_out_result(provider, timeout, *corridor, amount)
+                    for amount in amounts
+                ]
+                for amount, result in zip(amounts, results):
+                    timed_out_providers[(corridor, amount)].append(result["provider_id"])
+            else:
+                result = call_results.get(key)
+                if result is None:
+                    continue
+                if isinstance(result, Exception):
+                    # The call raised past _call_provider; report it like any failed call
+                    provider_id = getattr(provider, "provider_id", provider.__class__.__name__)
+                    logger.error(
+                        f"Bulk call to {provider_id} for {corridor} raised: {str(result)}"
+                    )
+                    results = [
+                        cls._provider_error_result(provider_id, result, *corridor, amount)
+                        for amount in amounts
+                    ]
+                else:
+                    results = result if isinstance(result, list) else [result]
+            for amount, result in zip(amounts, results):
+                if result:
+                    all_provider_results[(corridor, amount)].append(result)
+
+        quotes = {
+            key: cls._finalize_quotes(
+                [r for r in results if r.get("success", False)], sort_by, None, None, None
+            )
+            for key, results in all_provider_results.items()
+        }
+
+        item_results = {}
+        for item_id, corridor, amount in item_keys:
+            source_country, dest_country, source_currency, dest_currency = corridor
+            item_results[item_id] = {
+                "success": len(quotes[(corridor, amount)]) > 0,
+                "source_country": source_country,
+                "dest_country": dest_country,
+                "source_currency": source_currency,
+                "dest_currency": dest_currency,
+                "amount": float(amount),
+                "results": quotes[(corridor, amount)],
+                "all_results": all_provider_results[(corridor, amount)],
+                "providers_called": providers_per_corridor[corridor],
+                "successful_providers": len(quotes[(corridor, amount)]),
+                "timed_out_providers": timed_out_providers[(corridor, amount)],
+            }
+
+        execution_time = time.time() - start_time
+        logger.info(
+            f"Bulk quotes done in {execution_time:.2f}s: {len(calls)} provider calls for "
+            f"{len(items)} items (peak {scheduler.peak_in_flight} in flight)"
+        )
+        return {
+            "success": any(item["success"] for item in item_results.values()),
+            "items": item_results,
+            "execution_time": execution_time,
+            "corridors": len(corridor_amounts),
+            "provider_calls": len(calls),
+            "requested_provider_calls": sum(
+                providers_per_corridor[corridor] for _, corridor, _ in item_keys
+            ),
+            "timed_out_calls": len(unfinished),
+            "timestamp": datetime.datetime.now().isoformat(),
+        }
+
+    @classmethod
+    async def aget_all_quotes(
+        cls,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        sort_by: Optional[str] = "best_rate",
+        exclude_providers: Optional[List[str]] = None,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_delivery_time_minutes: Optional[int] = None,
+        max_fee: Optional[float] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous counterpart of get_all_quotes.
+
+        Every provider call is scheduled on the running event loop, for callers that
+        already run one; the HTTP views are WSGI and still use get_all_quotes and
+        iter_quotes. Providers without a native ``aget_quote`` share the process-wide
+        blocking pool instead of a fresh ThreadPoolExecutor per call. Providers still
+        pending when the deadline expires are cancelled and reported as timed out. The
+        return value has the same shape as get_all_quotes.
+        """
+        providers_to_call = cls._get_providers_to_call(
+            source_country, dest_country, source_currency, dest_currency, exclude_providers
+        )
+
+        logger.info(
+            f"Aggregator (async): Starting quotes for {amount:.2f} {source_currency} -> "
+            f"{dest_currency}, corridor {source_country}->{dest_country}"
+        )
+        logger.info(f"Total providers to call: {len(providers_to_call)}")
+
+        start_time = time.time()
+        all_quotes = []
+        all_provider_results = []
+        timed_out_providers = []
+        if timeout is None:
+            timeout = cls._get_timeout()
+
+        task_to_provider = {
+            asyncio.ensure_future(
+                cls._acall_provider(
+                    provider,
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount,
+                    use_cache,
+                )
+            ): provider
+            for provider in providers_to_call
+        }
+
+        if task_to_provider:
+            _, pending = await asyncio.wait(task_to_provider, timeout=timeout)
+        else:
+            pending = set()
+
+        for task in pending:
+            task.cancel()
+
+        for task, provider in task_to_provider.items():
+            if task in pending:
+                timed_out_result = cls._timed_out_result(
+                    provider,
+                    timeout,
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount,
+                )
+                all_provider_results.append(timed_out_result)
+                timed_out_providers.append(timed_out_result["provider_id"])
+                continue
+            try:
+                result = task.result()
+                if result:
+                    all_provider_results.append(result)
+                    if result.get("success", False):
+                        all_quotes.append(result)
+            except Exception as exc:
+                logger.error(
+                    f"Provider {provider.__class__.__name__} generated an exception: {exc}"
+                )
+
+        if timed_out_providers:
+            logger.warning(
+                f"Deadline of {timeout}s reached, returning partial results without: "
+                f"{timed_out_providers}"
+            )
+
+        all_quotes = cls._finalize_quotes(
+            all_quotes, sort_by, filter_fn, max_delivery_time_minutes, max_fee
+        )
+
+        execution_time = time.time() - start_time
+
+        return {
+            "success": len(all_quotes) > 0,
+            "results": all_quotes,
+            "all_results": all_provider_results,
+            "execution_time": execution_time,
+            "providers_called": len(providers_to_call),
+            "successful_providers": len(all_quotes),
+            "timed_out_providers": timed_out_providers,
+            "timestamp": datetime.datetime.now().isoformat(),
+        }
+
+    @classmethod
+    def iter_quotes(
+        cls,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        exclude_providers: Optional[List[str]] = None,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_delivery_time_minutes: Optional[int] = None,
+        max_fee: Optional[float] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Quote]:
+        """
+        Yield provider results in completion order instead of waiting for the whole fan-out.
+
+        Every provider result is yielded, successful or not, so callers can report
+        failures as they happen; successful quotes that do not pass the filters are
+        skipped. Iteration stops when all providers have answered or the deadline
+        (defaults to the aggregator timeout) expires, at which point a timed-out result
+        is yielded for each provider still pending. Results are unsorted, since sorting
+        needs the full set.
+        """
+        providers_to_call = cls._get_providers_to_call(
+            source_country, dest_country, source_currency, dest_currency, exclude_providers
+        )
+        if timeout is None:
+            timeout = cls._get_timeout()
+
+        future_to_provider = {
+            cls._submit_provider_call(
+                provider,
+                source_country,
+                dest_country,
+                source_currency,
+                dest_currency,
+                amount,
+                use_cache,
+            ): provider
+            for provider in providers_to_call
+        }
+
+        try:
+            for future in concurrent.futures.as_completed(future_to_provider, timeout=timeout):
+                provider_name = future_to_provider[future].__class__.__name__
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    logger.error(f"Provider {provider_name} generated an exception: {exc}")
+                    continue
+
+                if not result:
+                    continue
+                if result.get("success", False) and not cls._passes_filters(
+                    result, filter_fn, max_delivery_time_minutes, max_fee
+                ):
+                    continue
+                yield result
+        except concurrent.futures.TimeoutError:
+            pending = [future_to_provider[f] for f in future_to_provider if not f.done()]
+            logger.warning(
+                f"Stopped streaming after {timeout}s, still pending: "
+                f"{[p.__class__.__name__ for p in pending]}"
+            )
+            for provider in pending:
+                yield cls._timed_out_result(
+                    provider,
+                    timeout,
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount,
+                )
+        finally:
+            for future in future_to_provider:
+                future.cancel()
+
+    @classmethod
+    async def aiter_quotes(
+        cls,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        amount: Decimal,
+        exclude_providers: Optional[List[str]] = None,
+        filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        max_delivery_time_minutes: Optional[int] = None,
+        max_fee: Optional[float] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Quote]:
+        """Async-iterator counterpart of iter_quotes, built on the aget_all_quotes engine."""
+        providers_to_call = cls._get_providers_to_call(
+            source_country, dest_country, source_currency, dest_currency, exclude_providers
+        )
+        if timeout is None:
+            timeout = cls._get_timeout()
+
+        task_to_provider = {
+            asyncio.ensure_future(
+                cls._acall_provider(
+                    provider,
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount,
+                    use_cache,
+                )
+            ): provider
+            for provider in providers_to_call
+        }
+
+        try:
+            for next_done in asyncio.as_completed(task_to_provider, timeout=timeout):
+                try:
+                    result = await next_done
+                except asyncio.TimeoutError:
+                    raise
+                except Exception as exc:
+                    logger.error(f"Provider generated an exception: {exc}")
+                    continue
+
+                if not result:
+                    continue
+                if result.get("success", False) and not cls._passes_filters(
+                    result, filter_fn, max_delivery_time_minutes, max_fee
+                ):
+                    continue
+                yield result
+        except asyncio.TimeoutError:
+            pending = [p for t, p in task_to_provider.items() if not t.done()]
+            logger.warning(
+                f"Stopped streaming after {timeout}s, still pending: "
+                f"{[p.__class__.__name__ for p in pending]}"
+            )
+            for provider in pending:
+                yield cls._timed_out_result(
+                    provider,
+                    timeout,
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount,
+                )
+        finally:
+            for task in task_to_provider:
+                task.cancel()
 
-        return {
-            "success": len(all_quotes) > 0,
-            "results": all_quotes,
-            "all_results": all_provider_results,
-            "execution_time": execution_time,
-            "providers_called": len(providers_to_call),
-            "successful_providers": len(all_quotes),
-            "timestamp": datetime.datetime.now().isoformat(),
-        }
 
 def get_cached_aggregated_rates(
     send_amount: Decimal,
@@ -0,0 +1,165 @@
+"""
+Circuit breakers for provider calls, shared by all workers through the cache (Redis).
+
+Each provider has a breaker with three states:
+
+- closed: calls go through. Failures (raised errors and calls slower than the
+  slow-call threshold, since many providers swallow their own timeouts) are
+  counted in a rolling window; reaching the failure threshold opens the breaker.
+- open: calls are skipped without touching the provider until the cool-down
+  has elapsed.
+- half-open: after the cool-down, a single caller across all workers is let
+  through as a probe. Success closes the breaker, failure re-opens it.
+
+Because the state lives in the shared cache, an outage seen by one worker is
+skipped by every worker. Thresholds are configured with CIRCUIT_BREAKER_DEFAULTS
+and per provider class name with CIRCUIT_BREAKER_PROVIDERS, e.g.
+``{"TransferGoProvider": {"failure_threshold": 3, "cooldown_seconds": 120}}``.
+"""
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_BREAKER_CONFIG = {
+    "failure_threshold": 5,  # Failures within the window that open the breaker
+    "window_seconds": 60,  # Rolling window for counting failures
+    "cooldown_seconds": 30,  # Time spent open before a probe is allowed
+    "slow_call_seconds": 15,  # Calls at least this slow count as failures
+}
+
+
+def get_circuit_state_cache_key(provider_name):
+    """Generate the cache key holding a provider's open/half-open state."""
+    return f"circuit:{provider_name.upper()}:state"
+
+
+def get_circuit_failures_cache_key(provider_name):
+    """Generate the cache key counting a provider's recent failures."""
+    return f"circuit:{provider_name.upper()}:failures"
+
+
+def get_circuit_probe_cache_key(provider_name):
+    """Generate the cache key of the half-open probe lease."""
+    return f"circuit:{provider_name.upper()}:probe"
+
+
+class CircuitBreaker:
+    """
+    Registry of per-provider breakers backed by the shared cache.
+
+    Args:
+        defaults: Configuration applied to every provider.
+        overrides: Per-provider configuration keyed by class name.
+    """
+
+    def __init__(
+        self,
+        defaults: Optional[Dict[str, Any]] = None,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.defaults = {**DEFAULT_BREAKER_CONFIG, **(defaults or {})}
+        self.overrides = overrides or {}
+
+    def get_config(self, provider_name: str) -> Dict[str, Any]:
+        return {**self.defaults, **self.overrides.get(provider_name, {})}
+
+    def get_state(self, provider_name: str) -> str:
+        """Current state of the provider's breaker, for monitoring."""
+        state = cache.get(get_circuit_state_cache_key(provider_name))
+        if not state:
+            return STATE_CLOSED
+        cooldown = self.get_config(provider_name)["cooldown_seconds"]
+        if time.time() - state["opened_at"] < cooldown:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def acquire(self, provider_name: str) -> Optional[str]:
+        """
+        Ask permission to call the provider.
+
+        Returns:
+            STATE_CLOSED for a regular call, STATE_HALF_OPEN if this caller is the
+            probe, or None if the call must be skipped. Pass the value back to
+            record() once the call has finished.
+        """
+        try:
+            state = self.get_state(provider_name)
+            if state == STATE_CLOSED:
+                return STATE_CLOSED
+            if state == STATE_HALF_OPEN:
+                cooldown = self.get_config(provider_name)["cooldown_seconds"]
+                if cache.add(get_circuit_probe_cache_key(provider_name), True, timeout=cooldown):
+                    logger.info(f"Circuit for {provider_name} is half-open, probing")
+                    return STATE_HALF_OPEN
+            return None
+        except Exception as e:
+            # Never let the breaker store take providers down with it
+            logger.warning(f"Circuit breaker unavailable for {provider_name}: {str(e)}")
+            return STATE_CLOSED
+
+    def record(self, provider_name: str, permit: Optional[str], success: bool):
+        """Record the outcome of a call made under permit."""
+        try:
+            if success:
+                if permit == STATE_HALF_OPEN:
+                    self._close(provider_name)
+                return
+
+            if permit == STATE_HALF_OPEN:
+                self._open(provider_name, "probe failed")
+                return
+
+            config = self.get_config(provider_name)
+            failures_key = get_circuit_failures_cache_key(provider_name)
+            cache.add(failures_key, 0, timeout=config["window_seconds"])
+            try:
+                failures = cache.incr(failures_key)
+            except ValueError:
+                # The window expired between add and incr
+                cache.set(failures_key, 1, timeout=config["window_seconds"])
+                failures = 1
+            if failures >= config["failure_threshold"]:
+                self._open(provider_name, f"{failures} failures")
+        except Exception as e:
+            logger.warning(f"Error recording circuit outcome for {provider_name}: {str(e)}")
+
+    def _open(self, provider_name: str, reason: str):
+        config = self.get_config(provider_name)
+        cache.set(
+            get_circuit_state_cache_key(provider_name),
+            {"opened_at": time.time(), "reason": reason},
+            # Keep the state past the cool-down so the half-open phase is visible
+            timeout=config["cooldown_seconds"] + config["window_seconds"],
+        )
+        cache.delete_many(
+            [
+                get_circuit_failures_cache_key(provider_name),
+                get_circuit_probe_cache_key(provider_name),
+            ]
+        )
+        logger.warning(f"Circuit for {provider_name} opened ({reason})")
+
+    def _close(self, provider_name: str):
+        cache.delete_many(
+            [
+                get_circuit_state_cache_key(provider_name),
+                get_circuit_failures_cache_key(provider_name),
+                get_circuit_probe_cache_key(provider_name),
+            ]
+        )
+        logger.info(f"Circuit for {provider_name} closed")
+
+
+provider_breakers = CircuitBreaker(
+    defaults=getattr(settings, "CIRCUIT_BREAKER_DEFAULTS", None),
+    overrides=getattr(settings, "CIRCUIT_BREAKER_PROVIDERS", None),
+)
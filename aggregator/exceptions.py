@@ -58,3 +58,25 @@ class NoSuccessfulQuotesError(AggregatorError):
         details: Optional[Dict[str, Any]] = None,
     ):
         super().__init__(message, details)
+
+
+class ProviderLaneFullError(AggregatorError):
+    """A provider's executor lane has no free worker or queue slot."""
+
+    def __init__(
+        self,
+        message: str = "Provider lane is full",
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(message, details)
+
+
+class ProviderPoolExhaustedError(AggregatorError):
+    """Every pooled instance of a provider stayed checked out past the checkout timeout."""
+
+    def __init__(
+        self,
+        message: str = "No provider instance available",
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(message, details)
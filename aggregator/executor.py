@@ -0,0 +1,159 @@
+"""
+Process-wide executor for provider calls with one bounded lane per provider.
+
+Each provider gets its own small set of worker threads (its lane) plus a bounded
+queue. A provider that hangs can only exhaust its own lane: further calls to that
+provider are rejected immediately with ProviderLaneFullError, while every other
+provider keeps its full capacity, for this request and all others in the process.
+
+Lane sizes come from settings:
+
+- AGGREGATOR_PROVIDER_LANE_SIZE: worker threads per provider
+- AGGREGATOR_PROVIDER_LANE_QUEUE: calls allowed to wait for a free worker
+- AGGREGATOR_PROVIDER_LANES: per-provider overrides, keyed by class name, e.g.
+  ``{"TransferGoProvider": {"size": 2, "queue": 4}}``
+"""
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+from .exceptions import ProviderLaneFullError
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderLane:
+    """Bounded worker threads and queue for a single provider."""
+
+    def __init__(self, name: str, size: int, max_queue: int):
+        self.name = name
+        self.size = size
+        self.max_queue = max_queue
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix=f"provider-{name}"
+        )
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule fn on this lane, or raise ProviderLaneFullError if the lane is saturated."""
+        with self._lock:
+            if self.active + self.queued >= self.size + self.max_queue:
+                self.rejected += 1
+                raise ProviderLaneFullError(
+                    f"Lane for {self.name} is full",
+                    details={"active": self.active, "queued": self.queued},
+                )
+            self.queued += 1
+
+        def run():
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        future = self._executor.submit(run)
+
+        def release_if_cancelled(f):
+            # A queued call cancelled before it started never ran run()
+            if f.cancelled():
+                with self._lock:
+                    self.queued -= 1
+
+        future.add_done_callback(release_if_cancelled)
+        return future
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of lane occupancy and queue depth."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queued": self.queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ProviderExecutor:
+    """Long-lived executor that routes each provider's calls to that provider's lane."""
+
+    def __init__(
+        self,
+        lane_size: int = 4,
+        lane_queue: int = 16,
+        overrides: Optional[Dict[str, Dict[str, int]]] = None,
+    ):
+        self.lane_size = lane_size
+        self.lane_queue = lane_queue
+        self.overrides = overrides or {}
+        self._lanes: Dict[str, ProviderLane] = {}
+        self._lock = threading.Lock()
+
+    def get_lane(self, provider_name: str) -> ProviderLane:
+        """Return the lane for provider_name, creating it on first use."""
+        lane = self._lanes.get(provider_name)
+        if lane is None:
+            with self._lock:
+                lane = self._lanes.get(provider_name)
+                if lane is None:
+                    override = self.overrides.get(provider_name, {})
+                    lane = ProviderLane(
+                        provider_name,
+                        size=override.get("size", self.lane_size),
+                        max_queue=override.get("queue", self.lane_queue),
+                    )
+                    self._lanes[provider_name] = lane
+        return lane
+
+    def submit(
+        self, provider_name: str, fn: Callable[..., Any], *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """Schedule fn on the provider's lane. Raises ProviderLaneFullError if it is saturated."""
+        return self.get_lane(provider_name).submit(fn, *args, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Occupancy and queue depth of every lane, keyed by provider class name."""
+        with self._lock:
+            lanes = list(self._lanes.values())
+        return {lane.name: lane.stats() for lane in lanes}
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            lanes = list(self._lanes.values())
+            self._lanes = {}
+        for lane in lanes:
+            lane.shutdown(wait=wait)
+
+
+_provider_executor: Optional[ProviderExecutor] = None
+_provider_executor_lock = threading.Lock()
+
+
+def get_provider_executor() -> ProviderExecutor:
+    """Return the process-wide provider executor, creating it on first use."""
+    global _provider_executor
+    if _provider_executor is None:
+        with _provider_executor_lock:
+            if _provider_executor is None:
+                _provider_executor = ProviderExecutor(
+                    lane_size=getattr(settings, "AGGREGATOR_PROVIDER_LANE_SIZE", 4),
+                    lane_queue=getattr(settings, "AGGREGATOR_PROVIDER_LANE_QUEUE", 16),
+                    overrides=getattr(settings, "AGGREGATOR_PROVIDER_LANES", {}),
+                )
+    return _provider_executor
@@ -0,0 +1,99 @@
+"""
+Request hedging for providers with a long latency tail.
+
+For providers listed in AGGREGATOR_HEDGED_PROVIDERS, the aggregator tracks the
+latency of their recent calls. If a call has not answered by the configured
+percentile of that distribution, a second attempt is fired on another pooled
+provider instance (with its own HTTP session) and whichever attempt finishes
+first wins.
+
+Hedges are budgeted: at most AGGREGATOR_HEDGE_BUDGET_PERCENT extra calls per
+hundred primary calls are ever fired, so hedging cannot turn a slow provider
+into an overloaded one.
+"""
+import collections
+import logging
+import math
+import threading
+from typing import Any, Deque, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """
+    Rolling window of recent call latencies per provider.
+
+    Args:
+        window: Number of latencies kept per provider.
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, provider_name: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(provider_name)
+            if samples is None:
+                samples = self._samples[provider_name] = collections.deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, provider_name: str, pct: float, min_samples: int = 1) -> Optional[float]:
+        """Return the pct-th percentile latency, or None with fewer than min_samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(provider_name, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = max(0, math.ceil(pct / 100 * len(samples)) - 1)
+        return samples[index]
+
+
+class HedgeBudget:
+    """
+    Cap hedges at a percentage of primary calls.
+
+    Counters decay by half every ``decay_after`` primary calls so the budget
+    reflects recent traffic rather than the lifetime of the process.
+    """
+
+    def __init__(self, percent: float, decay_after: int = 10000):
+        self.percent = percent
+        self.decay_after = decay_after
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+
+    def record_call(self):
+        with self._lock:
+            self.calls += 1
+            if self.calls >= self.decay_after:
+                self.calls //= 2
+                self.hedges //= 2
+
+    def try_acquire(self) -> bool:
+        """Reserve one hedge if it keeps hedges within the budget."""
+        with self._lock:
+            if (self.hedges + 1) * 100 > self.calls * self.percent:
+                return False
+            self.hedges += 1
+            return True
+
+
+def get_hedge_config(provider_name: str) -> Optional[Dict[str, Any]]:
+    """Return the hedging configuration of a provider, or None if it isn't hedged."""
+    hedged = getattr(settings, "AGGREGATOR_HEDGED_PROVIDERS", {})
+    if provider_name not in hedged:
+        return None
+    return {
+        "percentile": getattr(settings, "AGGREGATOR_HEDGE_PERCENTILE", 95),
+        "min_samples": getattr(settings, "AGGREGATOR_HEDGE_MIN_SAMPLES", 20),
+        **(hedged[provider_name] or {}),
+    }
+
+
+latency_tracker = LatencyTracker()
+hedge_budget = HedgeBudget(percent=getattr(settings, "AGGREGATOR_HEDGE_BUDGET_PERCENT", 5))
@@ -0,0 +1,28 @@
+"""
+Management command reporting the import and instantiation cost of each provider.
+"""
+from django.core.management.base import BaseCommand
+
+from aggregator.registry import provider_registry
+
+
+class Command(BaseCommand):
+    help = "Load every registered provider and report its import and instantiation time"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--provider", action="append", help="Only load these providers")
+
+    def handle(self, *args, **options):
+        names = options.get("provider") or provider_registry.names()
+
+        for name in names:
+            try:
+                provider_registry.get(name)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"{name}: failed to load ({str(e)})"))
+
+        self.stdout.write(f"{'Provider':<24} {'Import (ms)':>12} {'Init (ms)':>10}")
+        for row in provider_registry.import_report():
+            import_ms = f"{row['import_seconds'] * 1000:.1f}" if row["import_seconds"] else "-"
+            init_ms = f"{row['init_seconds'] * 1000:.1f}" if row["init_seconds"] else "-"
+            self.stdout.write(f"{row['provider']:<24} {import_ms:>12} {init_ms:>10}")
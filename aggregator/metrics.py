@@ -0,0 +1,299 @@
+"""
+Per-provider latency and outcome metrics, aggregated across workers and rendered
+in the Prometheus text format.
+
+Every provider call the aggregator makes records, labelled with the provider and
+the corridor (e.g. ``US-MX``):
+
+- remitscout_provider_latency_seconds: histogram of the call's duration;
+- remitscout_provider_response_bytes: histogram of the bytes it received over HTTP;
+- remitscout_provider_retries: histogram of the HTTP retries its client made;
+- remitscout_provider_outcomes_total: counter of outcomes: success, unsupported,
+  timeout, error, cache_hit, and skipped (circuit open or over the rate budget,
+  so the provider wasn't called).
+
+Only calls that reached the provider go into the histograms. Bytes and retries
+come from the hooks of providers.base.http_stats. A call cut off by the request
+deadline counts as a timeout for that request; it keeps running on its lane, and
+when it finishes its latency and outcome are recorded too.
+
+Recording only updates counters in the process. A daemon thread per process flushes
+them to Redis every PROVIDER_METRICS_FLUSH_SECONDS, as hash increments in one
+pipeline, so every gunicorn worker adds to the same series and any worker can serve
+the totals. With a cache backend other than django-redis each process reports its
+own.
+"""
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import httpx
+import requests
+from django.conf import settings
+
+from providers.base.http_stats import CallStats
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_UNSUPPORTED = "unsupported"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"
+OUTCOME_CACHE_HIT = "cache_hit"
+OUTCOME_SKIPPED = "skipped"
+
+# name: (help, bucket upper bounds)
+HISTOGRAMS = {
+    "latency_seconds": (
+        "Duration of provider calls.",
+        (0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60),
+    ),
+    "response_bytes": (
+        "Bytes received over HTTP by provider calls.",
+        (1024, 4096, 16384, 65536, 262144, 1048576),
+    ),
+    "retries": (
+        "HTTP retries made by provider calls.",
+        (0, 1, 2, 3, 5),
+    ),
+}
+
+METRIC_PREFIX = "remitscout_provider_"
+
+TIMEOUT_ERRORS = (TimeoutError, requests.exceptions.Timeout, httpx.TimeoutException)
+
+
+def get_provider_metrics_key(provider, corridor):
+    """Generate the Redis key of the metrics hash of a provider and corridor."""
+    return f"metrics:provider:{provider}:{corridor}"
+
+
+def get_provider_metrics_index_key():
+    """Generate the Redis key of the set of (provider, corridor) series recorded."""
+    return "metrics:provider:series"
+
+
+def corridor_label(source_country: str, dest_country: str) -> str:
+    return f"{source_country}-{dest_country}".upper()
+
+
+def classify_outcome(result: Any) -> str:
+    """Outcome class of a provider result (not a cache hit)."""
+    if not result:
+        return OUTCOME_ERROR
+    if result.get("success", False):
+        return OUTCOME_SUCCESS
+    if result.get("timed_out"):
+        return OUTCOME_TIMEOUT
+    if result.get("circuit_open") or result.get("rate_limited"):
+        return OUTCOME_SKIPPED
+    if result.get("error_code") == ERROR_CODE_CORRIDOR_UNSUPPORTED:
+        return OUTCOME_UNSUPPORTED
+    return OUTCOME_ERROR
+
+
+def classify_error(error: BaseException) -> str:
+    """Outcome class of a provider call that raised."""
+    return OUTCOME_TIMEOUT if isinstance(error, TIMEOUT_ERRORS) else OUTCOME_ERROR
+
+
+def _bucket_label(bound) -> str:
+    return "+Inf" if bound is None else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class ProviderMetrics:
+    """
+    Metrics of provider calls, shared by the workers through Redis.
+
+    Args:
+        flush_interval: Longest time, in seconds, observations stay in the process.
+    """
+
+    def __init__(self, flush_interval: float = 5):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._local_totals: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._redis = None
+        self._flusher_pid = None
+
+    def _fields(self, provider: str, corridor: str) -> Dict[str, float]:
+        """Pending increments of a series. Must be called with the lock held."""
+        fields = self._pending.get((provider, corridor))
+        if fields is None:
+            fields = self._pending[(provider, corridor)] = defaultdict(int)
+        return fields
+
+    @staticmethod
+    def _observe(fields: Dict[str, float], name: str, value: float):
+        bounds = HISTOGRAMS[name][1]
+        bound = next((b for b in bounds if value <= b), None)
+        fields[f"{name}:bucket:{_bucket_label(bound)}"] += 1
+        fields[f"{name}:sum"] += float(value)
+        fields[f"{name}:count"] += 1
+
+    def record_call(
+        self,
+        provider: str,
+        corridor: str,
+        outcome: str,
+        seconds: float,
+        stats: Optional[CallStats] = None,
+    ):
+        """Record a call that reached the provider."""
+        with self._lock:
+            fields = self._fields(provider, corridor)
+            fields[f"outcomes:{outcome}"] += 1
+            self._observe(fields, "latency_seconds", seconds)
+            if stats is not None and stats.responses:
+                self._observe(fields, "response_bytes", stats.bytes_received)
+                self._observe(fields, "retries", stats.retries)
+        self._ensure_flusher()
+
+    def record_outcome(self, provider: str, corridor: str, outcome: str, count: int = 1):
+        """Record outcomes that didn't call the provider: cache hits, skips, timeouts."""
+        with self._lock:
+            self._fields(provider, corridor)[f"outcomes:{outcome}"] += count
+        self._ensure_flusher()
+
+    def _get_redis(self):
+        """The django-redis connection, or None with another cache backend."""
+        if self._redis is None:
+            try:
+                from django_redis import get_redis_connection
+
+                self._redis = get_redis_connection("default")
+            except Exception:
+                # Not a django-redis cache: every process keeps its own totals
+                self._redis = False
+        return self._redis or None
+
+    def _ensure_flusher(self):
+        """Start the flush thread of this process (again after a fork)."""
+        if self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        thread = threading.Thread(target=self._flush_loop, name="provider-metrics", daemon=True)
+        thread.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """Push the pending increments to the shared store."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        redis = self._get_redis()
+        if redis is None:
+            with self._lock:
+                self._merge(self._local_totals, pending.items())
+            return
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for (provider, corridor), fields in pending.items():
+                key = get_provider_metrics_key(provider, corridor)
+                for field, value in fields.items():
+                    if isinstance(value, float):
+                        pipe.hincrbyfloat(key, field, value)
+                    else:
+                        pipe.hincrby(key, field, value)
+                pipe.sadd(get_provider_metrics_index_key(), f"{provider}|{corridor}")
+            pipe.execute()
+        except Exception as e:
+            # Metrics must never fail a quote; put the increments back for the next flush
+            logger.warning(f"Error flushing provider metrics: {str(e)}")
+            with self._lock:
+                self._merge(self._pending, pending.items())
+
+    @staticmethod
+    def _merge(into, series: Iterable[Tuple[Tuple[str, str], Dict[str, float]]]):
+        for labels, fields in series:
+            totals = into.setdefault(labels, defaultdict(int))
+            for field, value in fields.items():
+                totals[field] += value
+
+    def totals(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Totals of every series, across workers when Redis is available."""
+        self.flush()
+        redis = self._get_redis()
+        if redis is None:
+            with self._lock:
+                return {labels: dict(fields) for labels, fields in self._local_totals.items()}
+
+        members = sorted(m.decode() for m in redis.smembers(get_provider_metrics_index_key()))
+        labels = [tuple(member.split("|", 1)) for member in members]
+        pipe = redis.pipeline(transaction=False)
+        for provider, corridor in labels:
+            pipe.hgetall(get_provider_metrics_key(provider, corridor))
+        totals = {}
+        for series, fields in zip(labels, pipe.execute()):
+            totals[series] = {k.decode(): float(v) for k, v in fields.items()}
+        return totals
+
+    def render(self) -> str:
+        """All series in the Prometheus text exposition format."""
+        totals = self.totals()
+        lines = []
+
+        name = f"{METRIC_PREFIX}outcomes_total"
+        lines.append(f"# HELP {name} Provider results by outcome.")
+        lines.append(f"# TYPE {name} counter")
+        for (provider, corridor), fields in sorted(totals.items()):
+            labels = f'provider="{_escape(provider)}",corridor="{_escape(corridor)}"'
+            for field, value in sorted(fields.items()):
+                if field.startswith("outcomes:"):
+                    outcome = _escape(field.split(":", 1)[1])
+                    lines.append(f'{name}{{{labels},outcome="{outcome}"}} {_format_value(value)}')
+
+        for histogram, (help_text, bounds) in HISTOGRAMS.items():
+            name = f"{METRIC_PREFIX}{histogram}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (provider, corridor), fields in sorted(totals.items()):
+                count = fields.get(f"{histogram}:count")
+                if not count:
+                    continue
+                labels = f'provider="{_escape(provider)}",corridor="{_escape(corridor)}"'
+                cumulative = 0
+                for bound in (*bounds, None):
+                    le = _bucket_label(bound)
+                    cumulative += fields.get(f"{histogram}:bucket:{le}", 0)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {_format_value(cumulative)}')
+                total = fields.get(f"{histogram}:sum", 0)
+                lines.append(f"{name}_sum{{{labels}}} {_format_value(total)}")
+                lines.append(f"{name}_count{{{labels}}} {_format_value(count)}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Forget this process's pending and local observations."""
+        with self._lock:
+            self._pending = {}
+            self._local_totals = {}
+
+
+provider_metrics = ProviderMetrics(
+    flush_interval=getattr(settings, "PROVIDER_METRICS_FLUSH_SECONDS", 5),
+)
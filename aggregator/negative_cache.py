@@ -0,0 +1,144 @@
+"""
+Learned negative cache of (provider, corridor) pairs a provider does not serve.
+
+When a provider answers a quote with error_code ERROR_CODE_CORRIDOR_UNSUPPORTED
+(TransferGo's 422 or failed corridor validation, Placid's
+PlacidCorridorUnsupportedError, WireBarley's missing corridor, ...), the
+aggregator records a marker for that provider and corridor, independent of the
+amount. While the marker exists the provider is not dispatched for the
+corridor. Markers live for UNSUPPORTED_CORRIDOR_TTL; every
+UNSUPPORTED_CORRIDOR_REPROBE_SECONDS a single request is let through to re-probe
+the provider, so corridors a provider starts supporting are picked up again.
+"""
+import logging
+import time
+from typing import Iterable, Set
+
+from django.conf import settings
+from django.core.cache import cache
+
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED
+
+logger = logging.getLogger(__name__)
+
+
+def get_unsupported_corridor_cache_key(
+    provider_name, source_country, dest_country, source_currency, dest_currency
+):
+    """Generate the cache key of the unsupported marker for a provider and corridor."""
+    return (
+        f"unsupported_corridor:{provider_name.upper()}:"
+        f"{source_country}:{dest_country}:{source_currency}:{dest_currency}"
+    )
+
+
+def get_reprobe_lease_cache_key(marker_key):
+    """Generate the cache key of the lease held by the request that re-probes a marker."""
+    return f"reprobe:{marker_key}"
+
+
+class UnsupportedCorridorCache:
+    """
+    Store of unsupported markers.
+
+    Args:
+        ttl: Lifetime of a marker in seconds.
+        reprobe_seconds: Age after which one request re-probes the provider.
+    """
+
+    def __init__(self, ttl: int, reprobe_seconds: int):
+        self.ttl = ttl
+        self.reprobe_seconds = reprobe_seconds
+
+    def mark(
+        self,
+        provider_name: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+        reason: str = "",
+    ):
+        """Record that the provider does not serve the corridor."""
+        key = get_unsupported_corridor_cache_key(
+            provider_name, source_country, dest_country, source_currency, dest_currency
+        )
+        cache.set(key, {"marked_at": time.time(), "reason": reason}, timeout=self.ttl)
+        logger.info(f"Marked corridor unsupported for {provider_name}: {key} ({reason})")
+
+    def clear(
+        self,
+        provider_name: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+    ):
+        """Forget the marker, e.g. after a successful quote for the corridor."""
+        cache.delete(
+            get_unsupported_corridor_cache_key(
+                provider_name, source_country, dest_country, source_currency, dest_currency
+            )
+        )
+
+    def record(
+        self,
+        provider_name: str,
+        result,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+    ):
+        """Update the store from a fresh (not cached) provider result."""
+        corridor = (source_country, dest_country, source_currency, dest_currency)
+        if not result:
+            return
+        if result.get("error_code") == ERROR_CODE_CORRIDOR_UNSUPPORTED:
+            self.mark(provider_name, *corridor, reason=result.get("error_message") or "")
+        elif result.get("success", False):
+            self.clear(provider_name, *corridor)
+
+    def get_skipped(
+        self,
+        provider_names: Iterable[str],
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+    ) -> Set[str]:
+        """
+        Return the providers that should not be dispatched for the corridor.
+
+        All markers are fetched in one round trip. A provider whose marker is due
+        for re-probing is dispatched by exactly one caller, which takes a lease.
+        """
+        keys = {
+            get_unsupported_corridor_cache_key(
+                name, source_country, dest_country, source_currency, dest_currency
+            ): name
+            for name in provider_names
+        }
+        try:
+            markers = cache.get_many(list(keys))
+        except Exception as e:
+            logger.warning(f"Error reading unsupported corridor markers: {str(e)}")
+            return set()
+
+        skipped = set()
+        now = time.time()
+        for key, marker in markers.items():
+            name = keys[key]
+            if now - marker.get("marked_at", 0) >= self.reprobe_seconds and cache.add(
+                get_reprobe_lease_cache_key(key), True, timeout=self.reprobe_seconds
+            ):
+                logger.info(f"Re-probing {name} for corridor marked unsupported: {key}")
+                continue
+            skipped.add(name)
+        return skipped
+
+
+unsupported_corridors = UnsupportedCorridorCache(
+    ttl=getattr(settings, "UNSUPPORTED_CORRIDOR_TTL", 60 * 60 * 24 * 7),
+    reprobe_seconds=getattr(settings, "UNSUPPORTED_CORRIDOR_REPROBE_SECONDS", 60 * 60 * 24),
+)
@@ -0,0 +1,25 @@
+"""
+Permissions for the aggregator API.
+"""
+import hmac
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class HasMetricsToken(BasePermission):
+    """
+    Allow scrapers presenting PROVIDER_METRICS_TOKEN as a bearer token.
+
+    Prometheus can't log in as staff; with no token configured only staff get in.
+    """
+
+    message = "This endpoint requires staff access or the metrics bearer token."
+
+    def has_permission(self, request, view):
+        token = getattr(settings, "PROVIDER_METRICS_TOKEN", None)
+        if not token:
+            return False
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        scheme, _, presented = header.partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(presented, token)
@@ -0,0 +1,155 @@
+"""
+Pools of warm provider instances.
+
+Provider instances carry mutable per-session state (WireBarley's session
+timestamp, RIA's bearer token, Remitbee's rates cache, Al Ansari's security
+token) and a requests.Session, neither of which is safe to share between
+threads. A pool hands each concurrent call its own instance and takes it back
+afterwards, so session warm-up runs once per pooled instance instead of once
+per call, and concurrent comparisons never race on the same instance.
+
+Instances are validated on checkout: an instance older than ``max_age_seconds``,
+or whose optional ``is_healthy()`` method returns False, is discarded and
+replaced. An instance whose call raised is discarded on checkin.
+"""
+import collections
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from aggregator.exceptions import ProviderPoolExhaustedError
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderInstancePool:
+    """
+    Bounded pool of instances of one provider.
+
+    Args:
+        name: Provider class name, for logging.
+        factory: Builds a new instance.
+        max_size: Most instances alive at once, checked out or idle.
+        checkout_timeout: Seconds to wait for an instance once max_size is reached.
+        max_age_seconds: Age after which an idle instance is rebuilt. None keeps
+            instances forever.
+        seed: Already-built instance to hand out first.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        max_size: int,
+        checkout_timeout: float = 30,
+        max_age_seconds: Optional[float] = None,
+        seed: Any = None,
+    ):
+        self.name = name
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.checkout_timeout = checkout_timeout
+        self.max_age_seconds = max_age_seconds
+        self._available = threading.Condition()
+        # Idle (instance, created_at) pairs; most recently used last so warm ones stay warm
+        self._idle: Deque[Tuple[Any, float]] = collections.deque()
+        self._created_at: Dict[int, float] = {}
+        self._size = 0
+        if seed is not None:
+            self._created_at[id(seed)] = time.monotonic()
+            self._idle.append((seed, self._created_at[id(seed)]))
+            self._size = 1
+
+    def _is_healthy(self, instance: Any, created_at: float) -> bool:
+        age = time.monotonic() - created_at
+        if self.max_age_seconds is not None and age > self.max_age_seconds:
+            return False
+        is_healthy = getattr(instance, "is_healthy", None)
+        if callable(is_healthy):
+            try:
+                return bool(is_healthy())
+            except Exception as e:
+                logger.warning(f"Health check of a pooled {self.name} failed: {str(e)}")
+                return False
+        return True
+
+    def _discard(self, instance: Any):
+        """Forget an instance. Must be called with the condition held."""
+        self._created_at.pop(id(instance), None)
+        self._size -= 1
+        self._available.notify()
+
+    def checkout(self) -> Any:
+        """
+        Take an idle healthy instance, or build one if the pool isn't full.
+
+        Raises:
+            ProviderPoolExhaustedError: max_size instances stayed checked out for
+                checkout_timeout seconds.
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._available:
+            while True:
+                while self._idle:
+                    instance, created_at = self._idle.pop()
+                    if self._is_healthy(instance, created_at):
+                        return instance
+                    logger.info(f"Discarding unhealthy pooled {self.name}")
+                    self._discard(instance)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise ProviderPoolExhaustedError(
+                        details={"provider": self.name, "max_size": self.max_size}
+                    )
+
+        # Build outside the lock; warm-up can take seconds
+        try:
+            instance = self.factory()
+        except Exception:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._created_at[id(instance)] = time.monotonic()
+        logger.info(f"Added a {self.name} instance to its pool ({self._size}/{self.max_size})")
+        return instance
+
+    def checkin(self, instance: Any, discard: bool = False):
+        """Return an instance to the pool, or drop it if it is no longer usable."""
+        with self._available:
+            if id(instance) not in self._created_at:
+                return
+            if discard:
+                logger.info(f"Discarding pooled {self.name} after a failed call")
+                self._discard(instance)
+                return
+            self._idle.append((instance, self._created_at[id(instance)]))
+            self._available.notify()
+
+    @contextlib.contextmanager
+    def lease(self):
+        """Check an instance out for the duration of a with block."""
+        instance = self.checkout()
+        try:
+            yield instance
+        except BaseException:
+            self.checkin(instance, discard=True)
+            raise
+        self.checkin(instance)
+
+    def stats(self) -> Dict[str, int]:
+        with self._available:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+            }
@@ -0,0 +1,275 @@
+"""
+Columnar quote table shared by every filter, sort order and value score.
+
+A QuoteTable reads each field of a list of quote dicts at most once into a
+column: float arrays for the exchange rate, fee, send and destination amounts
+and delivery minutes (NaN where a quote has no value), and plain columns for the
+success flag, provider, payment method and delivery method. Columns are built on
+first use, so a query only reads the fields it needs.
+
+Filters narrow a list of row indexes one criterion at a time, and sort orders
+compute the key of each selected row once and sort the indexes, instead of
+running a chain of closures and several dict lookups per quote. The quote dicts
+themselves are never copied: selecting rows returns the original dicts.
+
+This is the only implementation of the filters in aggregator.filters, the sort
+orders (best_rate, lowest_fee, fastest_time, best_value) and the value score.
+"""
+import functools
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+NAN = float("nan")
+INF = float("inf")
+
+# Spellings used by the API documentation
+SORT_ALIASES = {"fastest": "fastest_time", "value_score": "best_value"}
+
+# (criterion, value) pairs, e.g. ("max_fee", 5.0)
+Criteria = Iterable[Tuple[str, Any]]
+
+# Numeric criteria: criterion -> (column, whether the bound is a minimum)
+_BOUNDS = {
+    "min_rate": ("exchange_rate", True),
+    "max_fee": ("fee", False),
+    "max_delivery_time": ("delivery_minutes", False),
+    "min_destination_amount": ("destination_amount", True),
+}
+
+# Set-membership criteria: criterion -> column
+_CATEGORIES = {
+    "include_providers": "provider_id",
+    "payment_methods": "payment_method",
+    "delivery_methods": "delivery_method",
+}
+
+# Criteria that also pass failed quotes
+_ANY_STATUS = {"include_providers", "exclude_providers"}
+
+SORT_ORDERS = ("best_rate", "lowest_fee", "fastest_time", "best_value")
+
+
+def is_sort_order(sort_by: Optional[str]) -> bool:
+    """Whether sort_by names a sort order (or one of its aliases)."""
+    return SORT_ALIASES.get(sort_by, sort_by) in SORT_ORDERS
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def _first(quote: Dict[str, Any], *keys: str) -> Any:
+    for key in keys:
+        value = quote.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def value_score(exchange_rate: float, fee: float, send_amount: float) -> float:
+    """
+    Destination currency received per unit sent once the fee is taken out.
+
+    Missing rates score 0 and missing fees count as free. Without a send amount
+    the fee can't be weighed and the score is the exchange rate.
+    """
+    rate = 0.0 if math.isnan(exchange_rate) else exchange_rate
+    fee = 0.0 if math.isnan(fee) else fee
+    if math.isnan(send_amount) or send_amount <= 0:
+        return rate
+    return rate * (1 - fee / send_amount)
+
+
+class QuoteTable:
+    """
+    Quotes stored column by column.
+
+    Args:
+        quotes: Quote dicts, in the provider shape (destination_amount) or the
+            normalized API shape (receive_amount).
+        amount: Send amount used for quotes that don't carry their own.
+    """
+
+    def __init__(self, quotes: Sequence[Dict[str, Any]], amount: Optional[float] = None):
+        self.quotes = list(quotes)
+        self.amount = _as_float(amount)
+
+    # Columns are built on first use, so a query only pays for the fields it reads
+
+    def _float_column(self, *keys: str) -> array:
+        if len(keys) == 1:
+            values = [q.get(keys[0]) for q in self.quotes]
+        else:
+            values = [_first(q, *keys) for q in self.quotes]
+        try:
+            return array("d", [NAN if v is None else v for v in values])
+        except TypeError:
+            # Strings or other non-float values; convert them one by one
+            return array("d", map(_as_float, values))
+
+    @functools.cached_property
+    def exchange_rate(self) -> array:
+        return self._float_column("exchange_rate")
+
+    @functools.cached_property
+    def fee(self) -> array:
+        return self._float_column("fee")
+
+    @functools.cached_property
+    def send_amount(self) -> array:
+        column = self._float_column("send_amount", "source_amount", "amount")
+        if math.isnan(self.amount):
+            return column
+        return array("d", (self.amount if math.isnan(s) else s for s in column))
+
+    @functools.cached_property
+    def destination_amount(self) -> array:
+        return self._float_column("destination_amount", "receive_amount")
+
+    @functools.cached_property
+    def delivery_minutes(self) -> array:
+        return self._float_column("delivery_time_minutes")
+
+    @functools.cached_property
+    def success(self) -> List[bool]:
+        return [q.get("success", False) for q in self.quotes]
+
+    @functools.cached_property
+    def provider_id(self) -> List[Any]:
+        return [q.get("provider_id") for q in self.quotes]
+
+    @functools.cached_property
+    def payment_method(self) -> List[Any]:
+        return [q.get("payment_method") for q in self.quotes]
+
+    @functools.cached_property
+    def delivery_method(self) -> List[Any]:
+        return [q.get("delivery_method") for q in self.quotes]
+
+    def __len__(self) -> int:
+        return len(self.quotes)
+
+    # Criteria narrow a list of row indexes, so each one only looks at the rows
+    # the previous ones kept. Comparisons with NaN are False: quotes missing a
+    # value never pass a numeric bound.
+
+    def _narrow(self, criterion: str, value: Any, rows: List[int]) -> List[int]:
+        if criterion in _BOUNDS:
+            column_name, at_least = _BOUNDS[criterion]
+            column = getattr(self, column_name)
+            bound = _as_float(value)
+            if at_least:
+                return [i for i in rows if column[i] >= bound]
+            return [i for i in rows if column[i] <= bound]
+
+        if criterion in _CATEGORIES:
+            column = getattr(self, _CATEGORIES[criterion])
+            wanted = set(value)
+            return [i for i in rows if column[i] in wanted]
+
+        if criterion == "exclude_providers":
+            column = self.provider_id
+            unwanted = set(value)
+            return [i for i in rows if column[i] is not None and column[i] not in unwanted]
+
+        raise ValueError(f"Unknown quote filter criterion: {criterion}")
+
+    def select(self, criteria: Criteria, rows: Optional[List[int]] = None) -> List[int]:
+        """Indexes of the rows passing every criterion, in table order."""
+        criteria = list(criteria)
+        rows = list(range(len(self))) if rows is None else rows
+        # Every criterion but the provider lists only passes successful quotes
+        if any(criterion not in _ANY_STATUS for criterion, _ in criteria):
+            success = self.success
+            rows = [i for i in rows if success[i]]
+        for criterion, value in criteria:
+            if not rows:
+                break
+            rows = self._narrow(criterion, value, rows)
+        return rows
+
+    def value_scores(self, rows: Optional[Iterable[int]] = None) -> List[float]:
+        """value_score of the given rows (all rows by default)."""
+        rows = range(len(self)) if rows is None else rows
+        rates, fees, sends = self.exchange_rate, self.fee, self.send_amount
+        return [value_score(rates[i], fees[i], sends[i]) for i in rows]
+
+    def _sort_values(self, sort_by: str, rows: List[int]) -> Optional[List[float]]:
+        """
+        Ascending sort key of each row for a sort order, or None for an unknown order.
+
+        Missing values sort last: rates as 0, fees and times as infinite.
+        """
+        sort_by = SORT_ALIASES.get(sort_by, sort_by)
+        if sort_by == "best_rate":
+            rates = self.exchange_rate
+            return [-rates[i] if rates[i] == rates[i] else 0.0 for i in rows]
+        if sort_by == "lowest_fee":
+            fees = self.fee
+            return [fees[i] if fees[i] == fees[i] else INF for i in rows]
+        if sort_by == "fastest_time":
+            minutes = self.delivery_minutes
+            return [minutes[i] if minutes[i] == minutes[i] else INF for i in rows]
+        if sort_by == "best_value":
+            return [-score for score in self.value_scores(rows)]
+        return None
+
+    def order(self, sort_by: Optional[str], rows: Optional[List[int]] = None) -> List[int]:
+        """Row indexes sorted by sort_by; ties keep their original order."""
+        rows = list(range(len(self))) if rows is None else rows
+        values = self._sort_values(sort_by, rows) if sort_by else None
+        if values is None:
+            return rows
+        return [row for _, row in sorted(zip(values, rows))]
+
+    def take(self, rows: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self.quotes[i] for i in rows]
+
+
+class QuoteFilter:
+    """
+    Filter criteria that can be applied to a whole QuoteTable at once.
+
+    Calling it on a single quote dict keeps it usable wherever a
+    ``filter_fn(quote) -> bool`` is expected.
+    """
+
+    def __init__(self, criteria: Criteria):
+        self.criteria: List[Tuple[str, Any]] = list(criteria)
+
+    def select(self, table: QuoteTable, rows: Optional[List[int]] = None) -> List[int]:
+        return table.select(self.criteria, rows)
+
+    def __call__(self, quote: Dict[str, Any]) -> bool:
+        return bool(self.select(QuoteTable([quote])))
+
+
+def select_quotes(
+    quotes: Sequence[Dict[str, Any]],
+    sort_by: Optional[str] = None,
+    criteria: Criteria = (),
+    filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    amount: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Filter and sort quote dicts through a QuoteTable.
+
+    filter_fn may be a QuoteFilter, applied column-wise, or any other callable,
+    applied to each row still selected by criteria.
+    """
+    table = QuoteTable(quotes, amount=amount)
+    criteria = list(criteria)
+    if isinstance(filter_fn, QuoteFilter):
+        criteria.extend(filter_fn.criteria)
+        filter_fn = None
+
+    rows = table.select(criteria)
+    if filter_fn is not None:
+        rows = [i for i in rows if filter_fn(table.quotes[i])]
+    return table.take(table.order(sort_by, rows))
@@ -0,0 +1,222 @@
+"""
+Outbound rate governor for provider calls, shared by all workers through Redis.
+
+A provider with a budget has a token bucket holding up to ``burst`` calls and
+refilled at ``rate_per_second``. Every worker takes a token from the same bucket
+before calling the provider, so the budget holds for the whole cluster rather
+than per process. A call that finds the bucket empty is not made: the aggregator serves
+the provider's cached quote if there is one and otherwise fails fast with a
+rate_limited result, instead of sleeping inside a web worker.
+
+The budget adapts to the provider's answers. A result or error with error_code
+ERROR_CODE_RATE_LIMITED (an HTTP 429):
+
+- blocks the provider for its retry_after (the Retry-After header) seconds, or
+  default_retry_after_seconds when the provider gave none, budget or not;
+- halves the provider's rate, down to min_rate_factor of the configured rate.
+  The reduction lasts recovery_seconds after the last 429, then the configured
+  rate applies again.
+
+Taking a token runs as a Lua script on Redis, so it is atomic across workers.
+With a cache backend other than django-redis (tests, local development) every
+process keeps its own buckets. Budgets are configured with RATE_GOVERNOR_DEFAULTS
+and per provider class name with RATE_GOVERNOR_PROVIDERS, e.g.
+``{"PaysendProvider": {"rate_per_second": 2, "burst": 5}}``.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from providers.base.provider import ERROR_CODE_RATE_LIMITED
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GOVERNOR_CONFIG = {
+    "rate_per_second": None,  # Sustained calls per second across the cluster; None: no budget
+    "burst": 20,  # Calls that may be made at once after a quiet period
+    "default_retry_after_seconds": 5,  # Block after a 429 without Retry-After
+    "min_rate_factor": 0.1,  # Lowest fraction of the rate repeated 429s can reach
+    "recovery_seconds": 300,  # Time after the last 429 before the full rate returns
+}
+
+# KEYS[1]: bucket hash. ARGV: rate per second, burst, now (seconds).
+# Returns 1 and takes a token if one is available, 0 otherwise.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return allowed
+"""
+
+
+def get_governor_bucket_key(provider_name):
+    """Generate the Redis key of a provider's token bucket."""
+    return f"governor:{provider_name.upper()}:bucket"
+
+
+def get_governor_blocked_cache_key(provider_name):
+    """Generate the cache key set while a provider's Retry-After is running."""
+    return f"governor:{provider_name.upper()}:blocked"
+
+
+def get_governor_factor_cache_key(provider_name):
+    """Generate the cache key holding a provider's reduced rate factor."""
+    return f"governor:{provider_name.upper()}:factor"
+
+
+class _LocalBuckets:
+    """Per-process token buckets, for cache backends without Redis."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def take(self, key: str, rate: float, burst: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + max(0.0, now - ts) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+        return allowed
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class RateGovernor:
+    """
+    Registry of per-provider token buckets backed by Redis.
+
+    Args:
+        defaults: Configuration applied to every provider.
+        overrides: Per-provider configuration keyed by class name.
+    """
+
+    def __init__(
+        self,
+        defaults: Optional[Dict[str, Any]] = None,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.defaults = {**DEFAULT_GOVERNOR_CONFIG, **(defaults or {})}
+        self.overrides = overrides or {}
+        self._local = _LocalBuckets()
+        self._script = None
+        self._script_lock = threading.Lock()
+
+    def get_config(self, provider_name: str) -> Dict[str, Any]:
+        return {**self.defaults, **self.overrides.get(provider_name, {})}
+
+    def _get_script(self):
+        """The registered token bucket script, or None without django-redis."""
+        if self._script is None:
+            with self._script_lock:
+                if self._script is None:
+                    try:
+                        from django_redis import get_redis_connection
+
+                        self._script = get_redis_connection("default").register_script(
+                            TOKEN_BUCKET_SCRIPT
+                        )
+                    except Exception:
+                        # Not a django-redis cache: fall back to per-process buckets
+                        self._script = False
+        return self._script or None
+
+    def _take_token(self, provider_name: str, rate: float, burst: float) -> bool:
+        key = get_governor_bucket_key(provider_name)
+        script = self._get_script()
+        if script is None:
+            return self._local.take(key, rate, burst)
+        return bool(script(keys=[key], args=[rate, burst, time.time()]))
+
+    def acquire(self, provider_name: str) -> bool:
+        """Take a token for one call to the provider; False if the call must not be made."""
+        try:
+            config = self.get_config(provider_name)
+            blocked_key = get_governor_blocked_cache_key(provider_name)
+            factor_key = get_governor_factor_cache_key(provider_name)
+            state = cache.get_many([blocked_key, factor_key])
+            if state.get(blocked_key):
+                return False
+            if config["rate_per_second"] is None:
+                return True
+            rate = config["rate_per_second"] * state.get(factor_key, 1.0)
+            if self._take_token(provider_name, rate, config["burst"]):
+                return True
+            logger.info(f"Outbound budget for {provider_name} exhausted")
+            return False
+        except Exception as e:
+            # Never let the governor store take providers down with it
+            logger.warning(f"Rate governor unavailable for {provider_name}: {str(e)}")
+            return True
+
+    def throttle(self, provider_name: str, retry_after: Optional[float] = None):
+        """Back off after the provider answered 429, honouring its Retry-After."""
+        try:
+            config = self.get_config(provider_name)
+            if not retry_after or retry_after <= 0:
+                retry_after = config["default_retry_after_seconds"]
+            factor_key = get_governor_factor_cache_key(provider_name)
+            factor = max(config["min_rate_factor"], cache.get(factor_key, 1.0) / 2)
+
+            cache.set(
+                get_governor_blocked_cache_key(provider_name),
+                time.time() + retry_after,
+                timeout=max(1, int(retry_after + 0.5)),
+            )
+            cache.set(factor_key, factor, timeout=config["recovery_seconds"])
+            logger.warning(
+                f"{provider_name} is rate limiting us: blocked for {retry_after}s, "
+                f"rate reduced to {factor:.0%}"
+            )
+        except Exception as e:
+            logger.warning(f"Error recording rate limit for {provider_name}: {str(e)}")
+
+    def record(self, provider_name: str, result):
+        """Update the provider's budget from a fresh (not cached) result."""
+        if result and result.get("error_code") == ERROR_CODE_RATE_LIMITED:
+            self.throttle(provider_name, _as_seconds(result.get("retry_after")))
+
+    def record_batch(self, provider_name: str, results):
+        """Like record for the results of one batched call, backing off at most once."""
+        for result in results:
+            if result and result.get("error_code") == ERROR_CODE_RATE_LIMITED:
+                self.record(provider_name, result)
+                return
+
+    def record_error(self, provider_name: str, error: Exception):
+        """Update the provider's budget from an error raised by the provider."""
+        if getattr(error, "error_code", None) == ERROR_CODE_RATE_LIMITED:
+            self.throttle(provider_name, _as_seconds(getattr(error, "retry_after", None)))
+
+
+def _as_seconds(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+provider_governor = RateGovernor(
+    defaults=getattr(settings, "RATE_GOVERNOR_DEFAULTS", None),
+    overrides=getattr(settings, "RATE_GOVERNOR_PROVIDERS", None),
+)
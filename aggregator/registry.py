@@ -0,0 +1,255 @@
+"""
+Lazy registry of the providers the aggregator dispatches to.
+
+Providers are registered by class name with the dotted path of their class.
+A provider's module is imported and its instance built only the first time the
+aggregator actually dispatches to it, so importing the aggregator no longer
+pulls Selenium, Playwright, BeautifulSoup, the mapping tables and a live HTTP
+session per provider into every Django and Celery process.
+
+The time spent importing and instantiating each provider is recorded and can be
+printed with ``python manage.py provider_import_report``.
+
+Calls don't share the registry's instance: each call leases one from the
+provider's pool of warm instances (see aggregator.pool), seeded with it.
+"""
+import collections.abc
+import contextlib
+import importlib
+import logging
+import threading
+import time
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+from aggregator.pool import ProviderInstancePool
+
+logger = logging.getLogger(__name__)
+
+# Provider class name -> dotted path of the class, in dispatch order
+PROVIDER_PATHS = {
+    "XEProvider": "providers.xe.integration.XEProvider",
+    "RemitlyProvider": "providers.remitly.integration.RemitlyProvider",
+    "RIAProvider": "providers.ria.integration.RIAProvider",
+    "WiseProvider": "providers.wise.integration.WiseProvider",
+    "TransferGoProvider": "providers.transfergo.integration.TransferGoProvider",
+    "WesternUnionProvider": "providers.westernunion.integration.WesternUnionProvider",
+    "XoomProvider": "providers.xoom.integration.XoomProvider",
+    "SingXProvider": "providers.singx.integration.SingXProvider",
+    "PaysendProvider": "providers.paysend.integration.PaysendProvider",
+    "AlAnsariProvider": "providers.alansari.integration.AlAnsariProvider",
+    "RemitbeeProvider": "providers.remitbee.integration.RemitbeeProvider",
+    "InstaRemProvider": "providers.instarem.integration.InstaRemProvider",
+    "PangeaProvider": "providers.pangea.integration.PangeaProvider",
+    "KoronaPayProvider": "providers.koronapay.integration.KoronaPayProvider",
+    "MukuruProvider": "providers.mukuru.integration.MukuruProvider",
+    "RewireProvider": "providers.rewire.integration.RewireProvider",
+    "SendwaveProvider": "providers.sendwave.integration.SendwaveProvider",
+    "WireBarleyProvider": "providers.wirebarley.integration.WireBarleyProvider",
+    "OrbitRemitProvider": "providers.orbitremit.integration.OrbitRemitProvider",
+    "DahabshiilProvider": "providers.dahabshiil.integration.DahabshiilProvider",
+    "IntermexProvider": "providers.intermex.integration.IntermexProvider",
+    "PlacidProvider": "providers.placid.integration.PlacidProvider",
+    "RemitGuruProvider": "providers.remitguru.integration.RemitGuruProvider",
+}
+
+
+class ProviderRegistry:
+    """
+    Map provider names to dotted class paths and build instances on first use.
+
+    Args:
+        paths: Provider class name -> dotted path of the class.
+        pool_config: Instance pool settings applied to every provider (size,
+            checkout_timeout, max_age_seconds).
+        pool_overrides: Per-provider pool settings keyed by class name.
+    """
+
+    def __init__(
+        self,
+        paths: Dict[str, str],
+        pool_config: Optional[Dict[str, Any]] = None,
+        pool_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self._paths = dict(paths)
+        self._classes: Dict[str, type] = {}
+        self._instances: Dict[str, Any] = {}
+        self._pools: Dict[str, ProviderInstancePool] = {}
+        self._costs: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._name_locks = {name: threading.Lock() for name in self._paths}
+        self.pool_config = {"size": 4, "checkout_timeout": 30, **(pool_config or {})}
+        self.pool_overrides = pool_overrides or {}
+
+    def names(self) -> List[str]:
+        """Registered provider names, in dispatch order, without importing anything."""
+        return list(self._paths)
+
+    def get_class(self, name: str) -> type:
+        """Import and return the provider class registered under name."""
+        provider_class = self._classes.get(name)
+        if provider_class is None:
+            module_path, class_name = self._paths[name].rsplit(".", 1)
+            started = time.perf_counter()
+            module = importlib.import_module(module_path)
+            import_seconds = time.perf_counter() - started
+            provider_class = getattr(module, class_name)
+            with self._lock:
+                self._classes[name] = provider_class
+                self._costs.setdefault(name, {})["import_seconds"] = import_seconds
+            logger.info(f"Imported provider {name} in {import_seconds * 1000:.1f}ms")
+        return provider_class
+
+    def get(self, name: str) -> Any:
+        """Return the shared instance of a provider, building it on first use."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        # One lock per provider so a slow constructor doesn't block the others
+        with self._name_locks[name]:
+            instance = self._instances.get(name)
+            if instance is None:
+                provider_class = self.get_class(name)
+                started = time.perf_counter()
+                instance = provider_class()
+                init_seconds = time.perf_counter() - started
+                with self._lock:
+                    self._instances[name] = instance
+                    self._costs.setdefault(name, {})["init_seconds"] = init_seconds
+                logger.info(f"Instantiated provider {name} in {init_seconds * 1000:.1f}ms")
+        return instance
+
+    def all(self) -> List[Any]:
+        """
+        Instances of every registered provider. Imports and builds all of them.
+
+        A provider that fails to load is logged and left out, so one broken provider
+        doesn't take the others down with it.
+        """
+        instances = []
+        for name in self._paths:
+            try:
+                instances.append(self.get(name))
+            except Exception as e:
+                logger.exception(f"Could not load provider {name}: {str(e)}")
+        return instances
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def get_pool(self, name: str) -> ProviderInstancePool:
+        """Return the instance pool of a provider, seeded with its shared instance."""
+        pool = self._pools.get(name)
+        if pool is None:
+            seed = self.get(name)
+            config = {**self.pool_config, **self.pool_overrides.get(name, {})}
+            with self._lock:
+                pool = self._pools.get(name)
+                if pool is None:
+                    pool = self._pools[name] = ProviderInstancePool(
+                        name,
+                        self.get_class(name),
+                        max_size=config["size"],
+                        checkout_timeout=config["checkout_timeout"],
+                        max_age_seconds=config.get("max_age_seconds"),
+                        seed=seed,
+                    )
+        return pool
+
+    def lease(self, provider: Any) -> ContextManager[Any]:
+        """
+        Lease a pooled instance of the provider for one call.
+
+        Instances this registry doesn't own (e.g. test doubles) are used as they are.
+        """
+        name = provider.__class__.__name__
+        if self._instances.get(name) is not provider:
+            return contextlib.nullcontext(provider)
+        return self.get_pool(name).lease()
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Size and usage of every pool created so far."""
+        with self._lock:
+            pools = dict(self._pools)
+        return {name: pool.stats() for name, pool in pools.items()}
+
+    def import_report(self) -> List[Dict[str, Any]]:
+        """Import and instantiation cost of every provider loaded so far, costliest first."""
+        with self._lock:
+            report = [
+                {
+                    "provider": name,
+                    "path": self._paths[name],
+                    "import_seconds": costs.get("import_seconds"),
+                    "init_seconds": costs.get("init_seconds"),
+                }
+                for name, costs in self._costs.items()
+            ]
+        return sorted(report, key=lambda r: r["import_seconds"] or 0, reverse=True)
+
+
+class ProviderList(collections.abc.Sequence):
+    """
+    Every provider instance of a registry, built on first access.
+
+    Merely reading the attribute (as monkeypatch.setattr does before replacing it)
+    builds nothing; iterating, indexing or taking the length builds them all.
+    """
+
+    def __init__(self, registry: ProviderRegistry):
+        self.registry = registry
+        self._instances: Optional[List[Any]] = None
+
+    def _load(self) -> List[Any]:
+        if self._instances is None:
+            self._instances = self.registry.all()
+        return self._instances
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._load())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"ProviderList({self.registry.names()})"
+
+
+class LazyProviderList:
+    """
+    Class attribute that resolves to every provider instance of a registry.
+
+    Keeps ``Aggregator.PROVIDERS`` working for code that iterates all providers,
+    while the aggregator itself dispatches by name and loads only what it calls.
+    """
+
+    def __init__(self, registry: ProviderRegistry):
+        self.registry = registry
+
+    def __get__(self, instance, owner) -> ProviderList:
+        return ProviderList(self.registry)
+
+
+provider_registry = ProviderRegistry(
+    PROVIDER_PATHS,
+    pool_config={
+        "size": getattr(
+            settings,
+            "AGGREGATOR_PROVIDER_POOL_SIZE",
+            getattr(settings, "AGGREGATOR_PROVIDER_LANE_SIZE", 4),
+        ),
+        "checkout_timeout": getattr(settings, "AGGREGATOR_PROVIDER_POOL_CHECKOUT_TIMEOUT", 30),
+        "max_age_seconds": getattr(settings, "AGGREGATOR_PROVIDER_POOL_MAX_AGE", None),
+    },
+    pool_overrides=getattr(settings, "AGGREGATOR_PROVIDER_POOLS", None),
+)
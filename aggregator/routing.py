@@ -0,0 +1,136 @@
+"""
+Corridor routing index for the aggregator.
+
+Some providers ship static knowledge of the corridors they serve. The index
+is built once from those rules and answers, per corridor, which of the restricted
+providers can serve it as a bitset, so the aggregator only dispatches to
+providers that can actually quote. Providers without a rule are always
+dispatched. A rule that raises counts as "supported", so a broken mapping
+never hides a provider.
+"""
+import functools
+import logging
+from typing import Callable, Dict, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (source_country, dest_country, source_currency, dest_currency) -> bool
+CorridorRule = Callable[[str, str, str, str], bool]
+
+
+# Rules import their provider's mapping module on first use, so building the index
+# doesn't import any provider code.
+
+
+def _transfergo_supports(source_country, dest_country, source_currency, dest_currency):
+    from providers.transfergo.transfergo_mappings import is_corridor_supported
+
+    return is_corridor_supported(source_country, source_currency, dest_country, dest_currency)
+
+
+def _westernunion_supports(source_country, dest_country, source_currency, dest_currency):
+    from providers.westernunion.westernunion_mappings import is_corridor_supported
+
+    return is_corridor_supported(source_country, dest_country, source_currency, dest_currency)
+
+
+def _sendwave_supports(source_country, dest_country, source_currency, dest_currency):
+    from providers.sendwave.sendwave_mappings import is_corridor_supported
+    from providers.utils.country_currency_standards import normalize_country_code
+
+    return is_corridor_supported(source_currency, normalize_country_code(dest_country))
+
+
+def _singx_supports(source_country, dest_country, source_currency, dest_currency):
+    from providers.singx.singx_mappings import is_corridor_supported
+
+    return is_corridor_supported(source_country, source_currency, dest_country, dest_currency)
+
+
+def _xe_supports(source_country, dest_country, source_currency, dest_currency):
+    from providers.xe.currency_mapping import is_xe_corridor_supported
+
+    return is_xe_corridor_supported(source_currency, dest_country)
+
+
+def _orbitremit_supports(source_country, dest_country, source_currency, dest_currency):
+    from providers.orbitremit.integration import OrbitRemitProvider
+
+    # Mirrors the checks at the top of OrbitRemitProvider.get_quote
+    if source_currency not in OrbitRemitProvider.SUPPORTED_SOURCE_CURRENCIES:
+        return False
+    supported = OrbitRemitProvider.SUPPORTED_CORRIDORS.get(source_currency)
+    return supported is None or dest_currency in supported
+
+
+CORRIDOR_RULES: Dict[str, CorridorRule] = {
+    "TransferGoProvider": _transfergo_supports,
+    "WesternUnionProvider": _westernunion_supports,
+    "SendwaveProvider": _sendwave_supports,
+    "SingXProvider": _singx_supports,
+    "XEProvider": _xe_supports,
+    "OrbitRemitProvider": _orbitremit_supports,
+}
+
+
+class CorridorRoutingIndex:
+    """
+    Map corridors to the providers that can serve them.
+
+    Each restricted provider is assigned one bit. The mask of a corridor is
+    computed from the rules on first lookup and memoized, so repeated lookups
+    for a corridor are a single dict hit.
+
+    Args:
+        provider_names: Class names of the registered providers, in dispatch order.
+        rules: Corridor rule per provider class name. Providers without a rule
+            are never filtered out.
+        max_corridors: Number of corridor masks kept in memory.
+    """
+
+    def __init__(
+        self,
+        provider_names: Iterable[str],
+        rules: Dict[str, CorridorRule],
+        max_corridors: int = 4096,
+    ):
+        restricted = [name for name in provider_names if name in rules]
+        self._bits = {name: 1 << i for i, name in enumerate(restricted)}
+        self._rules: Tuple[Tuple[int, str, CorridorRule], ...] = tuple(
+            (self._bits[name], name, rules[name]) for name in restricted
+        )
+        self.mask_for = functools.lru_cache(maxsize=max_corridors)(self._compute_mask)
+
+    def _compute_mask(
+        self, source_country: str, dest_country: str, source_currency: str, dest_currency: str
+    ) -> int:
+        mask = 0
+        for bit, name, rule in self._rules:
+            try:
+                supported = rule(source_country, dest_country, source_currency, dest_currency)
+            except Exception as e:
+                logger.warning(f"Corridor rule for {name} failed, dispatching anyway: {e}")
+                supported = True
+            if supported:
+                mask |= bit
+        return mask
+
+    def supports(
+        self,
+        provider_name: str,
+        source_country: str,
+        dest_country: str,
+        source_currency: str,
+        dest_currency: str,
+    ) -> bool:
+        """Whether provider_name should be called for the corridor."""
+        bit = self._bits.get(provider_name)
+        if bit is None:
+            return True
+        mask = self.mask_for(
+            source_country.upper(),
+            dest_country.upper(),
+            source_currency.upper(),
+            dest_currency.upper(),
+        )
+        return bool(mask & bit)
@@ -0,0 +1,115 @@
+"""
+Fair scheduling of a large batch of provider calls.
+
+A bulk request can need hundreds of provider calls. Submitting them all at once
+would overflow the providers' lanes (see aggregator.executor), and the providers
+that serve the most corridors would crowd out the rest. The scheduler keeps one
+queue of calls per provider and admits them round-robin across providers, with
+at most ``max_in_flight`` calls running in total and at most the provider's
+limit (its lane size by default) running per provider. Every provider makes
+progress at the same pace, and waiting calls wait in the scheduler instead of in
+the lane queues that interactive requests share.
+"""
+import collections
+import concurrent.futures
+import logging
+import time
+from typing import Any, Callable, Deque, Dict, Hashable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FairScheduler:
+    """
+    Run queued calls round-robin across providers under a global concurrency limit.
+
+    Args:
+        max_in_flight: Most calls running at once, across all providers.
+        provider_limit: Most calls running at once for a provider, by class name.
+    """
+
+    def __init__(self, max_in_flight: int, provider_limit: Callable[[str], int]):
+        self.max_in_flight = max(1, max_in_flight)
+        self.provider_limit = provider_limit
+        self._queues: Dict[str, Deque[Tuple[Hashable, Callable[[], Any]]]] = {}
+        self._ring: Deque[str] = collections.deque()
+        self._running: Dict[str, int] = collections.defaultdict(int)
+        self._in_flight: Dict[concurrent.futures.Future, Tuple[str, Hashable]] = {}
+        self.peak_in_flight = 0
+
+    def add(self, provider_name: str, key: Hashable, submit: Callable[[], Any]):
+        """
+        Queue a call. submit starts it and returns its Future (e.g. a lane submit).
+        """
+        queue = self._queues.get(provider_name)
+        if queue is None:
+            queue = self._queues[provider_name] = collections.deque()
+        if not queue:
+            self._ring.append(provider_name)
+        queue.append((key, submit))
+
+    def _fill(self):
+        """Start queued calls, one provider at a time, until a limit is reached."""
+        skipped = 0
+        while self._ring and skipped < len(self._ring):
+            if len(self._in_flight) >= self.max_in_flight:
+                return
+            provider_name = self._ring[0]
+            self._ring.rotate(-1)
+            if self._running[provider_name] >= max(1, self.provider_limit(provider_name)):
+                skipped += 1
+                continue
+
+            skipped = 0
+            queue = self._queues[provider_name]
+            key, submit = queue.popleft()
+            if not queue:
+                # The provider was just rotated to the end of the ring
+                self._ring.pop()
+            self._in_flight[submit()] = (provider_name, key)
+            self._running[provider_name] += 1
+            self.peak_in_flight = max(self.peak_in_flight, len(self._in_flight))
+
+    def run(self, timeout: float) -> Tuple[Dict[Hashable, Any], List[Hashable]]:
+        """
+        Run every queued call, or as many as finish within timeout seconds.
+
+        Returns:
+            (results, unfinished): the result of each finished call by key (the
+            exception for calls that raised), and the keys of calls that were still
+            running or never started at the deadline. Those are cancelled if queued.
+        """
+        deadline = time.monotonic() + timeout
+        results: Dict[Hashable, Any] = {}
+        try:
+            self._fill()
+            while self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, _ = concurrent.futures.wait(
+                    self._in_flight,
+                    timeout=remaining,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    provider_name, key = self._in_flight.pop(future)
+                    self._running[provider_name] -= 1
+                    try:
+                        results[key] = future.result()
+                    except Exception as exc:
+                        logger.error(f"Provider {provider_name} generated an exception: {exc}")
+                        results[key] = exc
+                self._fill()
+        finally:
+            for future in self._in_flight:
+                future.cancel()
+
+        unfinished = [key for _, key in self._in_flight.values()]
+        for queue in self._queues.values():
+            unfinished.extend(key for key, _ in queue)
+        if unfinished:
+            logger.warning(
+                f"Deadline of {timeout}s reached with {len(unfinished)} calls unfinished"
+            )
+        return results, unfinished
@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+"""
+Offline throughput benchmark for Aggregator.get_all_quotes.
+
+Swaps Aggregator.PROVIDERS for simulated providers with configurable latency
+distributions, failure and timeout rates, then drives get_all_quotes from
+several client threads at a time. For every concurrency level it reports the
+p50/p95/p99 request latency, throughput, the peak number of threads in the
+process and of busy provider lane threads, and the outcome of every provider
+result. No provider site is called.
+
+Each run is saved as JSON under aggregator/tests/results
+(benchmark_<profile>_<timestamp>.json, with the git revision) and compared
+with the previous run of the same profile.
+
+Usage:
+    python aggregator/tests/benchmark.py [--profile mixed] [--levels 1,4,16,64]
+        [--requests 100] [--timeout 2] [--redis] [--no-save]
+
+By default the Django caches are replaced with in-process ones, so circuit
+breakers, negative caches and rate budgets start empty for every level and no
+Redis is needed. --redis keeps the configured caches (and their state).
+"""
+
+import argparse
+import concurrent.futures
+import datetime
+import glob
+import json
+import logging
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from decimal import Decimal
+
+from tabulate import tabulate
+
+# Add the parent directory to path to allow imports
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+CORRIDOR = ("US", "MX", "USD", "MXN", Decimal("1000.00"))
+
+# Simulated provider sets: provider_id -> latency median and p99 in milliseconds,
+# share of calls that fail, and share of calls that hang past the deadline
+PROFILES = {
+    "healthy": {
+        f"sim{i}": {"median_ms": 150, "p99_ms": 400, "failure_rate": 0, "timeout_rate": 0}
+        for i in range(10)
+    },
+    "mixed": {
+        **{
+            f"fast{i}": {"median_ms": 120, "p99_ms": 350, "failure_rate": 0.01, "timeout_rate": 0}
+            for i in range(6)
+        },
+        "tail1": {"median_ms": 400, "p99_ms": 2500, "failure_rate": 0.02, "timeout_rate": 0},
+        "tail2": {"median_ms": 600, "p99_ms": 1800, "failure_rate": 0.05, "timeout_rate": 0.01},
+        "flaky": {"median_ms": 200, "p99_ms": 800, "failure_rate": 0.2, "timeout_rate": 0},
+        "hanging": {"median_ms": 300, "p99_ms": 900, "failure_rate": 0, "timeout_rate": 0.1},
+    },
+    "degraded": {
+        **{
+            f"fast{i}": {"median_ms": 150, "p99_ms": 500, "failure_rate": 0.02, "timeout_rate": 0}
+            for i in range(8)
+        },
+        "down": {"median_ms": 50, "p99_ms": 100, "failure_rate": 1, "timeout_rate": 0},
+        "stuck": {"median_ms": 1000, "p99_ms": 3000, "failure_rate": 0, "timeout_rate": 0.5},
+    },
+}
+
+
+class SimulatedProvider:
+    """
+    Provider answering after a log-normally distributed delay.
+
+    Args:
+        provider_id: Identifier reported in quotes.
+        median_ms: Median latency.
+        p99_ms: 99th percentile latency.
+        failure_rate: Share of calls that raise after their delay.
+        timeout_rate: Share of calls that hang for hang_seconds.
+        hang_seconds: How long a hanging call blocks its lane thread.
+        seed: Seed of the provider's random generator, for repeatable runs.
+    """
+
+    def __init__(
+        self,
+        provider_id,
+        median_ms,
+        p99_ms,
+        failure_rate=0.0,
+        timeout_rate=0.0,
+        hang_seconds=10.0,
+        seed=0,
+    ):
+        self.provider_id = provider_id
+        self.mu = math.log(median_ms / 1000)
+        # z of the 99th percentile of the standard normal distribution
+        self.sigma = max(0.0, math.log(p99_ms / median_ms) / 2.326)
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def get_quote(self, amount, **kwargs):
+        with self._lock:
+            delay = self._random.lognormvariate(self.mu, self.sigma)
+            roll = self._random.random()
+            rate = 17.0 + self._random.random()
+        if roll < self.timeout_rate:
+            time.sleep(self.hang_seconds)
+        else:
+            time.sleep(delay)
+        if roll >= 1 - self.failure_rate:
+            raise RuntimeError(f"{self.provider_id} simulated failure")
+        return {
+            "success": True,
+            "provider_id": self.provider_id,
+            "exchange_rate": rate,
+            "fee": 2.99,
+            "send_amount": float(amount),
+            "delivery_time_minutes": 60,
+        }
+
+
+def build_providers(profile, hang_seconds):
+    """
+    One simulated provider per entry of the profile.
+
+    Each gets a class of its own, since lanes, pools, circuit breakers and rate
+    budgets are keyed by provider class name, as they would be for real providers.
+    """
+    providers = []
+    for seed, (provider_id, config) in enumerate(sorted(PROFILES[profile].items())):
+        cls = type(f"Simulated{provider_id.title()}Provider", (SimulatedProvider,), {})
+        providers.append(cls(provider_id, **config, hang_seconds=hang_seconds, seed=seed))
+    return providers
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a sorted list."""
+    if not samples:
+        return None
+    return samples[max(0, math.ceil(pct / 100 * len(samples)) - 1)]
+
+
+class ThreadSampler:
+    """Track the peak thread counts while a level runs."""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak_threads = 0
+        self.peak_busy_lane_threads = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        from aggregator.executor import get_provider_executor
+
+        while not self._stop.is_set():
+            lanes = get_provider_executor().stats()
+            busy = sum(lane["active"] for lane in lanes.values())
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            self.peak_busy_lane_threads = max(self.peak_busy_lane_threads, busy)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def outcome(result):
+    if result.get("success"):
+        return "success"
+    for flag in ("timed_out", "circuit_open", "rate_limited"):
+        if result.get(flag):
+            return flag
+    return "failed"
+
+
+def run_level(concurrency, requests, timeout, reset_cache):
+    """Issue requests calls of get_all_quotes, concurrency at a time."""
+    from django.core.cache import cache
+
+    from aggregator.aggregator import Aggregator
+    from aggregator.executor import get_provider_executor
+
+    if reset_cache:
+        cache.clear()
+    rejected_before = sum(lane["rejected"] for lane in get_provider_executor().stats().values())
+
+    def one_request():
+        started = time.perf_counter()
+        result = Aggregator.get_all_quotes(*CORRIDOR, use_cache=False, timeout=timeout)
+        return time.perf_counter() - started, result
+
+    latencies = []
+    outcomes = {}
+    with ThreadSampler() as sampler:
+        started = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as clients:
+            for seconds, result in clients.map(lambda _: one_request(), range(requests)):
+                latencies.append(seconds)
+                for provider_result in result["all_results"]:
+                    key = outcome(provider_result)
+                    outcomes[key] = outcomes.get(key, 0) + 1
+        elapsed = time.perf_counter() - started
+
+    rejected = (
+        sum(lane["rejected"] for lane in get_provider_executor().stats().values())
+        - rejected_before
+    )
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 1),
+        "throughput_rps": round(requests / elapsed, 2),
+        "peak_threads": sampler.peak_threads,
+        "peak_busy_lane_threads": sampler.peak_busy_lane_threads,
+        "lane_rejections": rejected,
+        "outcomes": outcomes,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=parent_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def previous_run(profile):
+    """The most recent saved run of the profile, or None."""
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, f"benchmark_{profile}_*.json")))
+    if not paths:
+        return None
+    with open(paths[-1]) as f:
+        return json.load(f)
+
+
+def save_run(run):
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(RESULTS_DIR, f"benchmark_{run['profile']}_{stamp}.json")
+    with open(path, "w") as f:
+        json.dump(run, f, indent=2, sort_keys=True)
+    return path
+
+
+def print_report(run, previous):
+    baseline = {}
+    if previous:
+        baseline = {level["concurrency"]: level for level in previous["levels"]}
+
+    def delta(level, key):
+        before = baseline.get(level["concurrency"], {}).get(key)
+        if not before:
+            return ""
+        return f"{(level[key] - before) / before:+.0%}"
+
+    rows = [
+        [
+            level["concurrency"],
+            level["p50_ms"],
+            level["p95_ms"],
+            delta(level, "p95_ms"),
+            level["p99_ms"],
+            level["throughput_rps"],
+            delta(level, "throughput_rps"),
+            level["peak_threads"],
+            level["peak_busy_lane_threads"],
+            level["lane_rejections"],
+            ", ".join(f"{k}={v}" for k, v in sorted(level["outcomes"].items())),
+        ]
+        for level in run["levels"]
+    ]
+    headers = [
+        "Clients",
+        "p50 ms",
+        "p95 ms",
+        "Δ p95",
+        "p99 ms",
+        "req/s",
+        "Δ req/s",
+        "Threads",
+        "Busy lanes",
+        "Rejected",
+        "Provider results",
+    ]
+    print(f"\nProfile {run['profile']} at {run['revision'] or 'unknown revision'}")
+    if previous:
+        print(f"Compared with {previous['revision']} ({previous['timestamp']})")
+    print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed")
+    parser.add_argument("--levels", default="1,4,16,64", help="Comma-separated client counts")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per level")
+    parser.add_argument("--timeout", type=float, default=2.0, help="get_all_quotes deadline")
+    parser.add_argument(
+        "--hang", type=float, default=6.0, help="Seconds a hanging provider call blocks"
+    )
+    parser.add_argument("--redis", action="store_true", help="Use the configured caches")
+    parser.add_argument("--no-save", action="store_true", help="Don't save the run")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "remit_scout.settings")
+    import django
+    from django.conf import settings
+
+    if not args.redis:
+        settings.CACHES = {
+            alias: {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": f"benchmark-{alias}",
+            }
+            for alias in settings.CACHES
+        }
+    django.setup()
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("aggregator").setLevel(logging.ERROR)
+
+    from aggregator.aggregator import Aggregator
+
+    Aggregator.PROVIDERS = build_providers(args.profile, args.hang)
+
+    levels = []
+    for concurrency in (int(level) for level in args.levels.split(",")):
+        print(f"Running {args.requests} requests with {concurrency} clients...")
+        levels.append(run_level(concurrency, args.requests, args.timeout, not args.redis))
+
+    run = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "revision": git_revision(),
+        "profile": args.profile,
+        "providers": PROFILES[args.profile],
+        "timeout": args.timeout,
+        "hang_seconds": args.hang,
+        "cache": "configured" if args.redis else "locmem",
+        "levels": levels,
+    }
+    previous = previous_run(args.profile)
+    print_report(run, previous)
+    if not args.no_save:
+        print(f"\nSaved to {save_run(run)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Offline tests for Aggregator.get_quotes_for_amounts.
+"""
+
+from decimal import Decimal
+
+from aggregator.aggregator import Aggregator
+
+
+class TieredFakeProvider:
+    """Amount-independent pricing: one fetch serves every amount."""
+
+    provider_id = "tiered"
+
+    def __init__(self):
+        self.fetches = 0
+
+    def get_quote(self, **kwargs):
+        return self.get_quotes_for_amounts([kwargs["amount"]])[0]
+
+    def get_quotes_for_amounts(self, amounts, **kwargs):
+        self.fetches += 1
+        return [
+            {
+                "success": True,
+                "provider_id": self.provider_id,
+                "exchange_rate": 17.0 if amount < 1000 else 17.5,
+                "fee": 2.0,
+            }
+            for amount in amounts
+        ]
+
+
+class PerAmountFakeProvider:
+    provider_id = "per-amount"
+
+    def __init__(self):
+        self.calls = []
+
+    def get_quote(self, amount, **kwargs):
+        self.calls.append(amount)
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.2}
+
+
+def test_one_fan_out_returns_a_matrix(monkeypatch):
+    tiered, per_amount = TieredFakeProvider(), PerAmountFakeProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [tiered, per_amount])
+
+    result = Aggregator.get_quotes_for_amounts(
+        "US", "MX", "USD", "MXN", [Decimal("100"), Decimal("1000"), Decimal("100")], use_cache=False
+    )
+
+    assert result["amounts"] == [100.0, 1000.0]
+    assert tiered.fetches == 1
+    assert sorted(per_amount.calls) == [Decimal("100"), Decimal("1000")]
+    assert result["provider_calls"] == 3
+
+    assert [q["exchange_rate"] for q in result["matrix"]["tiered"]] == [17.0, 17.5]
+    assert [q["provider_id"] for q in result["results"][0]] == ["per-amount", "tiered"]
+    assert [q["provider_id"] for q in result["results"][1]] == ["tiered", "per-amount"]
@@ -0,0 +1,204 @@
+"""
+Offline tests for Aggregator.aget_all_quotes.
+
+These use in-process fake providers instead of live provider sites, so they
+exercise only the fan-out engine: native coroutines, blocking providers
+offloaded to the shared pool, and the response shape.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+from aggregator.aggregator import Aggregator
+from aggregator.registry import LazyProviderList, ProviderRegistry
+
+
+class BlockingFakeProvider:
+    """Provider that blocks its thread like a requests-based integration."""
+
+    def __init__(self, provider_id, rate, delay=0.05, fail=False):
+        self.provider_id = provider_id
+        self.rate = rate
+        self.delay = delay
+        self.fail = fail
+
+    def get_quote(self, **kwargs):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return {
+            "success": True,
+            "provider_id": self.provider_id,
+            "exchange_rate": self.rate,
+            "fee": 1.0,
+            "delivery_time_minutes": 60,
+        }
+
+
+class NativeFakeProvider(BlockingFakeProvider):
+    """Provider that implements the native aget_quote coroutine."""
+
+    async def aget_quote(self, **kwargs):
+        await asyncio.sleep(self.delay)
+        return {
+            "success": True,
+            "provider_id": self.provider_id,
+            "exchange_rate": self.rate,
+            "fee": 0.5,
+            "delivery_time_minutes": 10,
+        }
+
+
+class PooledNativeProvider(NativeFakeProvider):
+    """Native provider built by a registry; records the instance serving each call."""
+
+    served_by = []
+
+    def __init__(self):
+        super().__init__("pooled-native", 17.2, delay=0.1)
+
+    async def aget_quote(self, **kwargs):
+        PooledNativeProvider.served_by.append(self)
+        return await super().aget_quote(**kwargs)
+
+
+def _run(**kwargs):
+    return asyncio.run(
+        Aggregator.aget_all_quotes(
+            source_country="US",
+            dest_country="MX",
+            source_currency="USD",
+            dest_currency="MXN",
+            amount=Decimal("100"),
+            use_cache=False,
+            **kwargs,
+        )
+    )
+
+
+def test_same_shape_as_sync(monkeypatch):
+    monkeypatch.setattr(
+        Aggregator,
+        "PROVIDERS",
+        [
+            BlockingFakeProvider("slow", 17.1),
+            NativeFakeProvider("native", 17.3),
+            BlockingFakeProvider("broken", 0, fail=True),
+        ],
+    )
+
+    result = _run()
+    sync_result = Aggregator.get_all_quotes(
+        source_country="US",
+        dest_country="MX",
+        source_currency="USD",
+        dest_currency="MXN",
+        amount=Decimal("100"),
+        use_cache=False,
+    )
+
+    assert set(result) == set(sync_result)
+    assert [q["provider_id"] for q in result["results"]] == ["native", "slow"]
+    assert len(result["all_results"]) == 3
+    assert result["providers_called"] == 3
+    assert result["successful_providers"] == 2
+
+
+def test_concurrent_comparisons_share_one_loop(monkeypatch):
+    monkeypatch.setattr(
+        Aggregator,
+        "PROVIDERS",
+        [NativeFakeProvider(f"native-{i}", 17.0 + i, delay=0.2) for i in range(5)],
+    )
+
+    async def fan_out():
+        return await asyncio.gather(
+            *[
+                Aggregator.aget_all_quotes(
+                    source_country="US",
+                    dest_country="MX",
+                    source_currency="USD",
+                    dest_currency="MXN",
+                    amount=Decimal(i + 1),
+                    use_cache=False,
+                )
+                for i in range(100)
+            ]
+        )
+
+    start = time.time()
+    results = asyncio.run(fan_out())
+    elapsed = time.time() - start
+
+    assert all(r["successful_providers"] == 5 for r in results)
+    # 500 provider calls at 0.2s each finish in roughly one provider latency
+    assert elapsed < 2
+
+
+def test_deadline_returns_partial_results(monkeypatch):
+    monkeypatch.setattr(
+        Aggregator,
+        "PROVIDERS",
+        [
+            NativeFakeProvider("fast-native", 17.3),
+            BlockingFakeProvider("fast", 17.1),
+            NativeFakeProvider("stuck-native", 17.5, delay=5),
+            BlockingFakeProvider("stuck", 17.6, delay=5),
+        ],
+    )
+
+    start = time.time()
+    result = _run(timeout=0.5)
+    sync_result = Aggregator.get_all_quotes(
+        source_country="US",
+        dest_country="MX",
+        source_currency="USD",
+        dest_currency="MXN",
+        amount=Decimal("100"),
+        use_cache=False,
+        timeout=0.5,
+    )
+    elapsed = time.time() - start
+
+    # Neither engine waits for the stuck providers
+    assert elapsed < 2
+    assert [q["provider_id"] for q in result["results"]] == ["fast-native", "fast"]
+    assert sorted(result["timed_out_providers"]) == ["stuck", "stuck-native"]
+    assert len(result["all_results"]) == 4
+    assert [q["provider_id"] for q in sync_result["results"]] == ["fast-native", "fast"]
+    assert sorted(sync_result["timed_out_providers"]) == ["stuck", "stuck-native"]
+    assert all(
+        r["timed_out"] for r in sync_result["all_results"] if r["provider_id"].startswith("stuck")
+    )
+
+
+def test_native_calls_lease_their_own_pooled_instance(monkeypatch):
+    registry = ProviderRegistry(
+        {"PooledNativeProvider": "aggregator.tests.test_async_fanout.PooledNativeProvider"}
+    )
+    monkeypatch.setattr(Aggregator, "PROVIDERS", LazyProviderList(registry))
+    PooledNativeProvider.served_by = []
+    shared = registry.get("PooledNativeProvider")
+
+    async def fan_out():
+        return await asyncio.gather(
+            *[
+                Aggregator._acall_provider(
+                    shared, "US", "MX", "USD", "MXN", Decimal("100"), use_cache=False
+                )
+                for _ in range(3)
+            ]
+        )
+
+    results = asyncio.run(fan_out())
+
+    assert all(result["success"] for result in results)
+    # Concurrent calls never await on the same instance
+    assert len({id(instance) for instance in PooledNativeProvider.served_by}) == 3
+    assert registry.pool_stats()["PooledNativeProvider"] == {
+        "size": 3,
+        "idle": 3,
+        "in_use": 0,
+        "max_size": 4,
+    }
@@ -0,0 +1,136 @@
+"""
+Offline tests for Aggregator.get_quotes_bulk and the fair scheduler behind it.
+"""
+
+import concurrent.futures
+import threading
+import time
+from decimal import Decimal
+
+from aggregator.aggregator import Aggregator
+from aggregator.scheduler import FairScheduler
+
+
+class CountingFakeProvider:
+    provider_id = "counting"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_quote(self, amount, source_country, dest_country, **kwargs):
+        with self._lock:
+            self.calls.append((source_country, dest_country, amount))
+        time.sleep(self.delay)
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+class BatchFakeProvider:
+    provider_id = "batch"
+
+    def __init__(self):
+        self.batches = []
+
+    def get_quote(self, **kwargs):
+        return self.get_quotes_for_amounts([kwargs["amount"]])[0]
+
+    def get_quotes_for_amounts(self, amounts, **kwargs):
+        self.batches.append(list(amounts))
+        return [
+            {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.5}
+            for amount in amounts
+        ]
+
+
+def _item(item_id, dest_country, amount):
+    return {
+        "id": item_id,
+        "source_country": "US",
+        "dest_country": dest_country,
+        "source_currency": "USD",
+        "dest_currency": "MXN",
+        "amount": amount,
+    }
+
+
+def test_identical_calls_are_made_once(monkeypatch):
+    counting, batch = CountingFakeProvider(), BatchFakeProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [counting, batch])
+
+    items = [
+        _item("a", "MX", 100),
+        _item("b", "MX", 100),
+        _item("c", "mx", 500),
+        _item("d", "GT", 100),
+    ]
+    result = Aggregator.get_quotes_bulk(items, use_cache=False, timeout=5)
+
+    assert sorted(counting.calls) == [
+        ("US", "GT", Decimal("100")),
+        ("US", "MX", Decimal("100")),
+        ("US", "MX", Decimal("500")),
+    ]
+    assert sorted(batch.batches) == [[Decimal("100")], [Decimal("100"), Decimal("500")]]
+    assert result["provider_calls"] == 5
+    assert result["requested_provider_calls"] == 8
+
+    assert set(result["items"]) == {"a", "b", "c", "d"}
+    assert result["items"]["c"]["dest_country"] == "MX"
+    assert [q["provider_id"] for q in result["items"]["a"]["results"]] == ["batch", "counting"]
+    assert result["items"]["a"]["results"] == result["items"]["b"]["results"]
+
+
+def test_unfinished_calls_are_reported_as_timed_out(monkeypatch):
+    slow = CountingFakeProvider(delay=0.5)
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [slow])
+
+    result = Aggregator.get_quotes_bulk([_item("a", "MX", 100)], use_cache=False, timeout=0.1)
+
+    assert result["success"] is False
+    assert result["timed_out_calls"] == 1
+    assert result["items"]["a"]["timed_out_providers"] == ["counting"]
+
+
+def test_calls_that_raise_are_reported_as_errors(monkeypatch):
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [CountingFakeProvider()])
+
+    def broken_call(cls, *args, **kwargs):
+        raise RuntimeError("lane crashed")
+
+    monkeypatch.setattr(Aggregator, "_call_provider", classmethod(broken_call))
+
+    result = Aggregator.get_quotes_bulk([_item("a", "MX", 100)], use_cache=False, timeout=5)
+
+    (error,) = result["items"]["a"]["all_results"]
+    assert error["success"] is False
+    assert error["provider_id"] == "counting"
+    assert error["error_message"] == "Exception: lane crashed"
+
+
+def test_scheduler_takes_turns_across_providers_within_limits():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+    started = []
+    release = threading.Event()
+
+    def call(name):
+        started.append(name)
+        release.wait(1)
+        return name
+
+    scheduler = FairScheduler(max_in_flight=3, provider_limit=lambda name: 2)
+    for i in range(6):
+        scheduler.add("Busy", ("Busy", i), lambda: executor.submit(call, "Busy"))
+    scheduler.add("Quiet", ("Quiet", 0), lambda: executor.submit(call, "Quiet"))
+
+    try:
+        threading.Timer(0.1, release.set).start()
+        results, unfinished = scheduler.run(timeout=5)
+    finally:
+        executor.shutdown()
+
+    # The provider with one call isn't queued behind the busy one
+    assert started[:3].count("Quiet") == 1
+    assert scheduler.peak_in_flight == 3
+    assert len(results) == 7
+    assert unfinished == []
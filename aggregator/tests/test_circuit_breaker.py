@@ -0,0 +1,100 @@
+"""
+Offline tests for the provider circuit breakers.
+"""
+
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator
+from aggregator.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    get_circuit_state_cache_key,
+    provider_breakers,
+)
+
+
+class FlakyProvider:
+    provider_id = "flaky"
+
+    def __init__(self):
+        self.calls = 0
+        self.down = True
+
+    def get_quote(self, **kwargs):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("provider down")
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+def _quote():
+    return Aggregator.get_all_quotes("US", "MX", "USD", "MXN", Decimal("100"), use_cache=False)
+
+
+def test_breaker_opens_after_threshold_and_skips_calls(monkeypatch):
+    cache.clear()
+    provider = FlakyProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+    monkeypatch.setattr(
+        provider_breakers, "overrides", {"FlakyProvider": {"failure_threshold": 3}}
+    )
+
+    for _ in range(3):
+        _quote()
+    assert provider_breakers.get_state("FlakyProvider") == STATE_OPEN
+
+    result = _quote()
+    assert provider.calls == 3
+    assert result["all_results"][0]["circuit_open"] is True
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success():
+    cache.clear()
+    breaker = CircuitBreaker(defaults={"failure_threshold": 1, "cooldown_seconds": 30})
+
+    breaker.record("FlakyProvider", breaker.acquire("FlakyProvider"), success=False)
+    assert breaker.acquire("FlakyProvider") is None
+
+    # Pretend the cool-down has elapsed
+    key = get_circuit_state_cache_key("FlakyProvider")
+    cache.set(key, {"opened_at": time.time() - 31, "reason": "test"})
+    assert breaker.get_state("FlakyProvider") == STATE_HALF_OPEN
+
+    permit = breaker.acquire("FlakyProvider")
+    assert permit == STATE_HALF_OPEN
+    # Only one probe at a time, across all workers sharing the cache
+    assert breaker.acquire("FlakyProvider") is None
+
+    breaker.record("FlakyProvider", permit, success=True)
+    assert breaker.get_state("FlakyProvider") == STATE_CLOSED
+    assert breaker.acquire("FlakyProvider") == STATE_CLOSED
+
+
+def test_half_open_probe_answered_with_an_error_result_reopens(monkeypatch):
+    cache.clear()
+    provider = FlakyProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+    monkeypatch.setattr(
+        provider_breakers, "overrides", {"FlakyProvider": {"failure_threshold": 1}}
+    )
+    _quote()
+    assert provider_breakers.get_state("FlakyProvider") == STATE_OPEN
+
+    # The cool-down elapses and the provider now answers fast, with an error
+    cache.set(
+        get_circuit_state_cache_key("FlakyProvider"),
+        {"opened_at": time.time() - 31, "reason": "test"},
+    )
+    monkeypatch.setattr(
+        provider,
+        "get_quote",
+        lambda **kwargs: {"success": False, "error_message": "Upstream error"},
+    )
+    _quote()
+
+    assert provider_breakers.get_state("FlakyProvider") == STATE_OPEN
@@ -0,0 +1,69 @@
+"""
+Offline tests for hedged provider calls.
+"""
+
+import threading
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from aggregator.aggregator import Aggregator
+from aggregator.hedging import HedgeBudget, LatencyTracker, hedge_budget, latency_tracker
+from aggregator.registry import LazyProviderList, ProviderRegistry
+
+
+class TailLatencyProvider:
+    """The first instance hangs; other pooled instances answer at once."""
+
+    provider_id = "tail"
+    instances = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        with self.lock:
+            TailLatencyProvider.instances += 1
+            self.slow = TailLatencyProvider.instances == 1
+
+    def get_quote(self, **kwargs):
+        if self.slow:
+            time.sleep(2)
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+def test_percentile_and_budget():
+    tracker = LatencyTracker(window=100)
+    for ms in range(1, 101):
+        tracker.record("P", ms / 1000)
+    assert tracker.percentile("P", 95) == 0.095
+    assert tracker.percentile("P", 95, min_samples=101) is None
+
+    budget = HedgeBudget(percent=5)
+    for _ in range(40):
+        budget.record_call()
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+
+@override_settings(AGGREGATOR_HEDGED_PROVIDERS={"TailLatencyProvider": {"min_samples": 5}})
+def test_slow_call_is_hedged_on_another_pooled_instance(monkeypatch):
+    cache.clear()
+    TailLatencyProvider.instances = 0
+    registry = ProviderRegistry(
+        {"TailLatencyProvider": "aggregator.tests.test_hedging.TailLatencyProvider"}
+    )
+    monkeypatch.setattr(Aggregator, "PROVIDERS", LazyProviderList(registry))
+    monkeypatch.setattr(hedge_budget, "calls", 1000)
+    for _ in range(5):
+        latency_tracker.record("TailLatencyProvider", 0.05)
+
+    start = time.time()
+    result = Aggregator.get_all_quotes("US", "MX", "USD", "MXN", Decimal("100"), use_cache=False)
+
+    assert time.time() - start < 1
+    assert result["results"][0]["hedged"] is True
+    # The slow instance went back to the pool after the primary attempt finished
+    time.sleep(2)
+    assert registry.pool_stats()["TailLatencyProvider"]["size"] == 2
@@ -0,0 +1,61 @@
+"""
+Offline tests for Aggregator.iter_quotes.
+"""
+
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator
+
+
+class DelayedFakeProvider:
+    def __init__(self, provider_id, delay, success=True):
+        self.provider_id = provider_id
+        self.delay = delay
+        self.success = success
+
+    def get_quote(self, **kwargs):
+        time.sleep(self.delay)
+        return {"success": self.success, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+def _iter(**kwargs):
+    return list(
+        Aggregator.iter_quotes("US", "MX", "USD", "MXN", Decimal("100"), use_cache=False, **kwargs)
+    )
+
+
+def test_results_are_yielded_in_completion_order(monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(
+        Aggregator,
+        "PROVIDERS",
+        [
+            DelayedFakeProvider("slow", 0.3),
+            DelayedFakeProvider("failing", 0.15, success=False),
+            DelayedFakeProvider("fast", 0.0),
+        ],
+    )
+
+    results = _iter(timeout=5)
+
+    assert [r["provider_id"] for r in results] == ["fast", "failing", "slow"]
+    assert [r["success"] for r in results] == [True, False, True]
+
+
+def test_providers_pending_at_the_deadline_end_the_stream_timed_out(monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(
+        Aggregator,
+        "PROVIDERS",
+        [DelayedFakeProvider("stuck", 2), DelayedFakeProvider("fast", 0.0)],
+    )
+
+    start = time.monotonic()
+    results = _iter(timeout=0.2)
+
+    assert time.monotonic() - start < 1
+    assert [r["provider_id"] for r in results] == ["fast", "stuck"]
+    assert results[-1]["timed_out"] is True
@@ -0,0 +1,84 @@
+"""
+Offline tests for the learned per-provider, per-corridor negative cache.
+"""
+
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator
+from aggregator.negative_cache import (
+    get_reprobe_lease_cache_key,
+    get_unsupported_corridor_cache_key,
+    unsupported_corridors,
+)
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED
+
+CORRIDOR = ("US", "MX", "USD", "MXN")
+
+
+class CorridorFakeProvider:
+    def __init__(self, provider_id, supported=True):
+        self.provider_id = provider_id
+        self.supported = supported
+        self.calls = 0
+
+    def get_quote(self, **kwargs):
+        self.calls += 1
+        if not self.supported:
+            return {
+                "success": False,
+                "provider_id": self.provider_id,
+                "error_message": "Corridor not supported",
+                "error_code": ERROR_CODE_CORRIDOR_UNSUPPORTED,
+            }
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+class RejectingProvider(CorridorFakeProvider):
+    pass
+
+
+class ServingProvider(CorridorFakeProvider):
+    pass
+
+
+def _quote(amount):
+    return Aggregator.get_all_quotes(*CORRIDOR, amount=Decimal(amount), use_cache=False)
+
+
+def test_unsupported_answer_skips_provider_for_other_amounts(monkeypatch):
+    cache.clear()
+    rejecting = RejectingProvider("rejecting", supported=False)
+    serving = ServingProvider("serving")
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [rejecting, serving])
+
+    _quote("100")
+    second = _quote("250")
+
+    assert rejecting.calls == 1
+    assert serving.calls == 2
+    assert second["providers_called"] == 1
+
+
+def test_marker_is_reprobed_once_and_cleared_on_success(monkeypatch):
+    cache.clear()
+    provider = RejectingProvider("rejecting")
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+    key = get_unsupported_corridor_cache_key("RejectingProvider", *CORRIDOR)
+    stale_marker = {"marked_at": time.time() - unsupported_corridors.reprobe_seconds}
+    cache.set(key, stale_marker)
+
+    # Only the first caller gets to re-probe a stale marker
+    assert unsupported_corridors.get_skipped(["RejectingProvider"], *CORRIDOR) == set()
+    assert unsupported_corridors.get_skipped(["RejectingProvider"], *CORRIDOR) == {
+        "RejectingProvider"
+    }
+
+    # The provider serves the corridor again, so a successful quote clears the marker
+    cache.delete(get_reprobe_lease_cache_key(key))
+    _quote("100")
+    _quote("250")
+    assert provider.calls == 2
+    assert cache.get(key) is None
@@ -0,0 +1,56 @@
+"""
+Offline tests for the per-provider lanes of the shared provider executor.
+"""
+
+import threading
+import time
+
+import pytest
+
+from aggregator.exceptions import ProviderLaneFullError
+from aggregator.executor import ProviderExecutor
+
+
+def test_hung_provider_only_exhausts_its_own_lane():
+    executor = ProviderExecutor(lane_size=2, lane_queue=1)
+    release = threading.Event()
+
+    try:
+        hung = [executor.submit("HungProvider", release.wait) for _ in range(3)]
+        with pytest.raises(ProviderLaneFullError):
+            executor.submit("HungProvider", release.wait)
+
+        start = time.time()
+        for i in range(10):
+            assert executor.submit("HealthyProvider", lambda i=i: i).result(timeout=1) == i
+        assert time.time() - start < 1
+
+        stats = executor.stats()
+        assert stats["HungProvider"]["active"] == 2
+        assert stats["HungProvider"]["queued"] == 1
+        assert stats["HungProvider"]["rejected"] == 1
+        assert stats["HealthyProvider"]["active"] == 0
+        assert stats["HealthyProvider"]["completed"] == 10
+    finally:
+        release.set()
+        for future in hung:
+            future.result(timeout=1)
+        executor.shutdown()
+
+
+def test_cancelled_queued_call_frees_its_slot():
+    executor = ProviderExecutor(lane_size=1, lane_queue=1)
+    release = threading.Event()
+
+    try:
+        running = executor.submit("SlowProvider", release.wait)
+        queued = executor.submit("SlowProvider", release.wait)
+        assert queued.cancel()
+        assert executor.stats()["SlowProvider"]["queued"] == 0
+
+        # The cancelled call's queue slot can be reused
+        executor.submit("SlowProvider", lambda: None)
+    finally:
+        release.set()
+        running.result(timeout=1)
+        executor.shutdown()
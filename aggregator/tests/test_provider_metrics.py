@@ -0,0 +1,88 @@
+"""
+Offline tests for per-provider call metrics.
+"""
+
+import io
+from decimal import Decimal
+
+import requests
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator
+from aggregator.metrics import ProviderMetrics
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED
+
+CORRIDOR = ("US", "MX", "USD", "MXN", Decimal("100"))
+
+
+class CannedAdapter(requests.adapters.BaseAdapter):
+    body = b'{"rate": 17.0}'
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(self.body)
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class HttpProvider:
+    provider_id = "http"
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.mount("https://", CannedAdapter())
+
+    def get_quote(self, **kwargs):
+        self.session.get("https://quotes.example/rate")
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+class UnsupportedProvider:
+    provider_id = "nowhere"
+
+    def get_quote(self, **kwargs):
+        return {"success": False, "error_code": ERROR_CODE_CORRIDOR_UNSUPPORTED}
+
+
+def test_calls_and_cache_hits_are_recorded_per_provider_and_corridor(monkeypatch):
+    cache.clear()
+    metrics = ProviderMetrics()
+    monkeypatch.setattr("aggregator.aggregator.provider_metrics", metrics)
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [HttpProvider(), UnsupportedProvider()])
+
+    Aggregator.get_all_quotes(*CORRIDOR)
+    Aggregator.get_all_quotes(*CORRIDOR)
+
+    totals = metrics.totals()
+    http = totals[("http", "US-MX")]
+    assert http["outcomes:success"] == 1
+    assert http["outcomes:cache_hit"] == 1
+    assert http["latency_seconds:count"] == 1
+    assert http["response_bytes:sum"] == len(CannedAdapter.body)
+    assert http["retries:bucket:0.0"] == 1
+    # The second request skips it: the corridor is known to be unsupported
+    assert totals[("nowhere", "US-MX")]["outcomes:unsupported"] == 1
+
+
+def test_render_emits_cumulative_prometheus_histograms():
+    cache.clear()
+    metrics = ProviderMetrics()
+    for seconds in (0.2, 0.7, 90):
+        metrics.record_call("wise", "US-MX", "success", seconds)
+    metrics.record_outcome("wise", "US-MX", "timeout")
+
+    text = metrics.render()
+    labels = 'provider="wise",corridor="US-MX"'
+    assert "# TYPE remitscout_provider_latency_seconds histogram" in text
+    assert f'remitscout_provider_latency_seconds_bucket{{{labels},le="0.25"}} 1' in text
+    assert f'remitscout_provider_latency_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f'remitscout_provider_latency_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"remitscout_provider_latency_seconds_count{{{labels}}} 3" in text
+    assert f'remitscout_provider_outcomes_total{{{labels},outcome="timeout"}} 1' in text
+    # No HTTP stats were recorded, so there is no bytes series
+    assert "remitscout_provider_response_bytes_count" not in text
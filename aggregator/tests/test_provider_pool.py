@@ -0,0 +1,73 @@
+"""
+Offline tests for pooled provider instances.
+"""
+import threading
+
+import pytest
+
+from aggregator.exceptions import ProviderPoolExhaustedError
+from aggregator.pool import ProviderInstancePool
+
+
+class SessionProvider:
+    """Carries per-instance session state like the real integrations."""
+
+    built = 0
+
+    def __init__(self):
+        SessionProvider.built += 1
+        self.token = None
+        self.healthy = True
+
+    def is_healthy(self):
+        return self.healthy
+
+
+def test_concurrent_leases_get_distinct_warm_instances():
+    SessionProvider.built = 0
+    pool = ProviderInstancePool("SessionProvider", SessionProvider, max_size=3)
+    barrier = threading.Barrier(3)
+    leased = []
+
+    def call():
+        with pool.lease() as instance:
+            leased.append(instance)
+            barrier.wait(timeout=2)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(instance) for instance in leased}) == 3
+    # Later calls reuse the warm instances instead of building new ones
+    with pool.lease():
+        pass
+    assert SessionProvider.built == 3
+    assert pool.stats() == {"size": 3, "idle": 3, "in_use": 0, "max_size": 3}
+
+
+def test_unhealthy_and_failed_instances_are_replaced():
+    seed = SessionProvider()
+    pool = ProviderInstancePool("SessionProvider", SessionProvider, max_size=1, seed=seed)
+
+    seed.healthy = False
+    with pool.lease() as instance:
+        assert instance is not seed
+
+    with pytest.raises(RuntimeError):
+        with pool.lease() as failed:
+            raise RuntimeError("session broken")
+    with pool.lease() as instance:
+        assert instance is not failed
+
+
+def test_checkout_times_out_when_pool_is_exhausted():
+    pool = ProviderInstancePool(
+        "SessionProvider", SessionProvider, max_size=1, checkout_timeout=0.05
+    )
+    pool.checkout()
+
+    with pytest.raises(ProviderPoolExhaustedError):
+        pool.checkout()
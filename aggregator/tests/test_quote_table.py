@@ -0,0 +1,80 @@
+"""
+Offline tests for the columnar quote table behind filters, sort orders and value scores.
+"""
+
+from aggregator.aggregator import Aggregator
+from aggregator.filters import (
+    combine_filters,
+    create_custom_filter,
+    create_max_fee_filter,
+    create_providers_exclude_filter,
+)
+from aggregator.quote_table import QuoteTable, select_quotes
+
+QUOTES = [
+    {
+        "provider_id": "slow",
+        "success": True,
+        "exchange_rate": 17.9,
+        "fee": 9.0,
+        "send_amount": 100.0,
+        "destination_amount": 1630.0,
+        "delivery_time_minutes": 2880,
+        "payment_method": "bank",
+    },
+    {
+        "provider_id": "free",
+        "success": True,
+        "exchange_rate": 17.2,
+        "fee": 0.0,
+        "send_amount": 100.0,
+        "destination_amount": 1720.0,
+        "delivery_time_minutes": 60,
+        "payment_method": "card",
+    },
+    {
+        "provider_id": "no-fee-info",
+        "success": True,
+        "exchange_rate": 17.5,
+        "send_amount": 100.0,
+        "payment_method": "card",
+    },
+    {"provider_id": "failed", "success": False, "exchange_rate": 18.5, "fee": 0.0},
+]
+
+
+def _ids(quotes):
+    return [q["provider_id"] for q in quotes]
+
+
+def test_custom_filter_runs_column_wise_and_per_quote():
+    quote_filter = create_custom_filter(max_fee=5, payment_methods=["card"])
+
+    assert _ids(select_quotes(QUOTES, filter_fn=quote_filter)) == ["free"]
+    # Still usable as a filter_fn(quote) -> bool
+    assert [quote_filter(q) for q in QUOTES] == [False, True, False, False]
+
+    combined = combine_filters(create_max_fee_filter(10), create_providers_exclude_filter(["slow"]))
+    assert _ids(select_quotes(QUOTES, filter_fn=combined)) == ["free"]
+    assert combined.criteria == [("max_fee", 10), ("exclude_providers", ["slow"])]
+
+
+def test_sort_orders():
+    table = QuoteTable(QUOTES[:3])
+
+    assert _ids(table.take(table.order("best_rate"))) == ["slow", "no-fee-info", "free"]
+    # A free transfer sorts first and a missing fee last
+    assert _ids(table.take(table.order("lowest_fee"))) == ["free", "slow", "no-fee-info"]
+    assert _ids(table.take(table.order("fastest"))) == ["free", "slow", "no-fee-info"]
+    assert _ids(table.take(table.order("best_value"))) == ["no-fee-info", "free", "slow"]
+    assert list(table.value_scores())[:2] == [17.9 * 0.91, 17.2]
+
+
+def test_aggregator_finalize_accepts_plain_callables():
+    successful = [q for q in QUOTES if q["success"]]
+
+    quotes = Aggregator._finalize_quotes(
+        successful, "lowest_fee", lambda q: q["provider_id"] != "free", None, 10
+    )
+
+    assert _ids(quotes) == ["slow"]
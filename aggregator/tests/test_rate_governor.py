@@ -0,0 +1,105 @@
+"""
+Offline tests for the outbound rate governor.
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator
+from aggregator.rate_governor import (
+    RateGovernor,
+    get_governor_factor_cache_key,
+    provider_governor,
+)
+from providers.base.provider import ERROR_CODE_RATE_LIMITED
+from providers.paysend.integration import PaysendProvider
+
+
+class RateLimitedProvider:
+    provider_id = "throttled"
+
+    def __init__(self):
+        self.calls = 0
+        self.limited = True
+
+    def get_quote(self, **kwargs):
+        self.calls += 1
+        if self.limited:
+            return {
+                "success": False,
+                "error_message": "HTTP 429",
+                "error_code": ERROR_CODE_RATE_LIMITED,
+                "retry_after": 30,
+            }
+        return {"success": True, "exchange_rate": 17.0}
+
+
+def _quote(use_cache=False):
+    return Aggregator.get_all_quotes("US", "MX", "USD", "MXN", Decimal("100"), use_cache=use_cache)
+
+
+def test_token_bucket_allows_burst_then_fails_fast():
+    cache.clear()
+    governor = RateGovernor(defaults={"rate_per_second": 0.01, "burst": 2})
+
+    assert [governor.acquire("BucketProvider") for _ in range(3)] == [True, True, False]
+    # Providers without a budget are never throttled by the bucket
+    unlimited = RateGovernor()
+    assert all(unlimited.acquire("BucketProvider") for _ in range(50))
+
+
+def test_429_blocks_for_retry_after_and_halves_the_rate():
+    cache.clear()
+    governor = RateGovernor(defaults={"rate_per_second": 4, "min_rate_factor": 0.3})
+
+    governor.record("BackoffProvider", {"error_code": ERROR_CODE_RATE_LIMITED, "retry_after": 30})
+    assert governor.acquire("BackoffProvider") is False
+    assert cache.get(get_governor_factor_cache_key("BackoffProvider")) == 0.5
+
+    governor.throttle("BackoffProvider")
+    assert cache.get(get_governor_factor_cache_key("BackoffProvider")) == 0.3
+
+
+def test_aggregator_skips_rate_limited_provider_and_serves_cache(monkeypatch):
+    cache.clear()
+    provider = RateLimitedProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+
+    first = _quote()
+    assert first["all_results"][0]["error_code"] == ERROR_CODE_RATE_LIMITED
+
+    # Retry-After is running: the provider is not called again
+    second = _quote()
+    assert provider.calls == 1
+    assert second["all_results"][0]["rate_limited"] is True
+
+    # Once a quote is cached it is served instead, even for a forced refresh
+    cache.clear()
+    provider.limited = False
+    assert _quote(use_cache=True)["success"]
+    provider_governor.throttle("RateLimitedProvider", 30)
+    third = _quote()
+    assert provider.calls == 2
+    assert third["results"][0]["exchange_rate"] == 17.0
+
+
+def test_paysend_429_reaches_the_governor_as_a_rate_limit_error(monkeypatch):
+    cache.clear()
+    provider = PaysendProvider()
+    provider._session_token = "token"
+    response = MagicMock(status_code=429, headers={"retry-after": "30"})
+    monkeypatch.setattr(provider.session, "get", lambda *args, **kwargs: response)
+    monkeypatch.setattr(
+        provider,
+        "get_quote",
+        lambda **kwargs: provider._make_api_request("https://paysend.com/api/send-money"),
+    )
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+
+    result = _quote()
+
+    assert result["all_results"][0]["error_message"] == "Exception: Rate limited by Paysend API"
+    # Blocked for the Retry-After of the 429
+    assert provider_governor.acquire("PaysendProvider") is False
@@ -0,0 +1,67 @@
+"""
+Offline tests for the lazy provider registry.
+"""
+import sys
+
+from aggregator.registry import LazyProviderList, ProviderRegistry
+
+
+def test_providers_are_imported_and_built_on_first_use():
+    registry = ProviderRegistry({"OrderedDict": "collections.OrderedDict"})
+
+    assert registry.names() == ["OrderedDict"]
+    assert not registry.is_loaded("OrderedDict")
+
+    instance = registry.get("OrderedDict")
+    assert registry.get("OrderedDict") is instance
+    assert registry.is_loaded("OrderedDict")
+
+    [row] = registry.import_report()
+    assert row["provider"] == "OrderedDict"
+    assert row["import_seconds"] is not None
+    assert row["init_seconds"] is not None
+
+
+def test_names_do_not_import_provider_modules():
+    registry = ProviderRegistry({"Fake": "aggregator.tests.not_a_module.Fake"})
+
+    assert registry.names() == ["Fake"]
+    assert "aggregator.tests.not_a_module" not in sys.modules
+
+
+def test_lazy_provider_list_resolves_every_instance():
+    registry = ProviderRegistry({"OrderedDict": "collections.OrderedDict"})
+
+    class Holder:
+        PROVIDERS = LazyProviderList(registry)
+
+    assert Holder.PROVIDERS == [registry.get("OrderedDict")]
+
+
+class BrokenProvider:
+    def __init__(self):
+        raise ConnectionError("session warm-up failed")
+
+
+def test_provider_that_fails_to_build_is_left_out_of_all():
+    registry = ProviderRegistry(
+        {
+            "BrokenProvider": "aggregator.tests.test_registry.BrokenProvider",
+            "OrderedDict": "collections.OrderedDict",
+        }
+    )
+
+    assert registry.all() == [registry.get("OrderedDict")]
+    assert not registry.is_loaded("BrokenProvider")
+
+
+def test_reading_the_lazy_provider_list_builds_nothing_until_iterated():
+    registry = ProviderRegistry({"OrderedDict": "collections.OrderedDict"})
+
+    class Holder:
+        PROVIDERS = LazyProviderList(registry)
+
+    providers = Holder.PROVIDERS
+    assert not registry.is_loaded("OrderedDict")
+    assert len(providers) == 1
+    assert registry.is_loaded("OrderedDict")
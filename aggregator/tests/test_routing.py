@@ -0,0 +1,37 @@
+"""
+Offline tests for the corridor routing index.
+"""
+
+from aggregator.routing import CORRIDOR_RULES, CorridorRoutingIndex
+
+
+def _broken_rule(*corridor):
+    raise KeyError("missing mapping")
+
+
+def test_routes_only_to_providers_that_serve_the_corridor():
+    index = CorridorRoutingIndex(
+        ["OnlyMXProvider", "UnrestrictedProvider", "BrokenProvider"],
+        {
+            "OnlyMXProvider": lambda sc, dc, scur, dcur: dc == "MX",
+            "BrokenProvider": _broken_rule,
+        },
+    )
+
+    assert index.supports("OnlyMXProvider", "us", "mx", "usd", "mxn")
+    assert not index.supports("OnlyMXProvider", "US", "IN", "USD", "INR")
+    # No rule, or a failing rule, never hides a provider
+    assert index.supports("UnrestrictedProvider", "US", "IN", "USD", "INR")
+    assert index.supports("BrokenProvider", "US", "IN", "USD", "INR")
+    assert index.supports("UnregisteredProvider", "US", "IN", "USD", "INR")
+
+
+def test_provider_rules_use_static_corridor_tables():
+    index = CorridorRoutingIndex(list(CORRIDOR_RULES), CORRIDOR_RULES)
+
+    assert index.supports("SingXProvider", "SG", "IN", "SGD", "INR")
+    assert not index.supports("SingXProvider", "US", "MX", "USD", "MXN")
+    assert index.supports("SendwaveProvider", "US", "PH", "USD", "PHP")
+    assert not index.supports("SendwaveProvider", "US", "MX", "USD", "MXN")
+    assert index.supports("OrbitRemitProvider", "AU", "PH", "AUD", "PHP")
+    assert not index.supports("OrbitRemitProvider", "US", "MX", "USD", "MXN")
@@ -0,0 +1,70 @@
+"""
+Offline tests for stale-while-revalidate provider cache entries.
+"""
+
+import threading
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator, get_provider_quote_cache_key
+
+CORRIDOR = ("US", "MX", "USD", "MXN", Decimal("100"))
+
+
+class RepricingProvider:
+    provider_id = "repricing"
+
+    def __init__(self):
+        self.calls = 0
+        self.rate = 17.0
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_quote(self, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": self.rate}
+
+
+def _rate():
+    result = Aggregator.get_all_quotes(*CORRIDOR)
+    return result["results"][0]["exchange_rate"]
+
+
+def _expire_soft_ttl():
+    key = get_provider_quote_cache_key("RepricingProvider", *CORRIDOR)
+    _, quote = cache.get(key)
+    cache.set(key, (time.time() - 1, quote), timeout=60)
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(monkeypatch):
+    cache.clear()
+    provider = RepricingProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+
+    assert _rate() == 17.0
+    assert _rate() == 17.0
+    assert provider.calls == 1
+
+    _expire_soft_ttl()
+    provider.rate = 18.0
+    provider.release.clear()
+    # Served from the stale entry at once, while the provider is still answering
+    started = time.time()
+    assert _rate() == 17.0
+    assert _rate() == 17.0
+    assert time.time() - started < 1
+    provider.release.set()
+
+    assert _wait_for(lambda: _rate() == 18.0)
+    # The two stale reads shared one refresh
+    assert provider.calls == 2
@@ -0,0 +1,89 @@
+"""
+Offline tests for volatility-adaptive cache TTLs.
+"""
+
+import time
+from decimal import Decimal
+
+from django.core.cache import cache
+
+from aggregator.aggregator import Aggregator, get_provider_quote_cache_key
+from aggregator.volatility import RateVolatility
+
+DEFAULT_TTL = 1800
+
+
+def _feed(volatility, provider_id, rates, interval=300, start=1_000_000):
+    for i, rate in enumerate(rates):
+        volatility.observe(provider_id, "USD", "MXN", rate, at=start + i * interval)
+
+
+def test_ttl_follows_observed_volatility():
+    cache.clear()
+    volatility = RateVolatility(tolerance_bps=10, min_ttl=60, max_ttl=21600, min_samples=5)
+
+    # Too few observations: the static TTL applies
+    _feed(volatility, "wise", [17.0, 17.0085, 17.0])
+    assert volatility.ttl("wise", "USD", "MXN", default=DEFAULT_TTL) == DEFAULT_TTL
+
+    # 5bp every 5 minutes keeps 10bp of expected drift for about 20 minutes
+    cache.clear()
+    _feed(volatility, "wise", [17.0, 17.0085] * 5)
+    assert 1000 < volatility.ttl("wise", "USD", "MXN", default=DEFAULT_TTL) < 1400
+
+    # 1% swings hit the floor, a flat rate the ceiling
+    _feed(volatility, "swinging", [17.0, 17.17] * 5)
+    _feed(volatility, "pegged", [3.6725] * 10)
+    assert volatility.ttl("swinging", "USD", "MXN", default=DEFAULT_TTL) == 60
+    assert volatility.ttl("pegged", "USD", "MXN", default=DEFAULT_TTL) == 21600
+    # Data covering several providers lives as long as the most volatile one allows
+    assert volatility.pair_ttl("USD", "MXN", ["pegged", "swinging"], DEFAULT_TTL) == 60
+
+
+def test_observations_closer_than_min_interval_are_skipped():
+    cache.clear()
+    volatility = RateVolatility(min_samples=1, min_interval=60)
+
+    _feed(volatility, "wise", [17.0, 17.0, 17.0, 17.0], interval=1)
+    assert volatility.ttl("wise", "USD", "MXN", default=DEFAULT_TTL) == DEFAULT_TTL
+
+
+def test_historic_rates_seed_a_prior_for_the_pair():
+    cache.clear()
+    volatility = RateVolatility(tolerance_bps=10, min_ttl=60, max_ttl=21600, min_samples=5)
+    day = 86400
+    # About 1% a day
+    series = [(i * day, rate) for i, rate in enumerate([17.0, 17.17, 17.0, 17.17, 17.0])]
+
+    assert volatility.seed("USD", "MXN", series) is not None
+    prior_ttl = volatility.ttl("new-provider", "USD", "MXN", default=DEFAULT_TTL)
+    assert 60 < prior_ttl < DEFAULT_TTL
+
+    # A provider with enough observations of its own uses them instead
+    _feed(volatility, "pegged", [17.0] * 10)
+    assert volatility.ttl("pegged", "USD", "MXN", default=DEFAULT_TTL) == 21600
+
+
+class FixedRateProvider:
+    provider_id = "fixed"
+
+    def get_quote(self, **kwargs):
+        return {"success": True, "provider_id": self.provider_id, "exchange_rate": 17.0}
+
+
+def test_aggregator_feeds_and_uses_the_estimate(monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [FixedRateProvider()])
+    observed = []
+    monkeypatch.setattr(
+        "aggregator.aggregator.rate_volatility.observe",
+        lambda *args, **kwargs: observed.append(args),
+    )
+    monkeypatch.setattr("aggregator.aggregator.rate_volatility.ttl", lambda *args, **kwargs: 120)
+
+    corridor = ("US", "MX", "USD", "MXN", Decimal("100"))
+    assert Aggregator.get_all_quotes(*corridor)["success"]
+    assert observed == [("fixed", "USD", "MXN", 17.0)]
+
+    fresh_until, _ = cache.get(get_provider_quote_cache_key("FixedRateProvider", *corridor))
+    assert fresh_until - time.time() <= 120 + 60
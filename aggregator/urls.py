@@ -6,11 +6,16 @@ which combines quotes from multiple remittance providers.
 """
 from django.urls import path
 
-from .views import AggregatorRatesView
+from .views import AggregatorRatesView, ProviderLaneMetricsView, ProviderMetricsView
 
 app_name = "aggregator"
 
 urlpatterns = [
     # Main aggregator endpoint is removed since it's redundant with quotes endpoint
     # All remittance quotes are available through the quotes endpoint instead
+
+    # Occupancy and queue depth of the per-provider executor lanes
+    path("metrics/lanes/", ProviderLaneMetricsView.as_view(), name="provider-lane-metrics"),
+    # Per-provider latency and outcome metrics in the Prometheus text format
+    path("metrics/providers/", ProviderMetricsView.as_view(), name="provider-metrics"),
 ] 
\ No newline at end of file
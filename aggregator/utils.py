@@ -6,6 +6,8 @@ import logging
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from aggregator.quote_table import QuoteTable, value_score
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,8 +49,9 @@ def calculate_best_value_score(quote: Dict[str, Any], amount: Decimal) -> float:
     Calculate a 'value score' for a quote, used for sorting by overall value.
     Higher scores are better.
 
-    The formula balances exchange rate and fees, giving more weight to exchange rate
-    for larger amounts.
+    The score is the destination currency received per unit sent once the fee is
+    taken out (see aggregator.quote_table.value_score), so fees weigh less on
+    larger amounts.
 
     Args:
         quote: The quote dictionary
@@ -60,17 +63,12 @@ def calculate_best_value_score(quote: Dict[str, Any], amount: Decimal) -> float:
     if not quote.get("success"):
         return float("-inf")
 
-    exchange_rate = quote.get("exchange_rate", 0.0)
-    fee = quote.get("fee", 0.0)
-
     # For amount=0, avoid division by zero
     if float(amount) == 0:
         return 0
 
-    # Value formula: exchange_rate / (1 + fee_percentage)
-    # This prioritizes exchange rate for larger amounts
-    fee_percentage = fee / float(amount)
-    return exchange_rate / (1 + fee_percentage)
+    table = QuoteTable([quote])
+    return value_score(table.exchange_rate[0], table.fee[0], float(amount))
 
 
 def filter_by_preferences(
@@ -91,25 +89,19 @@ def filter_by_preferences(
     Returns:
         Filtered list of quotes
     """
-    filtered_quotes = quotes.copy()
+    table = QuoteTable(quotes)
+    criteria = [
+        (criterion, value)
+        for criterion, value in (
+            ("max_fee", max_fee),
+            ("max_delivery_time", max_delivery_time),
+            ("min_rate", min_exchange_rate),
+        )
+        if value is not None
+    ]
 
     # Only apply filters to successful quotes
-    successful_quotes = [q for q in filtered_quotes if q.get("success")]
-    failed_quotes = [q for q in filtered_quotes if not q.get("success")]
-
-    if max_fee is not None:
-        successful_quotes = [q for q in successful_quotes if q.get("fee", float("inf")) <= max_fee]
-
-    if max_delivery_time is not None:
-        successful_quotes = [
-            q
-            for q in successful_quotes
-            if q.get("delivery_time_minutes", float("inf")) <= max_delivery_time
-        ]
-
-    if min_exchange_rate is not None:
-        successful_quotes = [
-            q for q in successful_quotes if q.get("exchange_rate", 0) >= min_exchange_rate
-        ]
+    successful_quotes = table.take(table.select(criteria))
+    failed_quotes = [q for q, success in zip(table.quotes, table.success) if not success]
 
     return successful_quotes + failed_quotes
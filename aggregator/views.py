@@ -7,6 +7,7 @@ and compares quotes from multiple remittance providers.
 from decimal import Decimal, InvalidOperation
 
 from django.conf import settings
+from django.http import HttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import (
     OpenApiExample,
@@ -16,11 +17,15 @@ from drf_spectacular.utils import (
     extend_schema_view,
 )
 from rest_framework import status
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .aggregator import get_cached_aggregated_rates
+from .executor import get_provider_executor
+from .metrics import provider_metrics
+from .permissions import HasMetricsToken
+from .registry import provider_registry
 
 
 @extend_schema_view(
@@ -259,3 +264,58 @@ class AggregatorRatesView(APIView):
         }
 
         return Response(response_data)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Provider executor lane metrics",
+        description=(
+            "Occupancy and queue depth of each provider's lane in this worker's shared "
+            "provider executor. Staff only."
+        ),
+        tags=["Monitoring"],
+    )
+)
+class ProviderLaneMetricsView(APIView):
+    """
+    API endpoint exposing per-provider lane metrics of the provider executor.
+
+    For every provider that has been called in this worker process, returns the
+    lane size, busy workers, queued calls, and completed and rejected call counts,
+    along with the size and usage of its pool of instances.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {
+                "timestamp": timezone.now().isoformat(),
+                "lanes": get_provider_executor().stats(),
+                "pools": provider_registry.pool_stats(),
+            }
+        )
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Provider call metrics (Prometheus)",
+        description=(
+            "Latency, bytes received, retries and outcomes of provider calls per provider "
+            "and corridor, summed over every worker, in the Prometheus text format. Staff, "
+            "or a bearer token matching PROVIDER_METRICS_TOKEN."
+        ),
+        tags=["Monitoring"],
+    )
+)
+class ProviderMetricsView(APIView):
+    """
+    Prometheus scrape endpoint for the per-provider metrics of aggregator.metrics.
+    """
+
+    permission_classes = [IsAdminUser | HasMetricsToken]
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(
+            provider_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
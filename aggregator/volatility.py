@@ -0,0 +1,204 @@
+"""
+Rate volatility per provider and currency pair, and the cache TTLs it allows.
+
+Treating a provider's exchange rate for a pair as a random walk, its expected
+drift after t seconds is sigma * sqrt(t), where sigma^2 is the variance of the log
+rate change per second. To keep the expected drift of a cached quote under
+RATE_DRIFT_TOLERANCE_BPS basis points, it may be cached for
+
+    ttl = (tolerance / sigma) ** 2
+
+seconds, clamped to [ADAPTIVE_CACHE_TTL_MIN, ADAPTIVE_CACHE_TTL_MAX]. Volatile
+pairs are refreshed more often than the static TTLs allowed; pegged or quiet
+pairs are kept longer instead of being refreshed for nothing.
+
+sigma^2 is an exponentially weighted average of r^2 / dt over successive quotes
+of the same provider and pair (r the log rate change over dt seconds). It lives in
+the shared cache, so every worker feeds and reads the same estimate. Observations
+closer than RATE_VOLATILITY_MIN_INTERVAL to the previous one are skipped, so
+bursts of identical quotes don't drag the estimate down. Historic daily rates
+(OrbitRemitProvider.get_historic_rates, see quotes.tasks.seed_rate_volatility)
+give a pair-wide prior, used for providers with fewer than
+RATE_VOLATILITY_MIN_SAMPLES observations. Without either, callers get their
+static TTL.
+"""
+import logging
+import math
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Provider key of the pair-wide prior seeded from historic rates
+PAIR_PRIOR = "*"
+
+STATE_TTL = 60 * 60 * 24 * 7  # 7 days
+
+
+def get_volatility_cache_key(provider_id, source_currency, dest_currency):
+    """Generate the cache key of the volatility state of a provider and currency pair."""
+    provider_id = str(provider_id).upper()
+    return f"volatility:{provider_id}:{source_currency.upper()}:{dest_currency.upper()}"
+
+
+def _log_change(old_rate: float, new_rate: float) -> Optional[float]:
+    if old_rate <= 0 or new_rate <= 0:
+        return None
+    return math.log(new_rate / old_rate)
+
+
+class RateVolatility:
+    """
+    Volatility estimates backed by the shared cache.
+
+    Args:
+        tolerance_bps: Expected rate drift tolerated in a cached quote, in basis points.
+        min_ttl: Shortest TTL returned, in seconds.
+        max_ttl: Longest TTL returned, in seconds.
+        smoothing: Weight of a new observation in the moving average.
+        min_samples: Observations needed before a provider's own estimate is used.
+        min_interval: Seconds between two observations that are both counted.
+    """
+
+    def __init__(
+        self,
+        tolerance_bps: float = 10,
+        min_ttl: int = 60,
+        max_ttl: int = 60 * 60 * 6,
+        smoothing: float = 0.2,
+        min_samples: int = 5,
+        min_interval: float = 60,
+    ):
+        self.tolerance = tolerance_bps / 10000
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+        self.min_interval = min_interval
+
+    def observe(
+        self,
+        provider_id: str,
+        source_currency: str,
+        dest_currency: str,
+        rate: Any,
+        at: Optional[float] = None,
+    ):
+        """Feed a freshly quoted rate of a provider."""
+        try:
+            rate = float(rate)
+        except (TypeError, ValueError):
+            return
+        if not provider_id or not source_currency or not dest_currency or rate <= 0:
+            return
+        at = time.time() if at is None else at
+        key = get_volatility_cache_key(provider_id, source_currency, dest_currency)
+        try:
+            state = cache.get(key)
+            state = self._update(state, rate, at)
+            if state is not None:
+                cache.set(key, state, timeout=STATE_TTL)
+        except Exception as e:
+            logger.warning(f"Error recording rate volatility for {key}: {str(e)}")
+
+    def _update(self, state: Optional[Dict[str, Any]], rate: float, at: float):
+        """The state after observing rate at time at, or None if nothing changes."""
+        if not state:
+            return {"rate": rate, "at": at, "variance": None, "samples": 0}
+        dt = at - state["at"]
+        if dt < self.min_interval:
+            return None
+        change = _log_change(state["rate"], rate)
+        if change is None:
+            return None
+        sample = change * change / dt
+        variance = state["variance"]
+        if variance is None:
+            variance = sample
+        else:
+            variance += self.smoothing * (sample - variance)
+        return {"rate": rate, "at": at, "variance": variance, "samples": state["samples"] + 1}
+
+    def seed(
+        self, source_currency: str, dest_currency: str, series: Iterable[Tuple[float, float]]
+    ) -> Optional[float]:
+        """
+        Set the pair-wide prior from a series of (timestamp, rate), e.g. daily rates.
+
+        Returns the variance per second, or None if the series is too short.
+        """
+        points = sorted((at, float(rate)) for at, rate in series if rate and float(rate) > 0)
+        samples = []
+        for (t0, r0), (t1, r1) in zip(points, points[1:]):
+            change = _log_change(r0, r1)
+            if t1 > t0 and change is not None:
+                samples.append(change * change / (t1 - t0))
+        if not samples:
+            return None
+        variance = sum(samples) / len(samples)
+        at, rate = points[-1]
+        cache.set(
+            get_volatility_cache_key(PAIR_PRIOR, source_currency, dest_currency),
+            {"rate": rate, "at": at, "variance": variance, "samples": len(samples)},
+            timeout=STATE_TTL,
+        )
+        return variance
+
+    def _variance(self, state, prior) -> Optional[float]:
+        if state and state["variance"] is not None and state["samples"] >= self.min_samples:
+            return state["variance"]
+        if prior and prior["variance"] is not None:
+            return prior["variance"]
+        return None
+
+    def _ttl_for_variance(self, variance: Optional[float], default: int) -> int:
+        if variance is None:
+            return default
+        if variance <= 0:
+            return self.max_ttl
+        ttl = self.tolerance * self.tolerance / variance
+        return int(min(self.max_ttl, max(self.min_ttl, ttl)))
+
+    def pair_ttl(
+        self,
+        source_currency: str,
+        dest_currency: str,
+        provider_ids: Sequence[str],
+        default: int,
+    ) -> int:
+        """
+        TTL for data covering several providers of a pair: the shortest of theirs.
+
+        Providers without an estimate (nor a prior for the pair) count as default.
+        """
+        prior_key = get_volatility_cache_key(PAIR_PRIOR, source_currency, dest_currency)
+        keys = [
+            get_volatility_cache_key(provider_id, source_currency, dest_currency)
+            for provider_id in provider_ids
+            if provider_id
+        ]
+        try:
+            states = cache.get_many([prior_key, *keys])
+        except Exception as e:
+            logger.warning(f"Rate volatility unavailable: {str(e)}")
+            return default
+        prior = states.get(prior_key)
+        ttls = [self._ttl_for_variance(self._variance(states.get(k), prior), default) for k in keys]
+        return min(ttls) if ttls else self._ttl_for_variance(self._variance(None, prior), default)
+
+    def ttl(self, provider_id: str, source_currency: str, dest_currency: str, default: int) -> int:
+        """TTL for a quote of one provider and pair."""
+        return self.pair_ttl(source_currency, dest_currency, [provider_id], default)
+
+
+rate_volatility = RateVolatility(
+    tolerance_bps=getattr(settings, "RATE_DRIFT_TOLERANCE_BPS", 10),
+    min_ttl=getattr(settings, "ADAPTIVE_CACHE_TTL_MIN", 60),
+    max_ttl=getattr(settings, "ADAPTIVE_CACHE_TTL_MAX", 60 * 60 * 6),
+    smoothing=getattr(settings, "RATE_VOLATILITY_SMOOTHING", 0.2),
+    min_samples=getattr(settings, "RATE_VOLATILITY_MIN_SAMPLES", 5),
+    min_interval=getattr(settings, "RATE_VOLATILITY_MIN_INTERVAL", 60),
+)
@@ -3,5 +3,6 @@ Base provider package.
 """
 
 from providers.base.provider import RemittanceProvider
+from providers.base.quote import Quote
 
-__all__ = ["RemittanceProvider"]
+__all__ = ["Quote", "RemittanceProvider"]
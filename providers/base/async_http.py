@@ -0,0 +1,71 @@
+"""
+Shared non-blocking HTTP client for providers with native ``aget_quote`` support.
+
+httpx connection pools are bound to the event loop that opened them, so one
+client is kept per running loop and reused by every provider on that loop. The
+client is closed when its loop shuts down its async generators, which
+``asyncio.run`` does before closing the loop.
+"""
+import asyncio
+import logging
+import weakref
+from typing import AsyncIterator, Tuple
+
+import httpx
+
+from providers.base.http_stats import record_httpx_response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+
+# Each client is stored with the generator that closes it; the loop only holds
+# a weak reference to its async generators.
+_ClientEntry = Tuple[httpx.AsyncClient, AsyncIterator[None]]
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientEntry]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    """Park until the loop's shutdown_asyncgens() closes us, then close the client."""
+    try:
+        yield
+    finally:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Could not close the shared AsyncClient: {str(e)}")
+
+
+def _register_for_loop_shutdown(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    closer = _close_on_loop_shutdown(client)
+    # Advancing the generator to its yield registers it with the running loop
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
+    return closer
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient for the running event loop.
+
+    Must be called from inside a coroutine. Providers pass their own headers
+    per request instead of mutating the shared client. Responses are counted in
+    the provider call's HTTP stats (see http_stats).
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            follow_redirects=True,
+            event_hooks={"response": [record_httpx_response]},
+        )
+        entry = (client, _register_for_loop_shutdown(client))
+        _clients[loop] = entry
+    return entry[0]
@@ -0,0 +1,204 @@
+"""
+Piecewise fee and rate schedules, for pricing an amount from quotes for others.
+
+The corridor rate cache prices a new amount from what each provider quoted for
+another one. A flat fee and rate are only right inside one of the provider's
+pricing tiers, so the cache keeps a schedule per provider: tiers of send amounts,
+each with the fee and exchange rate that apply in it. A schedule is either
+
+- declared, from tier data the provider returns with its quote under
+  ``fee_schedule``: a list of ``{"min_amount", "max_amount", "fee",
+  "exchange_rate"}`` dicts with inclusive bounds, max_amount None for no upper
+  bound and exchange_rate None for the quote's own rate. Providers with threshold
+  tables can build it with tiers_from_breakpoints. A declared schedule is
+  complete: it can't price an amount outside its tiers;
+- sampled, from the amounts the provider was actually quoted for. Neighbouring
+  samples with the same fee and rate (within the drift tolerance) become one tier
+  spanning both, assuming pricing doesn't change and change back between them.
+  Between samples that differ lies a breakpoint at an unknown amount, so amounts
+  there can't be priced; below the smallest and above the largest sample the
+  nearest tier is used, as the flat fee always was.
+
+Version: 1.0
+"""
+import math
+from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+# Amounts are in currency units with two decimals
+CENT = 0.01
+
+# Most tiers a sampled schedule keeps; the least recently observed go first
+MAX_TIERS = 32
+
+
+class Tier(NamedTuple):
+    """Fee and rate for send amounts from min_amount to max_amount, inclusive."""
+
+    min_amount: float
+    max_amount: float  # math.inf when unbounded
+    fee: float
+    exchange_rate: Optional[float]  # None: the rate of the quote the schedule came with
+    observed_at: float  # Unix time
+
+
+class FeeSchedule(NamedTuple):
+    """Tiers of one provider in a corridor, sorted by amount."""
+
+    tiers: Tuple[Tier, ...]
+    declared: bool
+
+    def price(self, amount: float) -> Optional[Tuple[float, Optional[float]]]:
+        """(fee, exchange_rate) for amount, or None if the schedule can't tell."""
+        tiers = self.tiers
+        for tier in tiers:
+            if tier.min_amount <= amount <= tier.max_amount:
+                return tier.fee, tier.exchange_rate
+        if self.declared or not tiers:
+            return None
+        if amount < tiers[0].min_amount:
+            return tiers[0].fee, tiers[0].exchange_rate
+        if amount > tiers[-1].max_amount:
+            return tiers[-1].fee, tiers[-1].exchange_rate
+        return None
+
+
+def _same_price(a: Tier, b: Tier, tolerance: float) -> bool:
+    if abs(a.fee - b.fee) >= CENT / 2:
+        return False
+    if a.exchange_rate is None or b.exchange_rate is None:
+        return a.exchange_rate is None and b.exchange_rate is None
+    scale = max(abs(a.exchange_rate), abs(b.exchange_rate))
+    return abs(a.exchange_rate - b.exchange_rate) <= tolerance * scale
+
+
+def _merge(tiers: Iterable[Tier], tolerance: float, bridge_gaps: bool) -> List[Tier]:
+    """
+    Join neighbouring tiers with the same price; the most recent observation wins.
+
+    Tiers with amounts between them are only joined with bridge_gaps.
+    """
+    merged: List[Tier] = []
+    for tier in sorted(tiers, key=lambda t: (t.min_amount, t.observed_at)):
+        if (
+            merged
+            and _same_price(merged[-1], tier, tolerance)
+            and (bridge_gaps or tier.min_amount <= merged[-1].max_amount + CENT * 1.5)
+        ):
+            last = merged[-1]
+            newer = tier if tier.observed_at >= last.observed_at else last
+            merged[-1] = Tier(
+                last.min_amount,
+                max(last.max_amount, tier.max_amount),
+                newer.fee,
+                newer.exchange_rate,
+                newer.observed_at,
+            )
+        else:
+            merged.append(tier)
+    return merged
+
+
+def declared_schedule(tiers: Iterable[Mapping], observed_at: float) -> Optional[FeeSchedule]:
+    """
+    The schedule of the tier dicts a provider returned, or None if there are none.
+
+    Raises ValueError or TypeError on malformed tiers.
+    """
+    parsed = []
+    for tier in tiers:
+        max_amount = tier.get("max_amount")
+        exchange_rate = tier.get("exchange_rate")
+        parsed.append(
+            Tier(
+                float(tier.get("min_amount") or 0),
+                math.inf if max_amount is None else float(max_amount),
+                float(tier.get("fee") or 0),
+                None if exchange_rate is None else float(exchange_rate),
+                observed_at,
+            )
+        )
+    if not parsed:
+        return None
+    return FeeSchedule(tuple(_merge(parsed, 0, False)), declared=True)
+
+
+def add_sample(
+    schedule: Optional[FeeSchedule],
+    amount: float,
+    fee: float,
+    exchange_rate: float,
+    observed_at: float,
+    max_age: float,
+    tolerance: float,
+) -> FeeSchedule:
+    """
+    A sampled schedule with one more quoted amount.
+
+    Tiers observed more than max_age seconds before the sample are dropped, and so is
+    a declared schedule: it is replaced, not extended. tolerance is the relative rate
+    difference still counted as the same price.
+    """
+    sample = Tier(amount, amount, fee, exchange_rate, observed_at)
+    tiers = []
+    if schedule is not None and not schedule.declared:
+        for tier in schedule.tiers:
+            if tier.observed_at < observed_at - max_age:
+                continue
+            if tier.min_amount <= amount <= tier.max_amount and not _same_price(
+                tier, sample, tolerance
+            ):
+                # The sample contradicts the tier: only the samples at its ends still hold
+                for end in {tier.min_amount, tier.max_amount}:
+                    if end != amount and math.isfinite(end):
+                        tiers.append(tier._replace(min_amount=end, max_amount=end))
+                continue
+            tiers.append(tier)
+    tiers.append(sample)
+
+    if len(tiers) > MAX_TIERS:
+        tiers = sorted(tiers, key=lambda t: t.observed_at)[-MAX_TIERS:]
+    return FeeSchedule(tuple(_merge(tiers, tolerance, True)), declared=False)
+
+
+def tiers_from_breakpoints(
+    breakpoints: Iterable[float], price_at: Callable[[float], Tuple[float, Optional[float]]]
+) -> List[dict]:
+    """
+    Declared tier dicts of a pricing that only changes at the given amounts.
+
+    price_at(amount) returns the (fee, exchange_rate) the provider charges for an
+    amount. It is evaluated at every breakpoint and once inside every interval
+    between them, so thresholds may be inclusive on either side.
+    """
+    points = sorted({round(float(b), 2) for b in breakpoints if math.isfinite(float(b))})
+    points = [point for point in points if point > 0]
+    if not points:
+        return []
+
+    # (min_amount, max_amount, probe amount)
+    segments = []
+    if points[0] > CENT:
+        segments.append((CENT, round(points[0] - CENT, 2), points[0] / 2))
+    for i, point in enumerate(points):
+        segments.append((point, point, point))
+        lower = round(point + CENT, 2)
+        if i + 1 < len(points):
+            upper, probe = round(points[i + 1] - CENT, 2), (point + points[i + 1]) / 2
+        else:
+            upper, probe = math.inf, point + 1
+        if upper >= lower:
+            segments.append((lower, upper, probe))
+
+    tiers = []
+    for min_amount, max_amount, probe in segments:
+        fee, exchange_rate = price_at(probe)
+        tiers.append(Tier(min_amount, max_amount, fee, exchange_rate, 0))
+    return [
+        {
+            "min_amount": tier.min_amount,
+            "max_amount": None if math.isinf(tier.max_amount) else tier.max_amount,
+            "fee": tier.fee,
+            "exchange_rate": tier.exchange_rate,
+        }
+        for tier in _merge(tiers, 0, False)
+    ]
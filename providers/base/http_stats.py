@@ -0,0 +1,93 @@
+"""
+Byte and retry counts of the HTTP traffic of one provider call.
+
+The aggregator opens a call with track_call() around a provider's get_quote (or
+aget_quote). Hooks on the provider's HTTP clients add every response they see
+to the stats of the call running in the current thread or task:
+
+- instrument_session() hooks a requests.Session; the aggregator instruments the
+  sessions of every provider instance it leases, so providers don't have to;
+- record_httpx_response is installed on the shared httpx client (async_http).
+
+Responses outside a tracked call (warm-up, scripts) are not counted.
+"""
+import contextlib
+import contextvars
+from typing import Iterator, Optional
+
+import requests
+
+
+class CallStats:
+    """HTTP traffic of one provider call."""
+
+    __slots__ = ("responses", "bytes_received", "retries")
+
+    def __init__(self):
+        self.responses = 0
+        self.bytes_received = 0
+        self.retries = 0
+
+    def add(self, size: int, retries: int = 0):
+        self.responses += 1
+        self.bytes_received += size
+        self.retries += retries
+
+
+_current_call: contextvars.ContextVar[Optional[CallStats]] = contextvars.ContextVar(
+    "provider_call_stats", default=None
+)
+
+
+@contextlib.contextmanager
+def track_call() -> Iterator[CallStats]:
+    """Count the HTTP responses received in the current thread or task until exit."""
+    stats = CallStats()
+    token = _current_call.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_call.reset(token)
+
+
+def _content_length(headers) -> int:
+    try:
+        return int(headers.get("Content-Length") or 0)
+    except ValueError:
+        return 0
+
+
+def record_requests_response(response, *args, **kwargs):
+    """requests response hook: count the body size and the urllib3 retries made."""
+    stats = _current_call.get()
+    if stats is None:
+        return
+    if kwargs.get("stream"):
+        size = _content_length(response.headers)
+    else:
+        # Not streamed: requests reads the body right after the hooks anyway
+        size = len(response.content or b"")
+    retries = getattr(getattr(response.raw, "retries", None), "history", None) or ()
+    stats.add(size, len(retries))
+
+
+async def record_httpx_response(response):
+    """httpx response event hook; the body isn't read yet, so Content-Length is used."""
+    stats = _current_call.get()
+    if stats is not None:
+        stats.add(_content_length(response.headers))
+
+
+def instrument_session(session) -> None:
+    """Install the response hook on a requests.Session, once."""
+    if not isinstance(session, requests.Session):
+        return
+    hooks = session.hooks.setdefault("response", [])
+    if record_requests_response not in hooks:
+        hooks.append(record_requests_response)
+
+
+def instrument_provider(instance) -> None:
+    """Instrument the requests.Session a provider instance keeps, if any."""
+    for attr in ("session", "_session"):
+        instrument_session(getattr(instance, attr, None))
@@ -8,6 +8,14 @@ import uuid
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
 
+# error_code of a failed result when the provider does not serve the corridor at all,
+# as opposed to a transient failure. The aggregator remembers these per corridor.
+ERROR_CODE_CORRIDOR_UNSUPPORTED = "corridor_unsupported"
+
+# error_code of a failed result when the provider answered 429. The result may carry
+# the provider's Retry-After in retry_after (seconds); the aggregator backs off for it.
+ERROR_CODE_RATE_LIMITED = "rate_limited"
+
 
 class RemittanceProvider(abc.ABC):
     """
@@ -114,6 +122,14 @@ class RemittanceProvider(abc.ABC):
             "timestamp": timestamp,
         }
 
+        if raw_result.get("error_code"):
+            output["error_code"] = raw_result["error_code"]
+        if raw_result.get("retry_after") is not None:
+            output["retry_after"] = raw_result["retry_after"]
+        # Pricing tiers of the corridor, see providers.base.fee_schedule
+        if raw_result.get("fee_schedule"):
+            output["fee_schedule"] = raw_result["fee_schedule"]
+
         if provider_specific_data:
             output["raw_response"] = raw_result.get("raw_response")
 
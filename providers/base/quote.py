@@ -0,0 +1,174 @@
+"""
+Immutable quote record shared by the aggregator, transforms, cache and serializers.
+
+Providers still return dicts, which the aggregator turns into a Quote once, as
+they come back. Every later step reads that same object instead of copying it
+into another dict shape:
+
+- fields are stored in __slots__, with no per-instance dict;
+- provider ids, names, currency codes and methods are interned, so the thousands
+  of quotes held by the caches share one copy of each string;
+- pickling stores the field values positionally, without repeating the ~15 key
+  names of the dict in every cache entry.
+
+A Quote is a read-only Mapping: ``quote["fee"]``, ``quote.get(...)``, ``dict(quote)``
+and JSON encoding behave like they did on the provider dict. Every standard field
+is a key, None (null) when the provider gave no value, though ``get`` returns its
+default for those. The provider spellings ``receive_amount``, ``send_currency`` and
+``receive_currency`` read the matching fields. Keys a provider adds beyond the
+standard fields are kept, in order, in ``extra``.
+"""
+import dataclasses
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Provider spellings of the standard fields
+FIELD_ALIASES = {
+    "receive_amount": "destination_amount",
+    "send_currency": "source_currency",
+    "receive_currency": "destination_currency",
+}
+
+# Fields whose string values are interned
+_INTERNED = (
+    "provider_id",
+    "provider_name",
+    "source_currency",
+    "destination_currency",
+    "payment_method",
+    "delivery_method",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Quote(Mapping):
+    """One provider's answer for a corridor and amount, successful or not."""
+
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        "provider_id",
+        "provider_name",
+        "success",
+        "error_message",
+        "send_amount",
+        "source_currency",
+        "destination_amount",
+        "destination_currency",
+        "exchange_rate",
+        "fee",
+        "payment_method",
+        "delivery_method",
+        "delivery_time_minutes",
+        "timestamp",
+        "extra",
+    )
+
+    provider_id: Optional[str]
+    provider_name: Optional[str]
+    success: bool
+    error_message: Optional[str]
+    send_amount: Any
+    source_currency: Optional[str]
+    destination_amount: Any
+    destination_currency: Optional[str]
+    exchange_rate: Any
+    fee: Any
+    payment_method: Optional[str]
+    delivery_method: Optional[str]
+    delivery_time_minutes: Any
+    timestamp: Optional[str]
+    # Other keys the provider returned, as (key, value) pairs
+    extra: Tuple[Tuple[str, Any], ...]
+
+    def __post_init__(self):
+        for name in _INTERNED:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
+    @classmethod
+    def from_dict(cls, data: Mapping, **defaults: Any) -> "Quote":
+        """
+        Build a Quote from a provider result dict.
+
+        defaults fill standard fields the dict leaves empty, e.g. the provider_id of
+        the provider that was called. A Quote is returned as is when it needs no
+        defaults.
+        """
+        if isinstance(data, Quote):
+            missing = {k: v for k, v in defaults.items() if data.get(k) is None}
+            return data.replace(**missing) if missing else data
+
+        values: Dict[str, Any] = {}
+        extra = []
+        for key, value in data.items():
+            if key in _FIELD_SET:
+                values[key] = value
+            elif key not in FIELD_ALIASES:
+                extra.append((key, value))
+        # Aliases only fill fields the dict doesn't set under the standard name
+        for alias, field in FIELD_ALIASES.items():
+            if values.get(field) is None and data.get(alias) is not None:
+                values[field] = data[alias]
+        for key, value in defaults.items():
+            if values.get(key) is None:
+                values[key] = value
+
+        values["success"] = bool(values.get("success", False))
+        return cls(*(values.get(name) for name in _FIELDS), extra=tuple(extra))
+
+    def replace(self, **changes: Any) -> "Quote":
+        """A copy with some standard fields or extra keys changed."""
+        fields = {k: v for k, v in changes.items() if k in _FIELD_SET}
+        extra = {k: v for k, v in changes.items() if k not in _FIELD_SET}
+        if extra:
+            fields["extra"] = tuple({**dict(self.extra), **extra}.items())
+        return dataclasses.replace(self, **fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The quote as a plain dict, in the shape providers return."""
+        return dict(self)
+
+    # Mapping interface
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """The value of key; default for a standard field that has no value."""
+        name = FIELD_ALIASES.get(key, key)
+        if name in _FIELD_SET:
+            value = getattr(self, name)
+            return default if value is None else value
+        for extra_key, value in self.extra:
+            if extra_key == key:
+                return value
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET or self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _FIELDS
+        for key, _ in self.extra:
+            yield key
+
+    def __len__(self) -> int:
+        return len(_FIELDS) + len(self.extra)
+
+    # A tuple of field values pickles far smaller than the equivalent dict
+    def __reduce__(self):
+        return (Quote, tuple(getattr(self, name) for name in self.__slots__))
+
+
+# Standard fields, i.e. every slot but extra
+_FIELDS = Quote.__slots__[:-1]
+_FIELD_SET = frozenset(_FIELDS)
+
+_MISSING = object()
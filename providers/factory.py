@@ -1,45 +1,48 @@
 """
 Factory for creating remittance provider instances.
 """
-from typing import Dict, Type
+import importlib
+from typing import Dict, Type, Union
 
-from .alansari.integration import AlAnsariProvider
 from .base.provider import RemittanceProvider
-from .dahabshiil.integration import DahabshiilProvider
-from .mukuru.integration import MukuruProvider
-from .orbitremit.integration import OrbitRemitProvider
-from .paysend.integration import PaysendProvider
-from .placid.integration import PlacidProvider
-
-# Import only the providers we have confirmed are implemented
-from .remitbee.integration import RemitbeeProvider
-from .remitguru.integration import RemitGuruProvider
-from .rewire.integration import RewireProvider
-from .sendwave.integration import WaveProvider as SendwaveProvider
-from .wirebarley.integration import WireBarleyProvider
-from .xe.integration import XEProvider
 
 
 class ProviderFactory:
-    """Factory for creating and managing remittance provider instances."""
+    """
+    Factory for creating and managing remittance provider instances.
+
+    Providers are registered by dotted class path and imported on first use, so
+    importing the providers package doesn't load every integration and its
+    dependencies (Selenium, Playwright, BeautifulSoup, ...).
+    """
 
-    _providers: Dict[str, Type[RemittanceProvider]] = {
+    _providers: Dict[str, Union[str, Type[RemittanceProvider]]] = {
         # Include only the providers we've implemented and confirmed
-        "REMITBEE": RemitbeeProvider,
-        "REMITGURU": RemitGuruProvider,
-        "XE": XEProvider,
-        "SENDWAVE": SendwaveProvider,
-        "REWIRE": RewireProvider,
-        "MUKURU": MukuruProvider,
-        "DAHABSHIIL": DahabshiilProvider,
-        "ALANSARI": AlAnsariProvider,
-        "PLACID": PlacidProvider,
-        "ORBITREMIT": OrbitRemitProvider,
-        "WIREBARLEY": WireBarleyProvider,
-        "PAYSEND": PaysendProvider,
+        "REMITBEE": "providers.remitbee.integration.RemitbeeProvider",
+        "REMITGURU": "providers.remitguru.integration.RemitGuruProvider",
+        "XE": "providers.xe.integration.XEProvider",
+        "SENDWAVE": "providers.sendwave.integration.WaveProvider",
+        "REWIRE": "providers.rewire.integration.RewireProvider",
+        "MUKURU": "providers.mukuru.integration.MukuruProvider",
+        "DAHABSHIIL": "providers.dahabshiil.integration.DahabshiilProvider",
+        "ALANSARI": "providers.alansari.integration.AlAnsariProvider",
+        "PLACID": "providers.placid.integration.PlacidProvider",
+        "ORBITREMIT": "providers.orbitremit.integration.OrbitRemitProvider",
+        "WIREBARLEY": "providers.wirebarley.integration.WireBarleyProvider",
+        "PAYSEND": "providers.paysend.integration.PaysendProvider",
         # Add more providers as they are implemented and confirmed
     }
 
+    @classmethod
+    def _resolve(cls, name: str) -> Type[RemittanceProvider]:
+        """Import a registered provider class, replacing its path with the class."""
+        provider_class = cls._providers[name]
+        if isinstance(provider_class, str):
+            module_path, class_name = provider_class.rsplit(".", 1)
+            provider_class = getattr(importlib.import_module(module_path), class_name)
+            cls._providers[name] = provider_class
+        return provider_class
+
     @classmethod
     def get_provider(cls, provider_name: str, **kwargs) -> RemittanceProvider:
         """
@@ -60,17 +63,19 @@ class ProviderFactory:
         if provider_name_upper not in cls._providers:
             raise ValueError(f"Unsupported provider: {provider_name}")
 
-        provider_class = cls._providers[provider_name_upper]
+        provider_class = cls._resolve(provider_name_upper)
         return provider_class(**kwargs)
 
     @classmethod
-    def register_provider(cls, name: str, provider_class: Type[RemittanceProvider]) -> None:
+    def register_provider(
+        cls, name: str, provider_class: Union[str, Type[RemittanceProvider]]
+    ) -> None:
         """
         Register a new provider class.
 
         Args:
             name: Name to register the provider under
-            provider_class: The provider class to register
+            provider_class: The provider class, or its dotted path to import lazily
         """
         cls._providers[name] = provider_class
 
@@ -79,10 +84,12 @@ class ProviderFactory:
         """
         Get a dictionary of all available providers.
 
+        This imports every registered provider.
+
         Returns:
             Dictionary mapping provider names to provider classes
         """
-        return dict(cls._providers)
+        return {name: cls._resolve(name) for name in list(cls._providers)}
 
     @classmethod
     def list_providers(cls) -> list:
@@ -246,8 +246,14 @@ class PangeaProvider(RemittanceProvider):
         **kwargs,
     ) -> Dict[str, Any]:
         """Aggregator style get_exchange_rate returning standardized fields."""
-        # local dict to store raw info
-        local_result = {
+        return self._get_exchange_rates(
+            [send_amount], send_currency, receive_country, receive_currency, send_country, **kwargs
+        )[0]
+
+    def _new_local_result(
+        self, send_amount: Decimal, send_currency: str, receive_currency: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
             "success": False,
             "error_message": None,
             "send_amount": float(send_amount),
@@ -260,26 +266,81 @@ class PangeaProvider(RemittanceProvider):
             "timestamp": datetime.now(UTC).isoformat(),
         }
 
+    def _get_exchange_rates(
+        self,
+        send_amounts: List[Decimal],
+        send_currency: str,
+        receive_country: str,
+        receive_currency: Optional[str] = None,
+        send_country: str = "US",
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Price every send amount from a single Fees & FX request."""
+        # local dicts to store raw info
+        local_results = [
+            self._new_local_result(amount, send_currency, receive_currency)
+            for amount in send_amounts
+        ]
+
+        def fail(local_result, message):
+            local_result["error_message"] = message
+            return self.standardize_response(local_result)
+
         # If no receive_currency, derive from COUNTRY_TO_CURRENCY
         if not receive_currency:
             receive_currency = self.COUNTRY_TO_CURRENCY.get(receive_country)
             if not receive_currency:
-                local_result["error_message"] = f"No default currency mapped for {receive_country}"
-                return self.standardize_response(local_result)
+                message = f"No default currency mapped for {receive_country}"
+                return [fail(local_result, message) for local_result in local_results]
 
         # Basic validation
-        if send_amount <= 0:
-            local_result["error_message"] = f"Invalid send_amount: {send_amount}"
-            return self.standardize_response(local_result)
+        pending = []
+        results: List[Optional[Dict[str, Any]]] = []
+        for amount, local_result in zip(send_amounts, local_results):
+            if amount <= 0:
+                results.append(fail(local_result, f"Invalid send_amount: {amount}"))
+            else:
+                results.append(None)
+                pending.append(len(results) - 1)
+        if not pending:
+            return results
 
         try:
-            # 1) call get_fees_and_fx to retrieve raw Fees & FX JSON
+            # 1) call get_fees_and_fx to retrieve raw Fees & FX JSON, once for all amounts
             fees_data = self.get_fees_and_fx(
                 source_country=send_country,
                 target_country=receive_country,
                 source_currency=send_currency,
                 target_currency=receive_currency,
             )
+        except (PangeaError, PangeaConnectionError, PangeaValidationError) as exc:
+            self.logger.error(f"Pangea error: {exc}")
+            fees_data, message = None, str(exc)
+        except Exception as exc:
+            self.logger.error(f"Unexpected error in get_exchange_rate: {exc}")
+            fees_data, message = None, f"Unexpected error: {exc}"
+
+        for i in pending:
+            if fees_data is None:
+                results[i] = fail(local_results[i], message)
+            else:
+                results[i] = self._quote_from_fees_and_fx(
+                    fees_data,
+                    local_results[i],
+                    receive_currency,
+                    include_raw=kwargs.get("include_raw", False),
+                )
+        return results
+
+    def _quote_from_fees_and_fx(
+        self,
+        fees_data: Dict[str, Any],
+        local_result: Dict[str, Any],
+        receive_currency: str,
+        include_raw: bool = False,
+    ) -> Dict[str, Any]:
+        """Price local_result["send_amount"] from a get_fees_and_fx response."""
+        try:
             if not fees_data:
                 local_result["error_message"] = "Empty or invalid FeesAndFX data from Pangea"
                 return self.standardize_response(local_result)
@@ -314,7 +375,7 @@ class PangeaProvider(RemittanceProvider):
             local_result["fee"] = fee_val
 
             # 4) compute final destination_amount = (send_amount - fee) * rate
-            adj_send_amount = float(send_amount) - fee_val
+            adj_send_amount = local_result["send_amount"] - fee_val
             if adj_send_amount < 0:
                 adj_send_amount = 0.0
             local_result["destination_amount"] = adj_send_amount * rate_val
@@ -322,16 +383,11 @@ class PangeaProvider(RemittanceProvider):
             local_result["success"] = True
             local_result["destination_currency"] = receive_currency  # finalize
 
-        except (PangeaError, PangeaConnectionError, PangeaValidationError) as exc:
-            self.logger.error(f"Pangea error: {exc}")
-            local_result["error_message"] = str(exc)
         except Exception as exc:
             self.logger.error(f"Unexpected error in get_exchange_rate: {exc}")
             local_result["error_message"] = f"Unexpected error: {exc}"
 
-        return self.standardize_response(
-            local_result, provider_specific_data=kwargs.get("include_raw", False)
-        )
+        return self.standardize_response(local_result, provider_specific_data=include_raw)
 
     def get_quote(
         self,
@@ -352,6 +408,30 @@ class PangeaProvider(RemittanceProvider):
             **kwargs,
         )
 
+    def get_quotes_for_amounts(
+        self,
+        amounts: List[Decimal],
+        source_currency: str,
+        target_currency: str,
+        source_country: str = "US",
+        target_country: str = "MX",
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Quotes for several amounts of one corridor, in the order of amounts.
+
+        Pangea's Fees & FX data doesn't depend on the amount, so it is fetched once
+        and every amount is priced from it.
+        """
+        return self._get_exchange_rates(
+            amounts,
+            send_currency=source_currency,
+            receive_country=target_country,
+            receive_currency=target_currency,
+            send_country=source_country,
+            **kwargs,
+        )
+
     def get_fees_and_fx(
         self,
         source_country: str,
@@ -4,6 +4,7 @@ Custom exceptions for the Paysend provider.
 from typing import Any, Dict, Optional
 
 from providers.base.exceptions import ProviderError
+from providers.base.provider import ERROR_CODE_RATE_LIMITED
 
 
 class PaysendError(ProviderError):
@@ -36,7 +37,11 @@ class PaysendValidationError(PaysendError):
 class PaysendRateLimitError(PaysendError):
     """Error when rate limits are exceeded for Paysend API."""
 
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(
+            message, error_code=ERROR_CODE_RATE_LIMITED, details={"retry_after": retry_after}
+        )
+        self.retry_after = retry_after
 
 
 class PaysendApiError(PaysendError):
@@ -290,10 +290,11 @@ class PaysendProvider(RemittanceProvider):
             }
         )
 
+        # 429s are not retried here: _make_api_request reports them to the rate governor
         retry_strategy = Retry(
             total=3,
             backoff_factor=1.0,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
         adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
@@ -317,8 +318,8 @@ class PaysendProvider(RemittanceProvider):
         Raises:
             PaysendApiError: If the API returns an error
             PaysendConnectionError: If connection fails after retries
-            PaysendAuthError: If authentication fails
-            PaysendCaptchaError: If captcha detected
+            PaysendAuthenticationError: If authentication fails or a captcha is served
+            PaysendRateLimitError: If the API answers 429
         """
         attempt = 0
         last_error = None
@@ -357,13 +358,15 @@ class PaysendProvider(RemittanceProvider):
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
 
-                # Check for rate limiting (429) and wait if needed
+                # Rate limited: give up instead of sleeping in the request thread, the
+                # aggregator's rate governor backs off for Retry-After
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("retry-after", 5))
-                    logger.warning(f"Rate limited by Paysend API. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    attempt += 1
-                continue
+                    retry_after = response.headers.get("retry-after")
+                    logger.warning(f"Rate limited by Paysend API (Retry-After: {retry_after})")
+                    raise PaysendRateLimitError(
+                        "Rate limited by Paysend API",
+                        retry_after=float(retry_after) if (retry_after or "").isdigit() else None,
+                    )
 
                 # Check for authentication errors
                 if response.status_code in [401, 403]:
@@ -375,7 +378,7 @@ class PaysendProvider(RemittanceProvider):
                         attempt += 1
                         continue
                     else:
-                        raise PaysendAuthError("Failed to refresh authentication")
+                        raise PaysendAuthenticationError("Failed to refresh authentication")
 
                 # Handle other error status codes
                 if response.status_code >= 400:
@@ -395,7 +398,7 @@ class PaysendProvider(RemittanceProvider):
                 # Check response content for captcha challenge
                 if "captcha" in response.text.lower():
                     logger.warning("Captcha detected in Paysend response")
-                    raise PaysendCaptchaError("Captcha challenge detected")
+                    raise PaysendAuthenticationError("Captcha challenge detected")
 
                 # Try to parse JSON response
                 try:
@@ -423,7 +426,11 @@ class PaysendProvider(RemittanceProvider):
                     wait_time = 2**attempt
                     logger.info(f"Retrying in {wait_time} seconds...")
                     time.sleep(wait_time)
-            except (PaysendApiError, PaysendAuthError, PaysendCaptchaError) as e:
+            except (
+                PaysendApiError,
+                PaysendAuthenticationError,
+                PaysendRateLimitError,
+            ) as e:
                 # These are more serious errors that we should propagate
                 raise
             except Exception as e:
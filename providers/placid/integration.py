@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
-from providers.base.provider import RemittanceProvider
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED, RemittanceProvider
 from providers.utils.country_currency_standards import (
     normalize_country_code,
     validate_corridor,
@@ -109,6 +109,9 @@ class PlacidProvider(RemittanceProvider):
             "timestamp": raw_result.get("timestamp", datetime.datetime.now().isoformat()),
         }
 
+        if raw_result.get("error_code"):
+            output["error_code"] = raw_result["error_code"]
+
         if provider_specific_data and "raw_response" in raw_result:
             output["raw_response"] = raw_result["raw_response"]
 
@@ -344,6 +347,7 @@ class PlacidProvider(RemittanceProvider):
             local_res[
                 "error_message"
             ] = f"Unsupported destination currency {dest_currency} for Placid"
+            local_res["error_code"] = ERROR_CODE_CORRIDOR_UNSUPPORTED
             return self.standardize_response(local_res)
 
         # Get rate
@@ -370,6 +374,10 @@ class PlacidProvider(RemittanceProvider):
             # Apply standardization and return
             return self.standardize_response(local_res)
 
+        except PlacidCorridorUnsupportedError as e:
+            local_res["error_message"] = str(e)
+            local_res["error_code"] = ERROR_CODE_CORRIDOR_UNSUPPORTED
+            return self.standardize_response(local_res)
         except PlacidError as e:
             local_res["error_message"] = str(e)
             return self.standardize_response(local_res)
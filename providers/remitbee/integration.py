@@ -604,6 +604,40 @@ class RemitbeeProvider(RemittanceProvider):
                 }
             )
 
+    def get_quotes_for_amounts(
+        self,
+        amounts: List[Decimal],
+        source_currency: str,
+        dest_currency: str,
+        source_country: str,
+        dest_country: str,
+        payment_method: Optional[str] = None,
+        delivery_method: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Quotes for several amounts of one corridor, in the order of amounts.
+
+        The rates table is refreshed at most once for the whole batch. Amounts up to
+        200 CAD are priced from it; larger amounts still need Remitbee's quote API for
+        their fee, one request each.
+        """
+        if source_currency.upper() == "CAD" and source_country.upper() == "CA":
+            self._ensure_rates_are_current()
+        return [
+            self.get_quote(
+                amount,
+                source_currency,
+                dest_currency,
+                source_country,
+                dest_country,
+                payment_method=payment_method,
+                delivery_method=delivery_method,
+                **kwargs,
+            )
+            for amount in amounts
+        ]
+
     def get_exchange_rate(
         self, send_amount: Decimal, send_currency: str, target_currency: str, **kwargs
     ) -> Dict[str, Any]:
@@ -4,8 +4,10 @@ import time
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
 
+from providers.base.async_http import get_async_client
 from providers.base.provider import RemittanceProvider
 from providers.rewire.exceptions import (
     RewireApiError,
@@ -94,6 +96,9 @@ class RewireProvider(RemittanceProvider):
             "timestamp": raw_result.get("timestamp", time.time()),
         }
 
+        if raw_result.get("fee_schedule"):
+            output["fee_schedule"] = raw_result["fee_schedule"]
+
         if provider_specific_data and "details" in raw_result:
             output["details"] = raw_result["details"]
 
@@ -141,6 +146,50 @@ class RewireProvider(RemittanceProvider):
             logger.error("Connection error fetching Rewire pricing: %s", str(e))
             raise RewireConnectionError(f"Failed to connect to Rewire pricing API: {str(e)}")
 
+    async def afetch_rates(self) -> Dict[str, Any]:
+        logger.info("Fetching Rewire rates from %s (async)", self.RATES_URL)
+        try:
+            resp = await get_async_client().get(
+                self.RATES_URL, headers=dict(self.session.headers), timeout=15
+            )
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("Connection error fetching Rewire rates: %s", str(e))
+            raise RewireConnectionError(f"Failed to connect to Rewire API: {str(e)}")
+
+        try:
+            data = resp.json()
+        except json.JSONDecodeError as e:
+            raise RewireResponseError(f"Failed to parse JSON: {str(e)}")
+
+        if "rates" not in data:
+            raise RewireResponseError("Missing 'rates' field in Rewire response")
+
+        self.cached_rates = data["rates"]
+        self.last_fetch_timestamp = data.get("timestamp", 0)
+        logger.debug("Cached rates for %d sending countries", len(self.cached_rates))
+        return data
+
+    async def afetch_pricing(self) -> Dict[str, Any]:
+        logger.info("Fetching Rewire public pricing from %s (async)", self.PRICING_URL)
+        try:
+            resp = await get_async_client().get(
+                self.PRICING_URL, headers=dict(self.session.headers), timeout=15
+            )
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("Connection error fetching Rewire pricing: %s", str(e))
+            raise RewireConnectionError(f"Failed to connect to Rewire pricing API: {str(e)}")
+
+        try:
+            data = resp.json()
+        except json.JSONDecodeError as e:
+            raise RewireResponseError(f"Failed to parse JSON pricing data: {str(e)}")
+
+        logger.debug("Got pricing data with %d top-level keys", len(data))
+        self.cached_fees = data
+        return data
+
     def _ensure_rates_loaded(self):
         if not self.cached_rates:
             self.fetch_rates()
@@ -149,9 +198,11 @@ class RewireProvider(RemittanceProvider):
         return self.COUNTRY_TO_CURRENCY.get(receive_country, "USD")
 
     def _get_fee_for_corridor(
-        self, send_currency: str, receive_currency: str, send_amount: float
+        self, send_currency: str, receive_currency: str, send_amount: float, allow_fetch=True
     ) -> float:
         if not self.cached_fees:
+            if not allow_fetch:
+                raise RewireResponseError("Pricing data has not been loaded")
             self.fetch_pricing()
 
         if send_currency not in self.cached_fees:
@@ -173,6 +224,25 @@ class RewireProvider(RemittanceProvider):
             f"No matching fee tier found for corridor {send_currency}->{receive_currency}"
         )
 
+    def _fee_schedule_for_corridor(
+        self, send_currency: str, receive_currency: str
+    ) -> List[Dict[str, Any]]:
+        """The corridor's fee tiers from the loaded pricing data, as fee_schedule tiers."""
+        corridor_info = (self.cached_fees or {}).get(send_currency, {}).get(receive_currency) or []
+        schedule = []
+        for tier in corridor_info:
+            tier_to = tier.get("to")
+            schedule.append(
+                {
+                    "min_amount": tier.get("from", 0),
+                    "max_amount": None if tier_to in (None, float("inf")) else tier_to,
+                    "fee": float(tier.get("fee", 0.0)),
+                    # The rate doesn't depend on the amount
+                    "exchange_rate": None,
+                }
+            )
+        return schedule
+
     def is_corridor_supported(self, send_country: str, receive_country: str) -> bool:
         if (send_country, receive_country) in self.SUPPORTED_CORRIDORS:
             return True
@@ -211,18 +281,132 @@ class RewireProvider(RemittanceProvider):
         try:
             self._ensure_rates_loaded()
         except (RewireConnectionError, RewireResponseError) as e:
-            return self.standardize_response(
-                {
-                    "success": False,
-                    "error_message": f"Failed to fetch rates: {str(e)}",
-                    "send_amount": float(amount),
-                    "send_currency": source_currency,
-                    "destination_currency": dest_currency,
-                    "payment_method": payment_method or self.DEFAULT_PAYMENT_METHOD,
-                    "delivery_method": delivery_method or self.DEFAULT_DELIVERY_METHOD,
-                }
+            return self._rates_unavailable_response(
+                e, amount, source_currency, dest_currency, payment_method, delivery_method
+            )
+
+        return self._build_quote(
+            amount,
+            source_currency,
+            dest_currency,
+            source_country,
+            payment_method,
+            delivery_method,
+        )
+
+    def get_quotes_for_amounts(
+        self,
+        amounts: List[Decimal],
+        source_currency: str,
+        dest_currency: str,
+        source_country: str,
+        dest_country: str,
+        payment_method: Optional[str] = None,
+        delivery_method: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Quotes for several amounts of one corridor, in the order of amounts.
+
+        Rates and pricing tiers are loaded once; each amount is priced from them.
+        """
+        try:
+            self._ensure_rates_loaded()
+        except (RewireConnectionError, RewireResponseError) as e:
+            return [
+                self._rates_unavailable_response(
+                    e, amount, source_currency, dest_currency, payment_method, delivery_method
+                )
+                for amount in amounts
+            ]
+
+        # Try the pricing tiers once rather than once per amount if they can't be fetched
+        if not self.cached_fees:
+            try:
+                self.fetch_pricing()
+            except (RewireConnectionError, RewireResponseError) as e:
+                logger.warning(f"Could not fetch Rewire pricing: {str(e)}")
+
+        return [
+            self._build_quote(
+                amount,
+                source_currency,
+                dest_currency,
+                source_country,
+                payment_method,
+                delivery_method,
+                allow_fetch=False,
             )
+            for amount in amounts
+        ]
+
+    async def aget_quote(
+        self,
+        amount: Decimal,
+        source_currency: str,
+        dest_currency: str,
+        source_country: str,
+        dest_country: str,
+        payment_method: Optional[str] = None,
+        delivery_method: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Non-blocking variant of get_quote used by Aggregator.aget_all_quotes."""
+        try:
+            if not self.cached_rates:
+                await self.afetch_rates()
+        except (RewireConnectionError, RewireResponseError) as e:
+            return self._rates_unavailable_response(
+                e, amount, source_currency, dest_currency, payment_method, delivery_method
+            )
+
+        if not self.cached_fees:
+            try:
+                await self.afetch_pricing()
+            except (RewireConnectionError, RewireResponseError) as e:
+                logger.warning(f"Could not fetch Rewire pricing: {str(e)}")
+
+        return self._build_quote(
+            amount,
+            source_currency,
+            dest_currency,
+            source_country,
+            payment_method,
+            delivery_method,
+            allow_fetch=False,
+        )
 
+    def _rates_unavailable_response(
+        self,
+        error: Exception,
+        amount: Decimal,
+        source_currency: str,
+        dest_currency: str,
+        payment_method: Optional[str],
+        delivery_method: Optional[str],
+    ) -> Dict[str, Any]:
+        return self.standardize_response(
+            {
+                "success": False,
+                "error_message": f"Failed to fetch rates: {str(error)}",
+                "send_amount": float(amount),
+                "send_currency": source_currency,
+                "destination_currency": dest_currency,
+                "payment_method": payment_method or self.DEFAULT_PAYMENT_METHOD,
+                "delivery_method": delivery_method or self.DEFAULT_DELIVERY_METHOD,
+            }
+        )
+
+    def _build_quote(
+        self,
+        amount: Decimal,
+        source_currency: str,
+        dest_currency: str,
+        source_country: str,
+        payment_method: Optional[str],
+        delivery_method: Optional[str],
+        allow_fetch: bool = True,
+    ) -> Dict[str, Any]:
         if source_country not in self.cached_rates:
             return self.standardize_response(
                 {
@@ -274,7 +458,9 @@ class RewireProvider(RemittanceProvider):
         exchange_rate = destination_amount / float(amount)
 
         try:
-            fee = self._get_fee_for_corridor(source_currency, dest_currency, float(amount))
+            fee = self._get_fee_for_corridor(
+                source_currency, dest_currency, float(amount), allow_fetch=allow_fetch
+            )
         except (RewireConnectionError, RewireResponseError) as e:
             logger.warning(f"Could not fetch fee information: {str(e)}. Setting fee to None.")
             fee = None
@@ -304,6 +490,7 @@ class RewireProvider(RemittanceProvider):
                 "destination_amount": destination_amount,
                 "exchange_rate": exchange_rate,
                 "fee": fee,
+                "fee_schedule": self._fee_schedule_for_corridor(source_currency, dest_currency),
                 "payment_method": payment_method or self.DEFAULT_PAYMENT_METHOD,
                 "delivery_method": delivery_method or self.DEFAULT_DELIVERY_METHOD,
             }
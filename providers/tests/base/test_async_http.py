@@ -0,0 +1,40 @@
+"""
+Offline tests for the shared per-loop AsyncClient.
+"""
+
+import asyncio
+import warnings
+
+from providers.base.async_http import get_async_client
+
+
+async def clients_for_one_loop():
+    return get_async_client(), get_async_client()
+
+
+def test_each_loop_gets_one_client():
+    first, second = asyncio.run(clients_for_one_loop())
+    other_loop, _ = asyncio.run(clients_for_one_loop())
+
+    assert first is second
+    assert other_loop is not first
+
+
+def test_client_is_closed_when_its_loop_shuts_down():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        client, _ = asyncio.run(clients_for_one_loop())
+
+    assert client.is_closed
+
+
+def test_closed_client_is_replaced():
+    async def close_and_get_again():
+        client = get_async_client()
+        await client.aclose()
+        return client, get_async_client()
+
+    closed, replacement = asyncio.run(close_and_get_again())
+
+    assert replacement is not closed
+    assert replacement.is_closed
@@ -0,0 +1,73 @@
+"""
+Offline tests for piecewise fee schedules.
+"""
+
+from providers.base.fee_schedule import add_sample, declared_schedule, tiers_from_breakpoints
+
+HOUR = 3600
+TOLERANCE = 0.001
+
+
+def tiered_price(amount):
+    """4.99 under 500, free from 500; a better rate above 1000."""
+    return (4.99 if amount < 500 else 0.0), (1300.0 if amount <= 1000 else 1305.0)
+
+
+def test_breakpoints_become_declared_tiers_with_inclusive_bounds():
+    tiers = tiers_from_breakpoints([500, 1000, float("inf")], tiered_price)
+
+    assert tiers == [
+        {"min_amount": 0.01, "max_amount": 499.99, "fee": 4.99, "exchange_rate": 1300.0},
+        {"min_amount": 500.0, "max_amount": 1000.0, "fee": 0.0, "exchange_rate": 1300.0},
+        {"min_amount": 1000.01, "max_amount": None, "fee": 0.0, "exchange_rate": 1305.0},
+    ]
+    schedule = declared_schedule(tiers, observed_at=0)
+    assert schedule.price(499.99) == (4.99, 1300.0)
+    assert schedule.price(500) == (0.0, 1300.0)
+    assert schedule.price(25000) == (0.0, 1305.0)
+
+
+def test_declared_schedule_does_not_price_amounts_outside_its_tiers():
+    schedule = declared_schedule(
+        [{"min_amount": 10, "max_amount": 1000, "fee": 3}, {"min_amount": 2000, "fee": 0}],
+        observed_at=0,
+    )
+
+    assert schedule.price(500) == (3.0, None)
+    assert schedule.price(5) is None
+    assert schedule.price(1500) is None
+
+
+def test_equal_samples_span_the_amounts_between_them():
+    schedule = add_sample(None, 100, 3.0, 17.0, 0, HOUR, TOLERANCE)
+    # Within the drift tolerance: the same price, at the more recent rate
+    schedule = add_sample(schedule, 1000, 3.0, 17.001, 10, HOUR, TOLERANCE)
+
+    assert len(schedule.tiers) == 1
+    assert schedule.price(500) == (3.0, 17.001)
+    # Beyond the samples the nearest tier applies, as a flat fee did
+    assert schedule.price(50) == (3.0, 17.001)
+    assert schedule.price(5000) == (3.0, 17.001)
+
+
+def test_sample_inside_a_tier_at_another_price_splits_it():
+    schedule = add_sample(None, 100, 3.0, 17.0, 0, HOUR, TOLERANCE)
+    schedule = add_sample(schedule, 1000, 3.0, 17.0, 10, HOUR, TOLERANCE)
+    schedule = add_sample(schedule, 600, 5.0, 17.0, 20, HOUR, TOLERANCE)
+
+    assert [(t.min_amount, t.max_amount) for t in schedule.tiers] == [
+        (100, 100),
+        (600, 600),
+        (1000, 1000),
+    ]
+    # A breakpoint lies somewhere between differing samples
+    assert schedule.price(300) is None
+    assert schedule.price(600) == (5.0, 17.0)
+
+
+def test_samples_older_than_max_age_are_dropped():
+    schedule = add_sample(None, 100, 3.0, 17.0, 0, HOUR, TOLERANCE)
+    schedule = add_sample(schedule, 1000, 4.0, 17.0, 2 * HOUR, HOUR, TOLERANCE)
+
+    assert [t.min_amount for t in schedule.tiers] == [1000]
+    assert schedule.price(100) == (4.0, 17.0)
@@ -0,0 +1,88 @@
+"""
+Offline tests for the slotted Quote record.
+"""
+
+import json
+import pickle
+import sys
+
+from aggregator.quote_table import select_quotes
+from providers.base.quote import Quote
+
+PROVIDER_DICT = {
+    "provider_id": "WISE",
+    "provider_name": "Wise",
+    "success": True,
+    "error_message": None,
+    "send_amount": 1000.0,
+    "source_currency": "USD",
+    "destination_amount": 17150.0,
+    "destination_currency": "MXN",
+    "exchange_rate": 17.32,
+    "fee": 9.85,
+    "payment_method": "bank_transfer",
+    "delivery_method": "bank_deposit",
+    "delivery_time_minutes": 1440,
+    "delivery_methods": [{"method": "bank_deposit", "time_minutes": 1440}],
+    "timestamp": "2026-10-16T20:00:00",
+}
+
+
+def test_reads_like_the_provider_dict():
+    quote = Quote.from_dict(PROVIDER_DICT)
+
+    assert quote["fee"] == 9.85
+    assert quote.get("delivery_methods") == PROVIDER_DICT["delivery_methods"]
+    # Provider spellings read the standard fields
+    assert quote["receive_amount"] == 17150.0
+    assert quote.get("send_currency") == "USD"
+    # Standard fields stay keys without a value; get() falls back to its default
+    assert quote["error_message"] is None
+    assert quote.get("error_message", "none") == "none"
+    assert dict(quote) == PROVIDER_DICT
+    assert json.loads(json.dumps(quote.to_dict())) == dict(quote)
+
+
+def test_failed_result_keeps_the_fields_it_has_no_value_for():
+    quote = Quote.from_dict({"success": False, "exchange_rate": None, "error_message": "Down"})
+
+    assert quote["exchange_rate"] is None
+    assert json.loads(json.dumps(quote.to_dict()))["fee"] is None
+    assert "exchange_rate" in quote and "raw_response" not in quote
+
+
+def test_from_dict_fills_defaults_and_aliases():
+    quote = Quote.from_dict(
+        {"success": 1, "receive_amount": 50.0, "send_currency": "GBP"}, provider_id="XE"
+    )
+
+    assert quote.success is True
+    assert quote.provider_id == "XE"
+    assert quote.destination_amount == 50.0
+    assert quote.source_currency == "GBP"
+    # A finished record is reused as is
+    assert Quote.from_dict(quote, provider_id="OTHER") is quote
+
+
+def test_replace_keeps_the_record_immutable():
+    quote = Quote.from_dict(PROVIDER_DICT)
+    hedged = quote.replace(hedged=True, fee=0.0)
+
+    assert hedged["hedged"] is True and hedged.fee == 0.0
+    assert "hedged" not in quote and quote.fee == 9.85
+
+
+def test_interned_codes_and_compact_pickle():
+    quote = Quote.from_dict({**PROVIDER_DICT, "source_currency": "".join(["U", "SD"])})
+
+    assert not hasattr(quote, "__dict__")
+    assert quote.source_currency is sys.intern("USD")
+    assert pickle.loads(pickle.dumps(quote)) == quote
+    assert len(pickle.dumps(quote, -1)) < 0.6 * len(pickle.dumps(PROVIDER_DICT, -1))
+
+
+def test_quote_table_reads_records():
+    slow = Quote.from_dict({**PROVIDER_DICT, "provider_id": "SLOW", "exchange_rate": 17.0})
+    quotes = select_quotes([slow, Quote.from_dict(PROVIDER_DICT)], "best_rate")
+
+    assert [q.provider_id for q in quotes] == ["WISE", "SLOW"]
@@ -0,0 +1,52 @@
+"""
+Offline tests for the error codes of failed TransferGo quotes.
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED
+from providers.transfergo.integration import TransferGoProvider
+
+
+def get_quote(monkeypatch, status_code, message, **corridor):
+    provider = TransferGoProvider()
+    response = MagicMock(ok=False, status_code=status_code)
+    response.json.return_value = {"error": {"message": message}}
+    monkeypatch.setattr(provider.session, "get", lambda *args, **kwargs: response)
+    return provider.get_quote(
+        amount=Decimal("100"),
+        **{
+            "source_country": "DE",
+            "source_currency": "EUR",
+            "destination_country": "UA",
+            "destination_currency": "UAH",
+            **corridor,
+        },
+    )
+
+
+def test_422_for_an_unsupported_currency_marks_the_corridor_unsupported(monkeypatch):
+    quote = get_quote(monkeypatch, 422, "Currency UAH is not supported for this route")
+
+    assert quote["success"] is False
+    assert quote["error_code"] == ERROR_CODE_CORRIDOR_UNSUPPORTED
+
+
+@pytest.mark.parametrize(
+    "message", ["Amount must be between 1 and 10000", "Invalid value for calculationBase"]
+)
+def test_422_for_invalid_parameters_is_a_generic_failure(monkeypatch, message):
+    quote = get_quote(monkeypatch, 422, message)
+
+    assert quote["success"] is False
+    assert quote.get("error_code") is None
+    assert message in quote["error_message"]
+
+
+def test_corridor_missing_from_the_static_table_is_unsupported(monkeypatch):
+    quote = get_quote(monkeypatch, 422, "unused", destination_country="AQ")
+
+    assert quote["error_code"] == ERROR_CODE_CORRIDOR_UNSUPPORTED
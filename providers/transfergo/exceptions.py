@@ -27,7 +27,16 @@ class TransferGoValidationError(TransferGoError):
     pass
 
 
+class TransferGoUnsupportedCorridorError(TransferGoValidationError):
+    """Raised when TransferGo does not serve the requested corridor."""
+
+    pass
+
+
 class TransferGoRateLimitError(TransferGoError):
     """Raised when TransferGo's rate limit is exceeded."""
 
-    pass
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        # Seconds from the Retry-After header, if TransferGo sent one
+        self.retry_after = retry_after
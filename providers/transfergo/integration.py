@@ -18,12 +18,17 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # Import base provider class and exceptions
-from providers.base.provider import RemittanceProvider
+from providers.base.provider import (
+    ERROR_CODE_CORRIDOR_UNSUPPORTED,
+    ERROR_CODE_RATE_LIMITED,
+    RemittanceProvider,
+)
 from providers.transfergo.exceptions import (
     TransferGoAuthenticationError,
     TransferGoConnectionError,
     TransferGoError,
     TransferGoRateLimitError,
+    TransferGoUnsupportedCorridorError,
     TransferGoValidationError,
 )
 
@@ -43,6 +48,14 @@ from providers.transfergo.transfergo_mappings import (
 logger = logging.getLogger(__name__)
 
 
+def _is_unsupported_corridor_message(message: str) -> bool:
+    """Whether a TransferGo validation error says the currency or corridor isn't served."""
+    message = message.lower()
+    return any(
+        phrase in message for phrase in ("not supported", "unsupported", "not available")
+    ) and any(subject in message for subject in ("currency", "corridor", "country", "route"))
+
+
 class TransferGoProvider(RemittanceProvider):
     """
     Aggregator-ready TransferGo integration.
@@ -89,10 +102,11 @@ class TransferGoProvider(RemittanceProvider):
         """Configure the requests session with headers and retry logic."""
         self.session.headers.update({"User-Agent": self.user_agent, **API_CONFIG["headers"]})
 
+        # 429s are not retried here: they are reported to the aggregator's rate governor
         retry_strategy = Retry(
             total=3,
             backoff_factor=1.0,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -147,6 +161,11 @@ class TransferGoProvider(RemittanceProvider):
             )
             standardized["available_payment_methods"] = payment_methods
 
+        if raw_result.get("error_code"):
+            standardized["error_code"] = raw_result["error_code"]
+        if raw_result.get("retry_after") is not None:
+            standardized["retry_after"] = raw_result["retry_after"]
+
         # Include raw response if requested
         if provider_specific_data and "raw_response" in raw_result:
             standardized["raw_response"] = raw_result["raw_response"]
@@ -208,12 +227,18 @@ class TransferGoProvider(RemittanceProvider):
                 if response.status_code == 401:
                     raise TransferGoAuthenticationError(f"Authentication error: {err_msg}")
                 elif response.status_code == 429:
-                    raise TransferGoRateLimitError("Rate limit exceeded")
+                    retry_after = response.headers.get("Retry-After", "")
+                    raise TransferGoRateLimitError(
+                        "Rate limit exceeded",
+                        retry_after=float(retry_after) if retry_after.isdigit() else None,
+                    )
                 elif response.status_code == 422:
-                    return {
-                        "success": False,
-                        "error_message": f"Validation error: Corridor not supported or invalid parameters",
-                    }
+                    result = {"success": False, "error_message": f"Validation error: {err_msg}"}
+                    # Only an unsupported currency or corridor says anything about the
+                    # corridor; an amount out of range or a bad parameter doesn't
+                    if _is_unsupported_corridor_message(err_msg):
+                        result["error_code"] = ERROR_CODE_CORRIDOR_UNSUPPORTED
+                    return result
                 else:
                     raise TransferGoError(f"API error ({response.status_code}): {err_msg}")
 
@@ -221,6 +246,8 @@ class TransferGoProvider(RemittanceProvider):
             data = response.json()
             return data
 
+        except TransferGoRateLimitError:
+            raise
         except requests.RequestException as e:
             raise TransferGoConnectionError(f"Connection error: {str(e)}")
         except ValueError as e:
@@ -249,7 +276,7 @@ class TransferGoProvider(RemittanceProvider):
             True if the corridor is supported, False otherwise
 
         Raises:
-            TransferGoValidationError: If the corridor is not supported
+            TransferGoUnsupportedCorridorError: If the corridor is not supported
         """
         if not is_corridor_supported(
             source_country, source_currency, destination_country, destination_currency
@@ -259,7 +286,7 @@ class TransferGoProvider(RemittanceProvider):
                 f"{destination_country}({destination_currency})"
             )
             logger.error(error_message)
-            raise TransferGoValidationError(error_message)
+            raise TransferGoUnsupportedCorridorError(error_message)
         return True
 
     def get_quote(
@@ -338,6 +365,12 @@ class TransferGoProvider(RemittanceProvider):
                 business=business,
             )
 
+            if data.get("success") is False:
+                base_result["error_message"] = data.get("error_message")
+                if data.get("error_code"):
+                    base_result["error_code"] = data["error_code"]
+                return self.standardize_response(base_result)
+
             # "options" is typically a list of different speed/fee combos
             options_list = data.get("options", [])
             if not options_list:
@@ -475,10 +508,25 @@ class TransferGoProvider(RemittanceProvider):
                 provider_specific_data=kwargs.get("provider_specific_data", False),
             )
 
+        except TransferGoValidationError as e:
+            err_msg = f"TransferGo error: {str(e)}"
+            logger.error(err_msg)
+            base_result["error_message"] = err_msg
+            # Raised by validate_corridor for corridors TransferGo does not serve
+            if isinstance(e, TransferGoUnsupportedCorridorError):
+                base_result["error_code"] = ERROR_CODE_CORRIDOR_UNSUPPORTED
+            return self.standardize_response(base_result)
+
+        except TransferGoRateLimitError as e:
+            logger.warning(f"TransferGo rate limit: {str(e)}")
+            base_result["error_message"] = f"TransferGo error: {str(e)}"
+            base_result["error_code"] = ERROR_CODE_RATE_LIMITED
+            base_result["retry_after"] = e.retry_after
+            return self.standardize_response(base_result)
+
         except (
             TransferGoError,
             TransferGoConnectionError,
-            TransferGoValidationError,
         ) as e:
             # Return a standardized error response
             err_msg = f"TransferGo error: {str(e)}"
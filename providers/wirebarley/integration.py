@@ -17,7 +17,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from urllib3.util.retry import Retry
 
-from providers.base.provider import RemittanceProvider
+from providers.base.fee_schedule import tiers_from_breakpoints
+from providers.base.provider import ERROR_CODE_CORRIDOR_UNSUPPORTED, RemittanceProvider
 from providers.utils.country_currency_standards import validate_corridor
 from providers.wirebarley.exceptions import (
     WireBarleyAPIError,
@@ -153,14 +154,17 @@ class WireBarleyProvider(RemittanceProvider):
 
         # If not successful, return minimal aggregator failure shape
         if not success:
-            return {
+            failure = {
                 "provider_id": self.name,
                 "success": False,
                 "error_message": error_message or "Unknown error from WireBarley",
             }
+            if result.get("error_code"):
+                failure["error_code"] = result["error_code"]
+            return failure
 
         # Otherwise fill aggregator success shape with standard field names
-        return {
+        output = {
             "provider_id": self.name,
             "success": True,
             "error_message": None,
@@ -177,6 +181,9 @@ class WireBarleyProvider(RemittanceProvider):
             "delivery_time_minutes": 1440,  # default 1 day in minutes
             "timestamp": result.get("timestamp", now_iso),
         }
+        if result.get("fee_schedule"):
+            output["fee_schedule"] = result["fee_schedule"]
+        return output
 
     def _create_session_with_retry(self):
         """Create requests session with retry capability."""
@@ -393,6 +400,7 @@ class WireBarleyProvider(RemittanceProvider):
                 "receive_currency": data.get("data", {}).get("receiveCurrency"),
                 "exchange_rate": wb_rate,
                 "fee": fee_val,
+                "fee_schedule": self._fee_schedule(corridor_obj),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "raw_data": data,  # Include raw API response for debugging
             }
@@ -446,6 +454,30 @@ class WireBarleyProvider(RemittanceProvider):
             # Fallback to standard rate
             return corridor_obj.get("exchangeRate") or corridor_obj.get("wbRate")
 
+    def _fee_schedule(self, corridor_obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fee and rate tiers of the corridor, from its fee arrays and rate thresholds."""
+        breakpoints = []
+        for fees_key in ("paymentFees", "transferFees"):
+            for fee_obj in corridor_obj.get(fees_key) or []:
+                keys = ["min", "max"] + [f"threshold{i}" for i in range(1, 11)]
+                breakpoints.extend(fee_obj.get(key) for key in keys)
+        rate_data = corridor_obj.get("wbRateData") or {}
+        breakpoints.extend(rate_data.get(f"threshold{i or ''}") for i in range(6))
+
+        def price_at(amount: float):
+            amount = Decimal(str(round(amount, 2)))
+            rate = self._pick_threshold_rate(corridor_obj, amount)
+            if not rate:
+                raise ValueError(f"no rate for {amount}")
+            return self._calculate_fee(corridor_obj, amount), float(rate)
+
+        try:
+            values = [float(b) for b in breakpoints if b is not None]
+            return tiers_from_breakpoints(values, price_at)
+        except (TypeError, ValueError) as e:
+            self.logger.debug(f"No fee schedule for corridor: {e}")
+            return []
+
     def _calculate_fee(self, corridor_obj: Dict[str, Any], amount: Decimal) -> float:
         """Calculate the fee for a transaction based on corridor data."""
         default_fee = 4.99
@@ -522,8 +554,7 @@ class WireBarleyProvider(RemittanceProvider):
             # First ensure we have a valid session
             self._ensure_valid_session()
 
-            # Determine country code for the send currency
-            source_country = self.CURRENCY_TO_COUNTRY.get(send_currency, send_currency[:2])
+            # Determine country code for the receive currency
             country_code = self.CURRENCY_TO_COUNTRY.get(receive_currency, receive_currency[:2])
 
             if not country_code:
@@ -537,100 +568,18 @@ class WireBarleyProvider(RemittanceProvider):
                     }
                 )
 
-            # Use public endpoint to get rates for all corridors in a single request
-            public_url = (
-                f"{self.BASE_URL}/my/remittance/api/v1/exrate/{source_country}/{send_currency}"
-            )
-
-            # Set API-specific headers - this is the key to making it work
-            api_headers = {
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "X-Requested-With": "XMLHttpRequest",
-                "Referer": self.BASE_URL + "/",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-                "Device-Type": "WEB",
-                "Device-Model": "Safari",
-                "Device-Version": "605.1.15",
-                "Lang": "en",
-                "Request-ID": str(uuid.uuid4()),
-                "Request-Time": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            }
-
-            self.logger.info(f"Fetching exchange rates from {public_url}")
-
-            # Use the existing session with the API-specific headers
-            self.session.headers.update(api_headers)
-            response = self.session.get(public_url, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("data") is not None and "exRates" in data["data"]:
-                    # Find the matching rate data for our corridor
-                    self.logger.info(f"Found {len(data['data']['exRates'])} exchange rates")
-                    for rate_data in data["data"]["exRates"]:
-                        if rate_data.get("currency") == receive_currency:
-                            # Found our corridor - extract rate information
-                            wb_rate = rate_data.get("wbRate", 0)
-
-                            # Get threshold-based rate if available
-                            if "wbRateData" in rate_data:
-                                threshold_rate = self._pick_threshold_rate(rate_data, send_amount)
-                                if threshold_rate:
-                                    wb_rate = threshold_rate
-
-                            # Calculate fee
-                            fee = self._calculate_fee(rate_data, send_amount)
-
-                            # Calculate destination amount
-                            destination_amount = send_amount * Decimal(str(wb_rate))
-
-                            self.logger.info(
-                                f"Rate found for {send_currency} to {receive_currency}: {wb_rate}"
-                            )
-
-                            # Format the response in the expected aggregator format
-                            raw_response = {
-                                "success": True,
-                                "source_amount": float(send_amount),
-                                "source_currency": send_currency,
-                                "destination_amount": float(destination_amount),
-                                "destination_currency": receive_currency,
-                                "exchange_rate": float(wb_rate),
-                                "fee": float(fee) if fee is not None else 0.0,
-                                "payment_method": "BANK",
-                                "delivery_method": "BANK",
-                                "delivery_time_minutes": 1440,  # 24 hours in minutes
-                                "timestamp": str(datetime.now(timezone.utc).isoformat()),
-                                "raw_data": {
-                                    "provider": "wirebarley",
-                                    "rate_data": rate_data,
-                                },
-                            }
-
-                            # Return standardized response
-                            return self.standardize_response(raw_response)
-
-                    # If we get here, we didn't find the currency
-                    return self.standardize_response(
-                        {
-                            "success": False,
-                            "error_message": f"Unsupported corridor: No exchange rate found for {send_currency} to {receive_currency}",
-                        }
-                    )
-                else:
-                    self.logger.error("API returned data in unexpected format")
-                    # Fallback to authenticated API if public API fails
-                    return self._try_authenticated_api(
-                        send_amount, send_currency, receive_currency, country_code
-                    )
-            else:
-                self.logger.error(f"Public API returned status {response.status_code}")
-                # Fallback to authenticated API if public API fails
-                return self._try_authenticated_api(
-                    send_amount, send_currency, receive_currency, country_code
+            rate_data, error = self._fetch_exchange_rate_data(send_currency, receive_currency)
+            if rate_data is not None:
+                return self._quote_from_rate_data(
+                    rate_data, send_amount, send_currency, receive_currency
                 )
+            if error is not None:
+                return error
+
+            # Fallback to authenticated API if public API fails
+            return self._try_authenticated_api(
+                send_amount, send_currency, receive_currency, country_code
+            )
 
         except Exception as e:
             self.logger.error(f"Error in get_exchange_rate: {str(e)}")
@@ -641,6 +590,115 @@ class WireBarleyProvider(RemittanceProvider):
                 }
             )
 
+    def _fetch_exchange_rate_data(self, send_currency: str, receive_currency: str):
+        """
+        Fetch the rate entry of a corridor from the public exchange rate endpoint.
+
+        The entry holds the threshold rates and fee arrays for every amount, so one
+        request can price any number of amounts.
+
+        Returns:
+            (rate_data, None) if the corridor is listed, (None, error response) if it
+            isn't, or (None, None) if the endpoint failed and the authenticated API
+            should be used instead.
+        """
+        source_country = self.CURRENCY_TO_COUNTRY.get(send_currency, send_currency[:2])
+
+        # Use public endpoint to get rates for all corridors in a single request
+        public_url = f"{self.BASE_URL}/my/remittance/api/v1/exrate/{source_country}/{send_currency}"
+
+        # Set API-specific headers - this is the key to making it work
+        api_headers = {
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "X-Requested-With": "XMLHttpRequest",
+            "Referer": self.BASE_URL + "/",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-origin",
+            "Device-Type": "WEB",
+            "Device-Model": "Safari",
+            "Device-Version": "605.1.15",
+            "Lang": "en",
+            "Request-ID": str(uuid.uuid4()),
+            "Request-Time": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+        }
+
+        self.logger.info(f"Fetching exchange rates from {public_url}")
+
+        # Use the existing session with the API-specific headers
+        self.session.headers.update(api_headers)
+        response = self.session.get(public_url, timeout=10)
+
+        if response.status_code != 200:
+            self.logger.error(f"Public API returned status {response.status_code}")
+            return None, None
+
+        data = response.json()
+        if data.get("data") is None or "exRates" not in data["data"]:
+            self.logger.error("API returned data in unexpected format")
+            return None, None
+
+        # Find the matching rate data for our corridor
+        self.logger.info(f"Found {len(data['data']['exRates'])} exchange rates")
+        for rate_data in data["data"]["exRates"]:
+            if rate_data.get("currency") == receive_currency:
+                return rate_data, None
+
+        # If we get here, we didn't find the currency
+        return None, self.standardize_response(
+            {
+                "success": False,
+                "error_message": f"Unsupported corridor: No exchange rate found for {send_currency} to {receive_currency}",
+                "error_code": ERROR_CODE_CORRIDOR_UNSUPPORTED,
+            }
+        )
+
+    def _quote_from_rate_data(
+        self,
+        rate_data: Dict[str, Any],
+        send_amount: Decimal,
+        send_currency: str,
+        receive_currency: str,
+    ) -> Dict[str, Any]:
+        """Price send_amount from a corridor's public rate entry."""
+        wb_rate = rate_data.get("wbRate", 0)
+
+        # Get threshold-based rate if available
+        if "wbRateData" in rate_data:
+            threshold_rate = self._pick_threshold_rate(rate_data, send_amount)
+            if threshold_rate:
+                wb_rate = threshold_rate
+
+        # Calculate fee
+        fee = self._calculate_fee(rate_data, send_amount)
+
+        # Calculate destination amount
+        destination_amount = send_amount * Decimal(str(wb_rate))
+
+        self.logger.info(f"Rate found for {send_currency} to {receive_currency}: {wb_rate}")
+
+        # Format the response in the expected aggregator format
+        raw_response = {
+            "success": True,
+            "source_amount": float(send_amount),
+            "source_currency": send_currency,
+            "destination_amount": float(destination_amount),
+            "destination_currency": receive_currency,
+            "exchange_rate": float(wb_rate),
+            "fee": float(fee) if fee is not None else 0.0,
+            "payment_method": "BANK",
+            "delivery_method": "BANK",
+            "delivery_time_minutes": 1440,  # 24 hours in minutes
+            "timestamp": str(datetime.now(timezone.utc).isoformat()),
+            "raw_data": {
+                "provider": "wirebarley",
+                "rate_data": rate_data,
+            },
+        }
+
+        # Return standardized response
+        return self.standardize_response(raw_response)
+
     def _try_authenticated_api(self, send_amount, send_currency, receive_currency, country_code):
         """Fallback to the authenticated API if the public API fails."""
         try:
@@ -696,91 +754,17 @@ class WireBarleyProvider(RemittanceProvider):
             source_currency = send_currency
             destination_currency = receive_currency
 
-            # First handle common unsupported corridors explicitly
-            if destination_currency == "MXN":
-                self.logger.info(
-                    f"WireBarley does not support {source_currency} to {destination_currency} corridor"
-                )
-                return self.standardize_response(
-                    {
-                        "success": False,
-                        "error_message": f"Unsupported corridor: WireBarley does not support {source_currency} to {destination_currency}",
-                    }
-                )
-
-            # Validate the corridor using shared utils
-            source_country = self.CURRENCY_TO_COUNTRY.get(source_currency, "US")
-            dest_country = self.CURRENCY_TO_COUNTRY.get(destination_currency, "")
-
-            if not dest_country:
-                self.logger.info(
-                    f"Unable to determine country code for currency {destination_currency}"
-                )
-                return self.standardize_response(
-                    {
-                        "success": False,
-                        "error_message": f"Unsupported destination currency: {destination_currency}",
-                    }
-                )
-
-            is_valid, validation_msg = validate_corridor(
-                source_country=source_country,
-                source_currency=source_currency,
-                dest_country=dest_country,
-                dest_currency=destination_currency,
-            )
-
-            if not is_valid:
-                return self.standardize_response(
-                    {
-                        "success": False,
-                        "error_message": f"Unsupported corridor: {validation_msg}",
-                    }
-                )
+            corridor_error = self._validate_quote_corridor(source_currency, destination_currency)
+            if corridor_error is not None:
+                return corridor_error
 
             # Initialize browser-like session with custom headers
-            self._ensure_valid_session()
-            self.session.headers.update(
-                {
-                    "Origin": self.BASE_URL,
-                    "Referer": f"{self.BASE_URL}/send",
-                    "Sec-Fetch-User": "?1",
-                    "TE": "trailers",
-                }
-            )
-
-            if not amount:
-                return self.standardize_response(
-                    {"success": False, "error_message": "Amount is required"}
-                )
+            self._prepare_quote_session()
 
             try:
-                # Convert to Decimal if needed
-                if not isinstance(amount, Decimal):
-                    amount = Decimal(str(amount))
-
-                # Validate amount
-                if amount < 0:
-                    return self.standardize_response(
-                        {"success": False, "error_message": "Amount must be positive"}
-                    )
-
-                # Check for min/max amount limits
-                if amount < self.MIN_SUPPORTED_AMOUNT:
-                    return self.standardize_response(
-                        {
-                            "success": False,
-                            "error_message": f"Amount {amount} is below minimum supported amount {self.MIN_SUPPORTED_AMOUNT}",
-                        }
-                    )
-
-                if amount > self.MAX_SUPPORTED_AMOUNT:
-                    return self.standardize_response(
-                        {
-                            "success": False,
-                            "error_message": f"Amount {amount} is above maximum supported amount {self.MAX_SUPPORTED_AMOUNT}",
-                        }
-                    )
+                amount, amount_error = self._validate_quote_amount(amount)
+                if amount_error is not None:
+                    return amount_error
 
                 # Call get_exchange_rate for the actual implementation
                 # get_exchange_rate already returns a standardized response
@@ -810,6 +794,159 @@ class WireBarleyProvider(RemittanceProvider):
                 )
             raise
 
+    def get_quotes_for_amounts(
+        self,
+        amounts: List[Decimal],
+        send_currency: str = "USD",
+        receive_currency: str = None,
+        send_country: str = None,
+        receive_country: str = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Quotes for several amounts of one corridor, in the order of amounts.
+
+        The public rate entry of the corridor (threshold rates and fee arrays) is
+        fetched once and every amount is priced from it. Only if that endpoint fails
+        does each amount fall back to the authenticated calculateAmount API.
+        """
+        corridor_error = self._validate_quote_corridor(send_currency, receive_currency)
+        if corridor_error is not None:
+            return [dict(corridor_error) for _ in amounts]
+
+        checked = [self._validate_quote_amount(amount) for amount in amounts]
+        if all(amount_error is not None for _, amount_error in checked):
+            return [amount_error for _, amount_error in checked]
+
+        try:
+            self._prepare_quote_session()
+            self._ensure_valid_session()
+            rate_data, error = self._fetch_exchange_rate_data(send_currency, receive_currency)
+        except Exception as e:
+            self.logger.error(f"Error in get_quotes_for_amounts: {str(e)}")
+            rate_data, error = None, self.standardize_response(
+                {
+                    "success": False,
+                    "error_message": f"Error retrieving exchange rate: {str(e)}",
+                }
+            )
+
+        country_code = self.CURRENCY_TO_COUNTRY[receive_currency]
+        results = []
+        for amount, amount_error in checked:
+            if amount_error is not None:
+                results.append(amount_error)
+            elif rate_data is not None:
+                results.append(
+                    self._quote_from_rate_data(rate_data, amount, send_currency, receive_currency)
+                )
+            elif error is not None:
+                results.append(dict(error))
+            else:
+                results.append(
+                    self._try_authenticated_api(
+                        amount, send_currency, receive_currency, country_code
+                    )
+                )
+        return results
+
+    def _validate_quote_corridor(
+        self, source_currency: str, destination_currency: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return an error response if WireBarley doesn't serve the corridor, else None."""
+        # First handle common unsupported corridors explicitly
+        if destination_currency == "MXN":
+            self.logger.info(
+                f"WireBarley does not support {source_currency} to {destination_currency} corridor"
+            )
+            return self.standardize_response(
+                {
+                    "success": False,
+                    "error_message": f"Unsupported corridor: WireBarley does not support {source_currency} to {destination_currency}",
+                    "error_code": ERROR_CODE_CORRIDOR_UNSUPPORTED,
+                }
+            )
+
+        # Validate the corridor using shared utils
+        source_country = self.CURRENCY_TO_COUNTRY.get(source_currency, "US")
+        dest_country = self.CURRENCY_TO_COUNTRY.get(destination_currency, "")
+
+        if not dest_country:
+            self.logger.info(
+                f"Unable to determine country code for currency {destination_currency}"
+            )
+            return self.standardize_response(
+                {
+                    "success": False,
+                    "error_message": f"Unsupported destination currency: {destination_currency}",
+                    "error_code": ERROR_CODE_CORRIDOR_UNSUPPORTED,
+                }
+            )
+
+        is_valid, validation_msg = validate_corridor(
+            source_country=source_country,
+            source_currency=source_currency,
+            dest_country=dest_country,
+            dest_currency=destination_currency,
+        )
+
+        if not is_valid:
+            return self.standardize_response(
+                {
+                    "success": False,
+                    "error_message": f"Unsupported corridor: {validation_msg}",
+                    "error_code": ERROR_CODE_CORRIDOR_UNSUPPORTED,
+                }
+            )
+        return None
+
+    def _prepare_quote_session(self):
+        """Initialize browser-like session with custom headers."""
+        self._ensure_valid_session()
+        self.session.headers.update(
+            {
+                "Origin": self.BASE_URL,
+                "Referer": f"{self.BASE_URL}/send",
+                "Sec-Fetch-User": "?1",
+                "TE": "trailers",
+            }
+        )
+
+    def _validate_quote_amount(self, amount):
+        """Return (amount as Decimal, None), or (amount, error response) if it can't be quoted."""
+        if not amount:
+            return amount, self.standardize_response(
+                {"success": False, "error_message": "Amount is required"}
+            )
+
+        # Convert to Decimal if needed
+        if not isinstance(amount, Decimal):
+            amount = Decimal(str(amount))
+
+        # Validate amount
+        if amount < 0:
+            return amount, self.standardize_response(
+                {"success": False, "error_message": "Amount must be positive"}
+            )
+
+        # Check for min/max amount limits
+        if amount < self.MIN_SUPPORTED_AMOUNT:
+            return amount, self.standardize_response(
+                {
+                    "success": False,
+                    "error_message": f"Amount {amount} is below minimum supported amount {self.MIN_SUPPORTED_AMOUNT}",
+                }
+            )
+
+        if amount > self.MAX_SUPPORTED_AMOUNT:
+            return amount, self.standardize_response(
+                {
+                    "success": False,
+                    "error_message": f"Amount {amount} is above maximum supported amount {self.MAX_SUPPORTED_AMOUNT}",
+                }
+            )
+        return amount, None
+
     def get_corridors(self, source_currency: str = "USD") -> Dict[str, Any]:
         """Get available corridors for a source currency."""
         # Initialize failure structure
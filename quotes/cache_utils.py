@@ -2,15 +2,28 @@
 Cache utility functions for the quotes app.
 
 This module provides functions for manual cache operations,
-such as invalidating caches by pattern, preloading caches, etc.
+such as invalidating caches by scope, preloading caches, etc.
 """
 import logging
 import random
+import time
 from decimal import Decimal
 
 from django.conf import settings
 from django.core.cache import cache, caches
 
+from aggregator.volatility import rate_volatility
+from providers.base.fee_schedule import FeeSchedule, add_sample, declared_schedule
+from providers.base.quote import Quote
+
+from .key_generations import (
+    SCOPE_CORRIDORS,
+    SCOPE_PROVIDERS,
+    SCOPE_QUOTES,
+    corridor_destination_scope,
+    corridor_source_scope,
+    key_generations,
+)
 from .key_generators import (
     get_corridor_cache_key,
     get_corridor_rate_cache_key,
@@ -18,6 +31,7 @@ from .key_generators import (
     get_quote_cache_key,
 )
 from .models import FeeQuote, Provider
+from .tiered_cache import quote_cache
 
 logger = logging.getLogger(__name__)
 
@@ -40,32 +54,35 @@ def cache_corridor_rate_data(
         The cache key that was set
     """
     key = get_corridor_rate_cache_key(source_country, dest_country, source_currency, dest_currency)
-
-    # Extract only the invariant data from each provider
-    invariant_data = []
-    for provider in provider_data:
-        if not provider.get("success", False):
-            continue
-
-        # Extract the base data that doesn't change with the amount
-        provider_invariant = {
-            "provider_id": provider.get("provider_id"),
-            "exchange_rate": provider.get("exchange_rate"),
-            "delivery_time_minutes": provider.get("delivery_time_minutes"),
-            "payment_method": provider.get("payment_method", "card"),
-            "delivery_method": provider.get("delivery_method", "bank_deposit"),
-            # Fee structure information
-            "fee_type": provider.get("fee_type", "fixed"),  # 'fixed' or 'percentage'
-            "fee_value": provider.get("fee", 0),  # Either fixed amount or percentage
-            "fee_percentage": provider.get("fee_percentage", 0),
-            "min_fee": provider.get("min_fee", 0),
-            "max_fee": provider.get("max_fee", None),
-        }
-        invariant_data.append(provider_invariant)
+    successful = [provider for provider in provider_data if provider.get("success", False)]
 
     # Add jitter to TTL to prevent thundering herd problem
     jitter = random.randint(-settings.JITTER_MAX_SECONDS, settings.JITTER_MAX_SECONDS)
-    ttl = getattr(settings, "CORRIDOR_RATE_CACHE_TTL", 60 * 30) + jitter  # Default 30 minutes
+    # Volatile rates are re-derived sooner, quiet ones kept longer
+    ttl = rate_volatility.pair_ttl(
+        source_currency,
+        dest_currency,
+        [provider.get("provider_id") for provider in successful],
+        default=getattr(settings, "CORRIDOR_RATE_CACHE_TTL", 60 * 30),  # Default 30 minutes
+    )
+
+    # Fee schedules sampled at other amounts are extended rather than replaced
+    previous = cache.get(key) or {}
+    schedules = {
+        quote.get("provider_id"): quote.get("fee_schedule")
+        for quote in previous.get("providers", [])
+    }
+    now = time.time()
+
+    # Keep only the data that doesn't change with the amount, as compact Quote records
+    invariant_data = [
+        _invariant_quote(
+            provider,
+            _fee_schedule(provider, schedules.get(provider.get("provider_id")), now, ttl),
+        )
+        for provider in successful
+    ]
+    ttl += jitter
 
     cache.set(
         key,
@@ -84,13 +101,68 @@ def cache_corridor_rate_data(
     return key
 
 
+def _fee_schedule(provider, previous, observed_at, max_age):
+    """
+    The fee schedule of a fixed-fee provider quote: the one the provider declared, or
+    the earlier samples of the corridor (previous) with this quote's amount added.
+    """
+    if provider.get("fee_type") == "percentage":
+        return None
+
+    if provider.get("fee_schedule"):
+        try:
+            return declared_schedule(provider["fee_schedule"], observed_at)
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                f"Ignoring malformed fee schedule of {provider.get('provider_id')}: {str(e)}"
+            )
+
+    amount = provider.get("send_amount")
+    exchange_rate = provider.get("exchange_rate")
+    if amount is None or exchange_rate is None:
+        return None
+    return add_sample(
+        previous if isinstance(previous, FeeSchedule) else None,
+        float(amount),
+        float(provider.get("fee") or 0),
+        float(exchange_rate),
+        observed_at,
+        max_age,
+        rate_volatility.tolerance,
+    )
+
+
+def _invariant_quote(provider, fee_schedule=None):
+    """The amount-independent part of a provider quote: rate, methods and fee structure."""
+    fee_structure = {
+        key: provider[key]
+        for key in ("fee_type", "fee_percentage", "min_fee", "max_fee")
+        if provider.get(key) is not None
+    }
+    return Quote.from_dict(
+        {
+            "provider_id": provider.get("provider_id"),
+            "success": True,
+            "exchange_rate": provider.get("exchange_rate"),
+            "delivery_time_minutes": provider.get("delivery_time_minutes"),
+            "payment_method": provider.get("payment_method") or "card",
+            "delivery_method": provider.get("delivery_method") or "bank_deposit",
+            # Either a fixed amount or a percentage, depending on fee_type
+            "fee": provider.get("fee", 0),
+            **fee_structure,
+            "fee_schedule": fee_schedule,
+        }
+    )
+
+
 # New function to get and use corridor rate information
 def get_quotes_from_corridor_rates(
     source_country, dest_country, source_currency, dest_currency, amount
 ):
     """
     Get quotes for a specific amount using cached corridor rate information.
-    This avoids calling the providers when only the amount changes.
+    This avoids calling the providers when only the amount changes. Fixed fees
+    and rates come from each provider's fee schedule (see providers.base.fee_schedule).
 
     Args:
         source_country: Source country code
@@ -101,7 +173,8 @@ def get_quotes_from_corridor_rates(
 
     Returns:
         A dictionary with quote information and a cache_hit flag,
-        or None if no cached rate information is available
+        or None if no cached rate information is available or a provider's
+        fee schedule can't price the amount
     """
     key = get_corridor_rate_cache_key(source_country, dest_country, source_currency, dest_currency)
     rate_data = cache.get(key)
@@ -110,6 +183,22 @@ def get_quotes_from_corridor_rates(
         logger.info(f"No cached corridor rate data for key: {key}")
         return None
 
+    return quotes_from_corridor_rate_data(
+        rate_data, source_country, dest_country, source_currency, dest_currency, amount
+    )
+
+
+def quotes_from_corridor_rate_data(
+    rate_data, source_country, dest_country, source_currency, dest_currency, amount
+):
+    """
+    Like get_quotes_from_corridor_rates, for corridor rate data already read from the cache.
+
+    Returns None if rate_data is empty or a fee schedule can't price the amount.
+    """
+    if not rate_data:
+        return None
+
     logger.info(
         f"Using cached corridor rate data for {len(rate_data.get('providers', []))} providers"
     )
@@ -134,26 +223,37 @@ def get_quotes_from_corridor_rates(
                     fee = min_fee
                 if max_fee is not None and fee > max_fee:
                     fee = max_fee
+            elif isinstance(provider.get("fee_schedule"), FeeSchedule):
+                price = provider["fee_schedule"].price(float(amount))
+                if price is None:
+                    # The fee or rate may change between the amounts seen: ask the providers
+                    logger.info(f"Cached fee schedule of {provider_id} can't price {amount}")
+                    return None
+                fee, tier_rate = price
+                if tier_rate is not None:
+                    exchange_rate = tier_rate
             else:
-                # Fixed fee
-                fee = provider.get("fee_value", 0)
+                # Fixed fee; entries cached before the Quote records kept it in fee_value
+                fee = provider.get("fee", provider.get("fee_value", 0))
 
             # Calculate destination amount after fee
             send_amount = float(amount)
             destination_amount = (send_amount - fee) * exchange_rate
 
             quotes.append(
-                {
-                    "provider_id": provider_id,
-                    "success": True,
-                    "exchange_rate": exchange_rate,
-                    "fee": fee,
-                    "source_amount": send_amount,
-                    "destination_amount": destination_amount,
-                    "delivery_time_minutes": provider.get("delivery_time_minutes"),
-                    "payment_method": provider.get("payment_method"),
-                    "delivery_method": provider.get("delivery_method"),
-                }
+                Quote.from_dict(
+                    {
+                        "provider_id": provider_id,
+                        "success": True,
+                        "exchange_rate": exchange_rate,
+                        "fee": fee,
+                        "source_amount": send_amount,
+                        "destination_amount": destination_amount,
+                        "delivery_time_minutes": provider.get("delivery_time_minutes"),
+                        "payment_method": provider.get("payment_method"),
+                        "delivery_method": provider.get("delivery_method"),
+                    }
+                )
             )
         except Exception as e:
             logger.warning(
@@ -179,8 +279,9 @@ def invalidate_all_quote_caches():
     Invalidate all quote-related caches.
     Use with caution - this will force recalculation of all quotes.
     """
-    cache.delete_pattern("v1:fee:*")
-    cache.delete_pattern("v1:corridor_rates:*")  # Also invalidate corridor rate caches
+    # Quote and corridor rate keys share the generation; old entries age out
+    key_generations.bump(SCOPE_QUOTES)
+    quote_cache.clear_local()  # Other workers' L1 entries expire within QUOTE_L1_CACHE_TTL
     logger.info("Invalidated all quote caches")
 
 
@@ -199,22 +300,15 @@ def invalidate_corridor_caches(source_country=None, dest_country=None):
         logger.info(f"Invalidated corridor cache for {source_country}->{dest_country}")
     elif source_country:
         # Invalidate all corridors from a specific source
-        cache.delete_pattern(f"corridor:{source_country}:*")
+        key_generations.bump(corridor_source_scope(source_country))
         logger.info(f"Invalidated all corridor caches from {source_country}")
     elif dest_country:
-        # This is less efficient but we don't have a better pattern matching option
-        corridors = (
-            FeeQuote.objects.filter(destination_country=dest_country)
-            .values_list("source_country", "destination_country")
-            .distinct()
-        )
-        for src, dst in corridors:
-            key = get_corridor_cache_key(src, dst)
-            cache.delete(key)
+        # Invalidate all corridors to a specific destination
+        key_generations.bump(corridor_destination_scope(dest_country))
         logger.info(f"Invalidated all corridor caches to {dest_country}")
     else:
         # Invalidate all corridors
-        cache.delete_pattern("corridor:*")
+        key_generations.bump(SCOPE_CORRIDORS)
         logger.info("Invalidated all corridor caches")
 
 
@@ -230,7 +324,7 @@ def invalidate_provider_caches(provider_id=None):
         cache.delete(key)
         logger.info(f"Invalidated provider cache for {provider_id}")
     else:
-        cache.delete_pattern("provider:*")
+        key_generations.bump(SCOPE_PROVIDERS)
         logger.info("Invalidated all provider caches")
 
 
@@ -283,16 +377,18 @@ def preload_quote_cache(quote):
         "dest_currency": quote.destination_currency,
         "amount": float(quote.send_amount),
         "quotes": [
-            {
-                "provider_id": quote.provider.id,
-                "success": True,
-                "exchange_rate": float(quote.exchange_rate),
-                "fee": float(quote.fee_amount),
-                "destination_amount": float(quote.destination_amount),
-                "delivery_time_minutes": quote.delivery_time_minutes,
-                "payment_method": quote.payment_method,
-                "delivery_method": quote.delivery_method,
-            }
+            Quote.from_dict(
+                {
+                    "provider_id": quote.provider.id,
+                    "success": True,
+                    "exchange_rate": float(quote.exchange_rate),
+                    "fee": float(quote.fee_amount),
+                    "destination_amount": float(quote.destination_amount),
+                    "delivery_time_minutes": quote.delivery_time_minutes,
+                    "payment_method": quote.payment_method,
+                    "delivery_method": quote.delivery_method,
+                }
+            )
         ],
         "timestamp": quote.last_updated.isoformat(),
         "cache_hit": False,
@@ -302,7 +398,7 @@ def preload_quote_cache(quote):
     jitter = random.randint(-settings.JITTER_MAX_SECONDS, settings.JITTER_MAX_SECONDS)
     ttl = settings.QUOTE_CACHE_TTL + jitter
 
-    cache.set(key, response, timeout=ttl)
+    quote_cache.set(key, response, timeout=ttl)
     logger.info(f"Preloaded quote cache for key: {key}")
 
     return key
@@ -0,0 +1,133 @@
+"""
+Single-flight coalescing of identical in-flight quote requests.
+
+When a popular corridor's cache entry expires, every concurrent request for the
+same quote cache key would otherwise start its own provider fan-out. This module
+makes sure only one fan-out runs per key:
+
+- Within a worker process, callers for the same key share one Future.
+- Across worker processes, the caller that runs the fan-out holds a short lease
+  in the shared cache (Redis). Other processes wait for the leader's result to
+  appear under the quote cache key instead of calling the providers themselves.
+
+Version: 1.0
+"""
+import copy
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def get_lease_cache_key(key: str) -> str:
+    """Generate the cache key of the cross-process lease for a coalescing key."""
+    return f"singleflight:{key}"
+
+
+class SingleFlight:
+    """
+    Run at most one computation per key at a time and share its result.
+
+    Args:
+        lease_seconds: How long a process may hold the cross-process lease.
+            Should comfortably exceed one provider fan-out.
+        wait_seconds: Maximum time a follower waits for the leader's result
+            before computing the result itself.
+        poll_interval: Interval between cache checks while waiting on a leader
+            in another process.
+    """
+
+    def __init__(self, lease_seconds: int = 30, wait_seconds: float = 30, poll_interval=0.1):
+        self.lease_seconds = lease_seconds
+        self.wait_seconds = wait_seconds
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def do(
+        self,
+        key: str,
+        compute: Callable[[], Dict[str, Any]],
+        lookup: Callable[[], Optional[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return the result for key, computing it at most once across all waiters.
+
+        Args:
+            key: The coalescing key (the quote cache key).
+            compute: Runs the fan-out and stores its result where lookup finds it.
+            lookup: Returns the stored result for key, or None if not there yet.
+
+        Returns:
+            The result dictionary. Followers receive their own copy.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            logger.info(f"Coalescing request onto in-flight fan-out for key: {key}")
+            try:
+                return copy.deepcopy(future.result(timeout=self.wait_seconds))
+            except FutureTimeoutError:
+                logger.warning(f"Timed out waiting for in-flight fan-out for key: {key}")
+                return compute()
+
+        try:
+            result = self._do_across_processes(key, compute, lookup)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _do_across_processes(self, key, compute, lookup):
+        """Hold the shared lease while computing, or wait for whoever holds it."""
+        lease_key = get_lease_cache_key(key)
+        token = uuid.uuid4().hex
+
+        if cache.add(lease_key, token, timeout=self.lease_seconds):
+            try:
+                return compute()
+            finally:
+                # Only release our own lease; it may have expired and been re-acquired
+                if cache.get(lease_key) == token:
+                    cache.delete(lease_key)
+
+        logger.info(f"Another worker holds the fan-out lease for key: {key}, waiting")
+        deadline = time.monotonic() + self.wait_seconds
+        while time.monotonic() < deadline:
+            result = lookup()
+            if result is not None:
+                return result
+            if cache.get(lease_key) is None:
+                # The leader finished without storing a result, or died
+                break
+            time.sleep(self.poll_interval)
+
+        result = lookup()
+        if result is not None:
+            return result
+
+        logger.warning(f"No result from the lease holder for key: {key}, fetching directly")
+        return compute()
+
+
+quote_singleflight = SingleFlight(
+    lease_seconds=getattr(settings, "QUOTE_SINGLEFLIGHT_LEASE_SECONDS", 30),
+    wait_seconds=getattr(settings, "QUOTE_SINGLEFLIGHT_WAIT_SECONDS", 30),
+)
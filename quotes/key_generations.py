@@ -0,0 +1,128 @@
+"""
+Generation counters for namespaces of quote cache keys.
+
+Every cache key of the quotes app embeds the current generation of the scopes it
+belongs to (all quotes, all corridors, the corridors from one source country or to
+one destination country, all providers). Invalidating a scope increments its
+counter in Redis, a single INCR: keys built afterwards name new entries, and the
+old ones are never read again and expire with their TTLs. Nothing scans the
+keyspace, and nothing queries the database to find the keys of a scope.
+
+Each process keeps the generations it read for CACHE_GENERATION_LOCAL_TTL seconds,
+so building a key doesn't cost a round trip. A process that invalidates a scope
+switches right away; the others follow within that time, like the L1 entries of
+quotes.tiered_cache.
+
+Version: 1.0
+"""
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SCOPE_QUOTES = "quotes"
+SCOPE_CORRIDORS = "corridors"
+SCOPE_PROVIDERS = "providers"
+
+
+def corridor_source_scope(source_country: str) -> str:
+    """Scope of the corridors from one source country."""
+    return f"corridors:from:{source_country}"
+
+
+def corridor_destination_scope(dest_country: str) -> str:
+    """Scope of the corridors to one destination country."""
+    return f"corridors:to:{dest_country}"
+
+
+def get_key_generation_cache_key(scope: str) -> str:
+    """Generate a cache key for the generation counter of a scope."""
+    return f"keygen:{scope}"
+
+
+def _initial_generation() -> int:
+    # A counter that was evicted restarts above every generation issued before it, so
+    # entries written under an old generation can't become visible again
+    return int(time.time())
+
+
+class KeyGenerations:
+    """
+    Current generation of cache key scopes, read from the shared cache.
+
+    Args:
+        local_ttl: Longest time, in seconds, a process uses a generation it read.
+    """
+
+    def __init__(self, local_ttl: float = 5):
+        self.local_ttl = local_ttl
+        self._lock = threading.Lock()
+        # scope -> (expires_at (monotonic), generation)
+        self._local: Dict[str, Tuple[float, int]] = {}
+
+    def _remember(self, generations: Dict[str, int]):
+        expires_at = time.monotonic() + self.local_ttl
+        with self._lock:
+            for scope, generation in generations.items():
+                self._local[scope] = (expires_at, generation)
+
+    def get(self, *scopes: str) -> Tuple[int, ...]:
+        """The current generation of each scope, in order."""
+        now = time.monotonic()
+        generations = {}
+        with self._lock:
+            for scope in scopes:
+                entry = self._local.get(scope)
+                if entry is not None and entry[0] > now:
+                    generations[scope] = entry[1]
+
+        missing = [scope for scope in scopes if scope not in generations]
+        if missing:
+            generations.update(self._fetch(missing))
+        return tuple(generations[scope] for scope in scopes)
+
+    def _fetch(self, scopes: Iterable[str]) -> Dict[str, int]:
+        keys = {get_key_generation_cache_key(scope): scope for scope in scopes}
+        found = cache.get_many(list(keys))
+        generations = {}
+        for key, scope in keys.items():
+            generation = found.get(key)
+            if generation is None:
+                # First use of the scope: whoever adds the counter first sets its value
+                cache.add(key, _initial_generation(), timeout=None)
+                generation = cache.get(key)
+            # Without a cache there is nothing to invalidate; any generation will do
+            generations[scope] = int(generation or 0)
+        self._remember(generations)
+        return generations
+
+    def bump(self, scope: str) -> Optional[int]:
+        """Start a new generation of a scope, orphaning every key of the current one."""
+        key = get_key_generation_cache_key(scope)
+        cache.add(key, _initial_generation(), timeout=None)
+        try:
+            generation = cache.incr(key)
+        except ValueError:
+            # Evicted between the add and the incr
+            cache.add(key, _initial_generation() + 1, timeout=None)
+            generation = cache.get(key)
+        if generation is None:
+            logger.warning(f"Could not bump the cache key generation of {scope}")
+            return None
+        self._remember({scope: int(generation)})
+        return int(generation)
+
+    def clear_local(self):
+        """Forget the generations this process read."""
+        with self._lock:
+            self._local.clear()
+
+
+key_generations = KeyGenerations(
+    local_ttl=getattr(settings, "CACHE_GENERATION_LOCAL_TTL", 5),
+)
@@ -1,33 +1,55 @@
 """
 Cache key generator functions for the quotes app.
 
-This module provides standardized functions for generating deterministic cache keys
-used throughout the RemitScout caching system.
+This module provides standardized functions for generating the cache keys used
+throughout the RemitScout caching system. Each key embeds the generations of the
+scopes it belongs to (see key_generations), which is how scopes are invalidated.
 
 Version: 1.0
 """
 import logging
 
+from .key_generations import (
+    SCOPE_CORRIDORS,
+    SCOPE_PROVIDERS,
+    SCOPE_QUOTES,
+    corridor_destination_scope,
+    corridor_source_scope,
+    key_generations,
+)
+
 logger = logging.getLogger(__name__)
 
 
 def get_quote_cache_key(source_country, dest_country, source_currency, dest_currency, amount):
     """Generate a deterministic cache key for quote queries."""
+    (generation,) = key_generations.get(SCOPE_QUOTES)
     return (
-        f"v1:fee:{source_country}:{dest_country}:{source_currency}:{dest_currency}:{float(amount)}"
+        f"v1:fee:g{generation}:"
+        f"{source_country}:{dest_country}:{source_currency}:{dest_currency}:{float(amount)}"
     )
 
 
 def get_provider_cache_key(provider_id):
     """Generate a cache key for provider data."""
-    return f"provider:{provider_id}"
+    (generation,) = key_generations.get(SCOPE_PROVIDERS)
+    return f"provider:g{generation}:{provider_id}"
 
 
 def get_corridor_cache_key(source_country, dest_country):
     """Generate a cache key for corridor data."""
-    return f"corridor:{source_country}:{dest_country}"
+    generations = key_generations.get(
+        SCOPE_CORRIDORS,
+        corridor_source_scope(source_country),
+        corridor_destination_scope(dest_country),
+    )
+    return f"corridor:g{'.'.join(map(str, generations))}:{source_country}:{dest_country}"
 
 
 def get_corridor_rate_cache_key(source_country, dest_country, source_currency, dest_currency):
     """Generate a cache key for corridor rate data."""
-    return f"corridor_rate:{source_country}:{dest_country}:{source_currency}:{dest_currency}"
+    (generation,) = key_generations.get(SCOPE_QUOTES)
+    return (
+        f"corridor_rate:g{generation}:"
+        f"{source_country}:{dest_country}:{source_currency}:{dest_currency}"
+    )
@@ -0,0 +1,22 @@
+"""
+Permissions for the quotes API.
+
+Version: 1.0
+"""
+from rest_framework.permissions import BasePermission
+
+from remit_scout.models import APIKey
+
+
+class IsEnterpriseAPIKey(BasePermission):
+    """
+    Allow requests made with an active enterprise-tier API key.
+
+    The key is read from the X-API-Key header and validated by
+    remit_scout.middleware.SessionAuthMiddleware, which sets request.session_tier.
+    """
+
+    message = "This endpoint requires an enterprise API key (X-API-Key header)."
+
+    def has_permission(self, request, view):
+        return getattr(request, "session_tier", None) == APIKey.TIER_ENTERPRISE
@@ -0,0 +1,40 @@
+"""
+Renderers for the quotes app.
+
+Version: 1.0
+"""
+import json
+from collections.abc import Mapping
+
+from rest_framework.renderers import BaseRenderer
+
+
+def _json_default(value):
+    # Quote records are read-only mappings, encoded like the dicts they replace
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def format_sse_event(event, data):
+    """Format a single Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=_json_default)}\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Renderer that lets DRF negotiate ``Accept: text/event-stream``.
+
+    Streaming views return a StreamingHttpResponse directly, so this renderer is
+    only used for regular Responses (e.g. validation errors), which are sent as a
+    single ``error`` event.
+    """
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return format_sse_event("error", data).encode(self.charset)
@@ -21,6 +21,7 @@ from .key_generators import (
     get_quote_cache_key,
 )
 from .models import FeeQuote, Provider
+from .tiered_cache import quote_cache
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ def invalidate_quote_cache(sender, instance, **kwargs):
         )
 
         # Invalidate the specific quote cache
-        cache.delete(cache_key)
+        quote_cache.delete(cache_key)
         logger.info(f"Invalidated quote cache: {cache_key}")
 
         # Also invalidate the corridor rate cache since rates may have changed
@@ -91,7 +92,7 @@ def invalidate_quote_cache_on_delete(sender, instance, **kwargs):
         )
 
         # Invalidate the specific quote cache
-        cache.delete(cache_key)
+        quote_cache.delete(cache_key)
         logger.info(f"Invalidated quote cache on delete: {cache_key}")
 
         # Also check if we need to invalidate the corridor availability cache
@@ -7,13 +7,15 @@ data cleanup, and other maintenance operations for the RemitScout quotes system.
 Version: 1.0
 """
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 from celery import shared_task
 from django.db.models import Count
 from django.utils import timezone
 
+from aggregator.volatility import rate_volatility
+
 from .cache_utils import invalidate_all_quote_caches, preload_corridor_caches, preload_quote_cache
 from .models import FeeQuote, QuoteQueryLog
 
@@ -164,3 +166,62 @@ def refresh_cache_daily():
     logger.info("Completed daily cache refresh")
 
     return True
+
+
+@shared_task
+def seed_rate_volatility():
+    """
+    Seed the rate volatility estimates of popular currency pairs from historic rates.
+
+    Adaptive cache TTLs use a provider's own quotes once there are enough of
+    them; until then they fall back to this pair-wide estimate from OrbitRemit's
+    daily historic rates, so a new deployment doesn't start from static TTLs.
+
+    Schedule: Runs daily
+    """
+    # Imported here so loading the task module doesn't import a provider
+    from providers.orbitremit import OrbitRemitProvider
+
+    since = timezone.now() - timedelta(days=7)
+    popular_pairs = (
+        QuoteQueryLog.objects.filter(timestamp__gte=since)
+        .values("source_currency", "destination_currency")
+        .annotate(count=Count("id"))
+        .order_by("-count")[:20]
+    )  # Top 20 currency pairs
+
+    provider = OrbitRemitProvider()
+    seeded = 0
+    for pair in popular_pairs:
+        source_currency = pair["source_currency"]
+        dest_currency = pair["destination_currency"]
+        try:
+            history = provider.get_historic_rates(source_currency, dest_currency)
+            if not history.get("success"):
+                logger.info(
+                    f"No historic rates for {source_currency} → {dest_currency}: "
+                    f"{history.get('error_message')}"
+                )
+                continue
+            series = [
+                (_parse_rate_date(point.get("date")), point.get("rate"))
+                for point in history["rates"]
+            ]
+            variance = rate_volatility.seed(
+                source_currency, dest_currency, [p for p in series if p[0] is not None]
+            )
+            if variance is not None:
+                seeded += 1
+        except Exception as e:
+            logger.error(f"Error seeding rate volatility for {source_currency}: {str(e)}")
+
+    logger.info(f"Seeded rate volatility for {seeded} of {len(popular_pairs)} currency pairs")
+    return seeded
+
+
+def _parse_rate_date(value):
+    """Timestamp of a historic rate date such as '2024-03-01' or an ISO datetime"""
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,117 @@
+"""
+Offline tests for single-flight coalescing of quote requests.
+"""
+
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+
+from quotes.coalescing import SingleFlight, get_lease_cache_key
+
+KEY = "v1:fee:g1:US:MX:USD:MXN:100.0"
+
+
+class FanOut:
+    """Stores its result under KEY like the quote view, once released."""
+
+    def __init__(self, result=None):
+        self.result = result or {"quotes": [{"provider_id": "flat"}]}
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def compute(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        cache.set(KEY, self.result)
+        return self.result
+
+    def lookup(self):
+        return cache.get(KEY)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+
+
+def test_followers_reuse_the_leaders_result():
+    flight, fan_out = SingleFlight(wait_seconds=5), FanOut()
+    fan_out.release.clear()
+    results = []
+
+    def request():
+        results.append(flight.do(KEY, fan_out.compute, fan_out.lookup))
+
+    leader = threading.Thread(target=request)
+    leader.start()
+    fan_out.started.wait(timeout=5)
+    followers = [threading.Thread(target=request) for _ in range(4)]
+    for follower in followers:
+        follower.start()
+    time.sleep(0.1)  # Let the followers queue on the in-flight fan-out
+    fan_out.release.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert fan_out.calls == 1
+    assert results == [fan_out.result] * 5
+    # Followers get copies they can mutate without touching the leader's result
+    assert len({id(result) for result in results}) == 5
+
+
+def test_leader_publishes_its_result_and_releases_the_lease():
+    flight, fan_out = SingleFlight(), FanOut()
+
+    assert flight.do(KEY, fan_out.compute, fan_out.lookup) == fan_out.result
+
+    assert cache.get(KEY) == fan_out.result
+    assert cache.get(get_lease_cache_key(KEY)) is None
+    assert flight._in_flight == {}
+
+
+def test_result_published_by_another_process_is_used():
+    flight, fan_out = SingleFlight(wait_seconds=5, poll_interval=0.01), FanOut()
+    cache.add(get_lease_cache_key(KEY), "other-process", timeout=30)
+    threading.Timer(0.05, cache.set, (KEY, {"quotes": []})).start()
+
+    assert flight.do(KEY, fan_out.compute, fan_out.lookup) == {"quotes": []}
+    assert fan_out.calls == 0
+
+
+def test_leader_in_another_process_failing_falls_back_to_a_direct_call():
+    flight, fan_out = SingleFlight(wait_seconds=5, poll_interval=0.01), FanOut()
+    lease_key = get_lease_cache_key(KEY)
+    cache.add(lease_key, "other-process", timeout=30)
+    # The other process gives up its lease without storing a result
+    threading.Timer(0.05, cache.delete, (lease_key,)).start()
+
+    assert flight.do(KEY, fan_out.compute, fan_out.lookup) == fan_out.result
+    assert fan_out.calls == 1
+
+
+def test_lease_held_past_the_wait_falls_back_to_a_direct_call():
+    flight, fan_out = SingleFlight(wait_seconds=0.1, poll_interval=0.01), FanOut()
+    cache.add(get_lease_cache_key(KEY), "stuck-process", timeout=30)
+
+    assert flight.do(KEY, fan_out.compute, fan_out.lookup) == fan_out.result
+    assert fan_out.calls == 1
+
+
+def test_follower_waiting_past_the_wait_computes_itself():
+    flight, fan_out = SingleFlight(wait_seconds=0.1), FanOut()
+    fan_out.release.clear()
+    leader = threading.Thread(target=flight.do, args=(KEY, fan_out.compute, fan_out.lookup))
+    leader.start()
+    fan_out.started.wait(timeout=5)
+
+    follower_result = flight.do(KEY, lambda: {"quotes": ["direct"]}, fan_out.lookup)
+
+    fan_out.release.set()
+    leader.join(timeout=5)
+    assert follower_result == {"quotes": ["direct"]}
+    assert fan_out.calls == 1
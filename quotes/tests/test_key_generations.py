@@ -0,0 +1,111 @@
+"""
+Offline tests for the generation counters of quote cache key scopes.
+"""
+
+import itertools
+
+import pytest
+from django.core.cache import cache
+
+from quotes import key_generations as key_generations_module
+from quotes.cache_utils import invalidate_all_quote_caches, invalidate_corridor_caches
+from quotes.key_generations import KeyGenerations, get_key_generation_cache_key, key_generations
+from quotes.key_generators import (
+    get_corridor_cache_key,
+    get_corridor_rate_cache_key,
+    get_quote_cache_key,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    key_generations.clear_local()
+    yield
+    key_generations.clear_local()
+
+
+def test_processes_racing_to_start_a_scope_agree_on_its_generation(monkeypatch):
+    initial = itertools.count(100, 100)
+    monkeypatch.setattr(key_generations_module, "_initial_generation", lambda: next(initial))
+    first, second = KeyGenerations(), KeyGenerations()
+    # Both read the counter before either added it
+    monkeypatch.setattr(cache, "get_many", lambda keys: {})
+
+    assert first.get("scope") == (100,)
+    assert second.get("scope") == (100,)
+    assert cache.get(get_key_generation_cache_key("scope")) == 100
+
+
+def test_concurrent_bumps_of_a_new_scope_each_get_a_new_generation():
+    first, second = KeyGenerations(), KeyGenerations()
+
+    bumped = {first.bump("scope"), second.bump("scope")}
+
+    assert len(bumped) == 2
+    assert cache.get(get_key_generation_cache_key("scope")) == max(bumped)
+
+
+def test_counter_evicted_between_add_and_incr_restarts_above_the_old_one(monkeypatch):
+    generations = KeyGenerations()
+    (before,) = generations.get("scope")
+    incr = cache.incr
+
+    def evicting_incr(key, *args, **kwargs):
+        cache.delete(key)
+        monkeypatch.setattr(cache, "incr", incr)
+        return incr(key, *args, **kwargs)
+
+    monkeypatch.setattr(cache, "incr", evicting_incr)
+
+    assert generations.bump("scope") > before
+
+
+def test_other_processes_see_a_bump_once_their_local_copy_expires(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(key_generations_module.time, "monotonic", clock)
+    reader, writer = KeyGenerations(local_ttl=5), KeyGenerations(local_ttl=5)
+    (before,) = reader.get("scope")
+
+    after = writer.bump("scope")
+
+    assert writer.get("scope") == (after,)
+    clock.now += 4
+    assert reader.get("scope") == (before,)
+    clock.now += 2
+    assert reader.get("scope") == (after,)
+
+
+def test_keys_of_the_old_generation_are_unreachable_after_a_bump():
+    quote_key = get_quote_cache_key("US", "MX", "USD", "MXN", 100)
+    rate_key = get_corridor_rate_cache_key("US", "MX", "USD", "MXN")
+    cache.set(quote_key, {"quotes": []})
+
+    invalidate_all_quote_caches()
+
+    assert get_quote_cache_key("US", "MX", "USD", "MXN", 100) != quote_key
+    assert get_corridor_rate_cache_key("US", "MX", "USD", "MXN") != rate_key
+    assert cache.get(get_quote_cache_key("US", "MX", "USD", "MXN", 100)) is None
+
+
+def test_invalidating_a_destination_reaches_every_corridor_into_it():
+    into_mexico = {source: get_corridor_cache_key(source, "MX") for source in ("US", "CA", "GB")}
+    elsewhere = [get_corridor_cache_key("US", "IN"), get_corridor_cache_key("MX", "US")]
+    for key in [*into_mexico.values(), *elsewhere]:
+        cache.set(key, True)
+
+    invalidate_corridor_caches(dest_country="MX")
+
+    for source, key in into_mexico.items():
+        assert get_corridor_cache_key(source, "MX") != key
+        assert cache.get(get_corridor_cache_key(source, "MX")) is None
+    assert [get_corridor_cache_key("US", "IN"), get_corridor_cache_key("MX", "US")] == elsewhere
+    assert all(cache.get(key) is True for key in elsewhere)
@@ -0,0 +1,140 @@
+"""
+Offline tests for the Server-Sent Events quote stream.
+"""
+
+import json
+import time
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from aggregator.aggregator import Aggregator
+from providers.base.quote import Quote
+from quotes.renderers import format_sse_event
+from quotes.tiered_cache import quote_cache
+from quotes.views import QuoteStreamAPIView
+
+CORRIDOR = {
+    "source_country": "US",
+    "dest_country": "MX",
+    "source_currency": "USD",
+    "dest_currency": "MXN",
+    "amount": "100",
+}
+
+
+class DelayedProvider:
+    def __init__(self, provider_id, delay, success=True):
+        self.provider_id = provider_id
+        self.delay = delay
+        self.success = success
+
+    def get_quote(self, amount, **kwargs):
+        time.sleep(self.delay)
+        if not self.success:
+            return {"success": False, "error_message": "Upstream error"}
+        return {
+            "success": True,
+            "provider_id": self.provider_id,
+            "send_amount": float(amount),
+            "source_currency": "USD",
+            "destination_currency": "MXN",
+            "exchange_rate": 17.0,
+            "fee": 3.0,
+            "destination_amount": (float(amount) - 3.0) * 17.0,
+        }
+
+
+def parse_events(body):
+    """(event, data) pairs of an event stream."""
+    events = []
+    for message in body.split("\n\n"):
+        if not message:
+            continue
+        event_line, data_line = message.split("\n")
+        events.append((event_line[len("event: ") :], json.loads(data_line[len("data: ") :])))
+    return events
+
+
+def stream(**params):
+    request = APIRequestFactory().get("/api/quotes/stream/", {**CORRIDOR, **params})
+    response = QuoteStreamAPIView.as_view()(request)
+    assert response["Content-Type"] == "text/event-stream"
+    return parse_events(b"".join(response.streaming_content).decode())
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    quote_cache.clear_local()
+
+
+def test_sse_event_is_one_event_line_one_data_line_and_a_blank_line():
+    quote = Quote.from_dict({"success": True, "fee": 3.0}, provider_id="flat")
+
+    message = format_sse_event("quote", {"quote": quote, "amount": 1})
+
+    assert message.endswith("\n\n")
+    event_line, data_line = message[:-2].split("\n")
+    assert event_line == "event: quote"
+    assert json.loads(data_line[len("data: ") :])["quote"]["provider_id"] == "flat"
+
+
+@pytest.mark.django_db
+def test_quotes_stream_in_completion_order_and_end_with_complete(monkeypatch):
+    monkeypatch.setattr(
+        Aggregator,
+        "PROVIDERS",
+        [
+            DelayedProvider("slow", 0.3),
+            DelayedProvider("failing", 0.15, success=False),
+            DelayedProvider("fast", 0.0),
+        ],
+    )
+
+    events = stream()
+
+    assert [event for event, _ in events] == ["quote", "provider_error", "quote", "complete"]
+    assert [data.get("provider_id") for _, data in events[:3]] == ["FAST", "failing", "SLOW"]
+    assert events[-1][1]["count"] == 2
+    assert events[-1][1]["cache_hit"] is False
+
+
+@pytest.mark.django_db
+def test_stream_cut_by_the_deadline_is_cached_for_the_partial_ttl(monkeypatch, settings):
+    settings.JITTER_MAX_SECONDS = 0
+    settings.PARTIAL_QUOTE_CACHE_TTL = 60
+
+    def partial_stream(cls, amount, **kwargs):
+        # One provider answers, the other misses the deadline
+        yield Quote.from_dict(DelayedProvider("fast", 0).get_quote(amount), provider_id="fast")
+        yield cls._timed_out_result(
+            DelayedProvider("stuck", 0), 0.2, "US", "MX", "USD", "MXN", amount
+        )
+
+    monkeypatch.setattr(Aggregator, "iter_quotes", classmethod(partial_stream))
+    timeouts = []
+    store = quote_cache.set
+    monkeypatch.setattr(
+        quote_cache,
+        "set",
+        lambda key, value, timeout: timeouts.append(timeout) or store(key, value, timeout),
+    )
+
+    events = stream()
+
+    assert [event for event, _ in events] == ["quote", "provider_error", "complete"]
+    assert events[1][1]["timed_out"] is True
+    assert timeouts == [60]
+
+
+@pytest.mark.django_db
+def test_cached_stream_replays_the_quotes_and_ends_with_complete(monkeypatch):
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [DelayedProvider("fast", 0.0)])
+    stream()
+
+    events = stream()
+
+    assert [event for event, _ in events] == ["quote", "complete"]
+    assert events[-1][1]["cache_hit"] is True
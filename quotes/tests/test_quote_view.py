@@ -0,0 +1,95 @@
+"""
+Offline tests for the caching of QuoteAPIView responses.
+"""
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from aggregator.aggregator import Aggregator
+from providers.base.fee_schedule import FeeSchedule
+from quotes.key_generators import get_corridor_cache_key, get_corridor_rate_cache_key
+from quotes.tiered_cache import quote_cache
+from quotes.views import QuoteAPIView
+
+CORRIDOR = {
+    "source_country": "US",
+    "dest_country": "MX",
+    "source_currency": "USD",
+    "dest_currency": "MXN",
+}
+
+
+class FlatFeeProvider:
+    provider_id = "flat"
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_quote(self, amount, **kwargs):
+        self.calls += 1
+        return {
+            "success": True,
+            "provider_id": self.provider_id,
+            "send_amount": float(amount),
+            "source_currency": "USD",
+            "destination_currency": "MXN",
+            "exchange_rate": 17.0,
+            "fee": 3.0,
+            "destination_amount": (float(amount) - 3.0) * 17.0,
+            "delivery_time_minutes": 60,
+            "payment_method": "bank_transfer",
+            "delivery_method": "bank_deposit",
+        }
+
+
+def get_quotes(amount):
+    request = APIRequestFactory().get("/api/quotes/", {**CORRIDOR, "amount": amount})
+    return QuoteAPIView.as_view()(request).data
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    cache.clear()
+    quote_cache.clear_local()
+    provider = FlatFeeProvider()
+    monkeypatch.setattr(Aggregator, "PROVIDERS", [provider])
+    return provider
+
+
+@pytest.mark.django_db
+def test_fresh_quotes_feed_the_corridor_rate_cache_and_reprice_other_amounts(provider):
+    fresh = get_quotes("100")
+
+    assert fresh["cache_hit"] is False
+    assert [q["provider_id"] for q in fresh["quotes"]] == ["FLAT"]
+    assert cache.get(get_corridor_cache_key("US", "MX")) is True
+    rate_data = cache.get(get_corridor_rate_cache_key("US", "MX", "USD", "MXN"))
+    assert isinstance(rate_data["providers"][0]["fee_schedule"], FeeSchedule)
+
+    repriced = get_quotes("250")
+
+    assert provider.calls == 1
+    assert repriced["cache_hit"] is True
+    assert repriced["rate_calculation"] is True
+    (quote,) = repriced["quotes"]
+    assert quote["fee"] == 3.0
+    assert quote["destination_amount"] == (250 - 3.0) * 17.0
+
+
+@pytest.mark.django_db
+def test_fresh_responses_are_cached_for_the_volatility_ttl(provider, monkeypatch, settings):
+    settings.JITTER_MAX_SECONDS = 0
+    monkeypatch.setattr("quotes.views.rate_volatility.pair_ttl", lambda *args, **kwargs: 120)
+    timeouts = []
+    store = quote_cache.set
+    monkeypatch.setattr(
+        quote_cache,
+        "set",
+        lambda key, value, timeout: timeouts.append(timeout) or store(key, value, timeout),
+    )
+
+    get_quotes("100")  # Fresh from the provider
+    get_quotes("250")  # Repriced from the corridor rates
+
+    assert timeouts == [120, 120]
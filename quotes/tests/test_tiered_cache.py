@@ -0,0 +1,124 @@
+"""
+Offline tests for the two-tier quote response cache.
+"""
+
+import pytest
+from django.core.cache import cache
+
+from quotes import tiered_cache
+from quotes.tiered_cache import TieredQuoteCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(tiered_cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def tiers():
+    cache.clear()
+    return TieredQuoteCache(max_entries=2, l1_ttl=30)
+
+
+def test_l2_holds_the_response_itself_and_readers_get_copies(tiers):
+    tiers.set("a", {"quotes": [1, 2]}, timeout=60)
+
+    assert cache.get("a") == {"quotes": [1, 2]}
+    first = tiers.get("a")
+    first["quotes"].append(3)
+    assert tiers.get("a") == {"quotes": [1, 2]}
+
+
+def test_least_recently_used_entry_is_evicted_from_l1(tiers):
+    tiers.set("a", {"n": 1}, timeout=60)
+    tiers.set("b", {"n": 2}, timeout=60)
+    tiers.get("a")  # b is now the least recently used
+    tiers.set("c", {"n": 3}, timeout=60)
+
+    assert tiers.stats()["l1_size"] == 2
+    tiers.get("a")
+    tiers.get("c")
+    assert tiers.stats()["l1_hits"] == 3
+    # The evicted entry is still in L2
+    assert tiers.get("b") == {"n": 2}
+    assert tiers.stats()["l2_hits"] == 1
+
+
+def test_l1_entries_expire_after_the_shorter_of_timeout_and_l1_ttl(tiers, clock):
+    tiers.set("short", {"n": 1}, timeout=10)
+    tiers.set("long", {"n": 2}, timeout=600)
+
+    clock.now += 11
+    assert tiers.get("short") == {"n": 1}  # From L2
+    clock.now += 20
+    assert tiers.get("long") == {"n": 2}  # From L2 after l1_ttl
+
+    stats = tiers.stats()
+    assert (stats["l1_hits"], stats["l1_misses"], stats["l2_hits"]) == (0, 2, 2)
+
+
+def test_l2_hit_backfills_l1_and_misses_fall_through_both_tiers(tiers):
+    cache.set("shared", {"n": 1})  # Written by another worker
+
+    assert tiers.get("shared") == {"n": 1}
+    cache.delete("shared")
+    assert tiers.get("shared") == {"n": 1}  # Now served by L1
+    assert tiers.get("missing") is None
+
+    assert tiers.stats() == {
+        "l1_hits": 1,
+        "l1_misses": 2,
+        "l2_hits": 1,
+        "l2_misses": 1,
+        "l1_size": 1,
+        "l1_max_size": 2,
+    }
+
+
+def test_delete_clears_both_tiers(tiers):
+    tiers.set("a", {"n": 1}, timeout=60)
+    tiers.delete("a")
+
+    assert tiers.get("a") is None
+    assert cache.get("a") is None
+
+
+def test_probe_l1_hit_reads_nothing_from_l2(tiers, monkeypatch):
+    tiers.set("response", {"n": 1}, timeout=60)
+    reads = []
+    monkeypatch.setattr(cache, "get_many", lambda keys: reads.append(keys) or {})
+
+    assert tiers.probe("response", "corridor", "rates") == ({"n": 1}, {})
+    assert reads == []
+
+
+def test_probe_reads_the_fallbacks_in_one_round_trip(tiers, monkeypatch):
+    cache.set("rates", {"rate": 17.0})
+    reads = []
+    get_many = cache.get_many
+    monkeypatch.setattr(cache, "get_many", lambda keys: reads.append(keys) or get_many(keys))
+
+    assert tiers.probe("response", "corridor", "rates") == (None, {"rates": {"rate": 17.0}})
+    # The response key is read first, then the fallbacks in the caller's order
+    assert reads == [["response", "corridor", "rates"]]
+    assert tiers.stats()["l2_misses"] == 1
+
+
+def test_probe_l2_hit_backfills_l1_and_returns_the_fallbacks_found(tiers):
+    cache.set("response", {"n": 1})
+    cache.set("corridor", True)
+
+    assert tiers.probe("response", "corridor", "rates") == ({"n": 1}, {"corridor": True})
+    cache.delete("response")
+    assert tiers.probe("response", "corridor") == ({"n": 1}, {})
+    assert (tiers.stats()["l2_hits"], tiers.stats()["l1_hits"]) == (1, 1)
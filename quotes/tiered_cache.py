@@ -0,0 +1,145 @@
+"""
+Two-tier cache for quote responses.
+
+L1 is a bounded LRU in the worker process; L2 is the shared django-redis cache and
+its connection pool. L2 stores the response object itself, serialized and compressed
+once by django-redis like every other cache entry, so other readers of the shared
+cache see the same format. L1 keeps a pickled copy: a read decodes once whichever
+tier answers, and every caller gets its own copy to mutate (cache_hit flags,
+sorting). There is a single write per store and no read-back.
+
+Deletes through this module clear both tiers of the current process. Other
+processes' L1 entries can't be reached, so L1 keeps an entry at most
+QUOTE_L1_CACHE_TTL seconds: that bounds how long an invalidated response can
+still be served.
+
+Version: 1.0
+"""
+import collections
+import logging
+import pickle
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def encode(value: Any) -> bytes:
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def decode(blob: bytes) -> Any:
+    return pickle.loads(blob)
+
+
+class TieredQuoteCache:
+    """
+    In-process LRU (L1) in front of the shared cache (L2).
+
+    Args:
+        max_entries: Most responses kept in L1.
+        l1_ttl: Longest time, in seconds, a response is served from L1.
+    """
+
+    def __init__(self, max_entries: int = 1024, l1_ttl: float = 30):
+        self.max_entries = max_entries
+        self.l1_ttl = l1_ttl
+        self._lock = threading.Lock()
+        # key -> (expires_at (monotonic), encoded response); least recently used first
+        self._l1: "collections.OrderedDict[str, Tuple[float, bytes]]" = collections.OrderedDict()
+        self._counters = {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0}
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _l1_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._l1.move_to_end(key)
+                self._counters["l1_hits"] += 1
+                return entry[1]
+            if entry is not None:
+                del self._l1[key]
+            self._counters["l1_misses"] += 1
+            return None
+
+    def _l1_set(self, key: str, value: Any, ttl: float):
+        if self.max_entries <= 0:
+            return
+        blob = encode(value)
+        with self._lock:
+            self._l1[key] = (time.monotonic() + min(ttl, self.l1_ttl), blob)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.max_entries:
+                self._l1.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The cached response, or None. Each call returns a fresh copy."""
+        blob = self._l1_get(key)
+        if blob is not None:
+            return decode(blob)
+
+        value = cache.get(key)
+        if value is None:
+            self._count("l2_misses")
+            return None
+        self._count("l2_hits")
+        # L2 doesn't say how long the entry has left; L1 keeps it for l1_ttl at most
+        self._l1_set(key, value, self.l1_ttl)
+        return value
+
+    def probe(
+        self, key: str, *other_keys: str
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Look a response up, reading other keys of the shared cache in the same round trip.
+
+        For lookup chains that fall back to other entries when the response is missing:
+        on an L1 miss the response and the fallbacks come from one MGET. Returns the
+        response (or None) and the values found for other_keys; missing keys are left
+        out, and on an L1 hit nothing else is read.
+        """
+        blob = self._l1_get(key)
+        if blob is not None:
+            return decode(blob), {}
+
+        values = cache.get_many([key, *other_keys])
+        value = values.pop(key, None)
+        if value is None:
+            self._count("l2_misses")
+            return None, values
+        self._count("l2_hits")
+        self._l1_set(key, value, self.l1_ttl)
+        return value, values
+
+    def set(self, key: str, value: Dict[str, Any], timeout: float):
+        """Store a response in both tiers for timeout seconds."""
+        cache.set(key, value, timeout=timeout)
+        self._l1_set(key, value, timeout)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._l1.pop(key, None)
+        cache.delete(key)
+
+    def clear_local(self):
+        """Drop this process's L1 entries."""
+        with self._lock:
+            self._l1.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts per tier in this process, and the L1 size."""
+        with self._lock:
+            return {**self._counters, "l1_size": len(self._l1), "l1_max_size": self.max_entries}
+
+
+quote_cache = TieredQuoteCache(
+    max_entries=getattr(settings, "QUOTE_L1_CACHE_SIZE", 1024),
+    l1_ttl=getattr(settings, "QUOTE_L1_CACHE_TTL", 30),
+)
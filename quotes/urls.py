@@ -7,11 +7,15 @@ Version: 1.0
 """
 from django.urls import path
 
-from .views import QuoteAPIView
+from .views import QuoteAPIView, QuoteBulkAPIView, QuoteStreamAPIView
 
 app_name = "quotes"
 
 urlpatterns = [
     # Main quotes API endpoint that handles quote retrieval requests
     path("", QuoteAPIView.as_view(), name="quotes-api"),
+    # Server-Sent Events variant that streams quotes as providers respond
+    path("stream/", QuoteStreamAPIView.as_view(), name="quotes-stream"),
+    # Many corridors and amounts in one request, for enterprise API keys
+    path("bulk/", QuoteBulkAPIView.as_view(), name="quotes-bulk"),
 ]
@@ -2,7 +2,9 @@
 Utility functions for the quotes app, including data transformation and normalization.
 """
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
+
+from aggregator.quote_table import QuoteTable, is_sort_order
 
 logger = logging.getLogger(__name__)
 
@@ -148,12 +150,13 @@ def get_exchange_rate(quote: Dict[str, Any]) -> Optional[float]:
     except (ValueError, TypeError):
         return None
 
-def normalize_quote(quote: Dict[str, Any]) -> Dict[str, Any]:
+
+def normalize_quote(quote: Mapping[str, Any]) -> Dict[str, Any]:
     """
     Normalize a single quote to a consistent format.
     
     Args:
-        quote: The provider quote to normalize
+        quote: The provider quote to normalize, a Quote record or a dict
         
     Returns:
         A normalized quote with consistent field names and types
@@ -202,6 +205,7 @@ def normalize_quote(quote: Dict[str, Any]) -> Dict[str, Any]:
     normalized = {
         "provider_id": provider_id,
         "provider_name": provider_name,
+        "success": quote.get("success", False) is True,
         "send_amount": send_amount,
         "send_currency": send_currency,
         "receive_amount": receive_amount,
@@ -214,6 +218,11 @@ def normalize_quote(quote: Dict[str, Any]) -> Dict[str, Any]:
         "delivery_methods": standardized_delivery_methods,
         "timestamp": quote.get("timestamp")
     }
+
+    # Fee structure, for pricing other amounts from the corridor rate cache
+    for key in ("fee_type", "fee_percentage", "min_fee", "max_fee", "fee_schedule"):
+        if quote.get(key) is not None:
+            normalized[key] = quote[key]
     
     return normalized
 
@@ -307,25 +316,8 @@ def sort_quotes(quotes: List[Dict[str, Any]], sort_by: str = "best_rate") -> Lis
     Returns:
         Sorted list of quotes
     """
-    if sort_by == "best_rate":
-        return sorted(quotes, key=lambda q: float(q.get("exchange_rate") or 0), reverse=True)
-    elif sort_by == "lowest_fee":
-        return sorted(quotes, key=lambda q: float(q.get("fee") or 0))
-    elif sort_by == "fastest_time":
-        # Sort by delivery time, handling None values
-        return sorted(quotes, 
-                     key=lambda q: float(q.get("delivery_time_minutes") or float('inf')))
-    elif sort_by == "best_value":
-        # Best value considers both exchange rate and fees
-        def value_score(quote):
-            rate = float(quote.get("exchange_rate") or 0)
-            fee = float(quote.get("fee") or 0)
-            send_amount = float(quote.get("send_amount") or 1)
-            # Penalize fee as a percentage of send amount
-            fee_penalty = fee / send_amount if send_amount else 0
-            return rate * (1 - fee_penalty)
-        
-        return sorted(quotes, key=value_score, reverse=True)
-    
     # Default to sorting by best rate
-    return sorted(quotes, key=lambda q: float(q.get("exchange_rate") or 0), reverse=True) 
\ No newline at end of file
+    if not is_sort_order(sort_by):
+        sort_by = "best_rate"
+    table = QuoteTable(quotes)
+    return table.take(table.order(sort_by))
@@ -6,14 +6,14 @@ and response formatting in the RemitScout platform.
 
 Version: 1.0
 """
-import json
 import logging
 import random
+import time
 from decimal import Decimal, InvalidOperation
 
-import redis
 from django.conf import settings
 from django.core.cache import cache, caches
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import (
     OpenApiExample,
@@ -24,19 +24,89 @@ from drf_spectacular.utils import (
 )
 from rest_framework import status
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from aggregator.aggregator import Aggregator
-
-from .cache_utils import cache_corridor_rate_data, get_quotes_from_corridor_rates
-from .key_generators import get_corridor_cache_key, get_quote_cache_key
+from aggregator.quote_table import select_quotes
+from aggregator.volatility import rate_volatility
+
+from .cache_utils import cache_corridor_rate_data, quotes_from_corridor_rate_data
+from .coalescing import quote_singleflight
+from .key_generators import (
+    get_corridor_cache_key,
+    get_corridor_rate_cache_key,
+    get_quote_cache_key,
+)
 from .models import FeeQuote, Provider, QuoteQueryLog
-from .utils import transform_quotes_response
+from .permissions import IsEnterpriseAPIKey
+from .renderers import EventStreamRenderer, format_sse_event
+from .tiered_cache import quote_cache
+from .utils import normalize_quote, transform_quotes_response
 
 logger = logging.getLogger(__name__)
 
 
+# Corridor and amount parameters shared by the quote endpoints
+CORRIDOR_QUERY_PARAMETERS = [
+    OpenApiParameter(
+        name="source_country", 
+        type=str, 
+        location=OpenApiParameter.QUERY,
+        description="Source country code (e.g., US, GB, CA)",
+        required=True,
+        examples=[
+            OpenApiExample("United States", value="US"),
+            OpenApiExample("United Kingdom", value="GB"),
+        ]
+    ),
+    OpenApiParameter(
+        name="dest_country", 
+        type=str, 
+        location=OpenApiParameter.QUERY,
+        description="Destination country code (e.g., MX, IN, PH)",
+        required=True,
+        examples=[
+            OpenApiExample("Mexico", value="MX"),
+            OpenApiExample("India", value="IN"),
+        ]
+    ),
+    OpenApiParameter(
+        name="source_currency", 
+        type=str, 
+        location=OpenApiParameter.QUERY,
+        description="Source currency code (e.g., USD, GBP, CAD)",
+        required=True,
+        examples=[
+            OpenApiExample("US Dollar", value="USD"),
+            OpenApiExample("British Pound", value="GBP"),
+        ]
+    ),
+    OpenApiParameter(
+        name="dest_currency", 
+        type=str, 
+        location=OpenApiParameter.QUERY,
+        description="Destination currency code (e.g., MXN, INR, PHP)",
+        required=True,
+        examples=[
+            OpenApiExample("Mexican Peso", value="MXN"),
+            OpenApiExample("Indian Rupee", value="INR"),
+        ]
+    ),
+    OpenApiParameter(
+        name="amount", 
+        type=float, 
+        location=OpenApiParameter.QUERY,
+        description="Amount to send in source currency",
+        required=True,
+        examples=[
+            OpenApiExample("Standard Amount", value=1000.00),
+        ]
+    ),
+]
+
+
 @extend_schema_view(
     get=extend_schema(
         summary="Get quotes from specific providers",
@@ -46,60 +116,7 @@ logger = logging.getLogger(__name__)
             "Multi-level caching is implemented for performance."
         ),
         parameters=[
-            OpenApiParameter(
-                name="source_country", 
-                type=str, 
-                location=OpenApiParameter.QUERY,
-                description="Source country code (e.g., US, GB, CA)",
-                required=True,
-                examples=[
-                    OpenApiExample("United States", value="US"),
-                    OpenApiExample("United Kingdom", value="GB"),
-                ]
-            ),
-            OpenApiParameter(
-                name="dest_country", 
-                type=str, 
-                location=OpenApiParameter.QUERY,
-                description="Destination country code (e.g., MX, IN, PH)",
-                required=True,
-                examples=[
-                    OpenApiExample("Mexico", value="MX"),
-                    OpenApiExample("India", value="IN"),
-                ]
-            ),
-            OpenApiParameter(
-                name="source_currency", 
-                type=str, 
-                location=OpenApiParameter.QUERY,
-                description="Source currency code (e.g., USD, GBP, CAD)",
-                required=True,
-                examples=[
-                    OpenApiExample("US Dollar", value="USD"),
-                    OpenApiExample("British Pound", value="GBP"),
-                ]
-            ),
-            OpenApiParameter(
-                name="dest_currency", 
-                type=str, 
-                location=OpenApiParameter.QUERY,
-                description="Destination currency code (e.g., MXN, INR, PHP)",
-                required=True,
-                examples=[
-                    OpenApiExample("Mexican Peso", value="MXN"),
-                    OpenApiExample("Indian Rupee", value="INR"),
-                ]
-            ),
-            OpenApiParameter(
-                name="amount", 
-                type=float, 
-                location=OpenApiParameter.QUERY,
-                description="Amount to send in source currency",
-                required=True,
-                examples=[
-                    OpenApiExample("Standard Amount", value=1000.00),
-                ]
-            ),
+            *CORRIDOR_QUERY_PARAMETERS,
             OpenApiParameter(
                 name="sort_by", 
                 type=str, 
@@ -123,6 +140,20 @@ logger = logging.getLogger(__name__)
                 required=False,
                 default=False,
             ),
+            OpenApiParameter(
+                name="amounts",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Comma-separated amounts to quote in one request (e.g. 100,500,1000). "
+                    "Replaces amount and returns one response per amount plus a "
+                    "provider by amount matrix."
+                ),
+                required=False,
+                examples=[
+                    OpenApiExample("Amount Table", value="100,500,1000,5000"),
+                ]
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -244,31 +275,20 @@ class QuoteAPIView(APIView):
                      the quotes and metadata.
         """
         try:
-            source_country = request.query_params.get("source_country")
-            dest_country = request.query_params.get("dest_country")
-            source_currency = request.query_params.get("source_currency")
-            dest_currency = request.query_params.get("dest_currency")
-            amount = request.query_params.get("amount")
-            sort_by = request.query_params.get("sort_by", "best_rate")
-            force_refresh = request.query_params.get("force_refresh", "false").lower() == "true"
-
-            if not all([source_country, dest_country, source_currency, dest_currency, amount]):
-                return Response(
-                    {
-                        "error": "Missing required parameters. Please provide source_country, dest_country, source_currency, dest_currency, and amount."
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+            params, error_response = self._parse_quote_params(request)
+            if error_response is not None:
+                return error_response
 
-            try:
-                amount_decimal = Decimal(amount)
-                if amount_decimal <= 0:
-                    raise ValueError("Amount must be positive")
-            except (InvalidOperation, ValueError):
-                return Response(
-                    {"error": "Invalid amount. Please provide a valid positive number."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+            if params["amounts"]:
+                return Response(self._get_amounts_response_data(params, request))
+
+            source_country = params["source_country"]
+            dest_country = params["dest_country"]
+            source_currency = params["source_currency"]
+            dest_currency = params["dest_currency"]
+            amount_decimal = params["amount"]
+            sort_by = params["sort_by"]
+            force_refresh = params["force_refresh"]
 
             self._log_query(
                 source_country,
@@ -299,37 +319,18 @@ class QuoteAPIView(APIView):
                 amount_decimal,
             )
 
-            print(f"DEBUG: Looking for cache key: {cache_key}")
-
-            exact_match = None
-
-            exact_match = cache.get(cache_key)
-            print(f"DEBUG: Django cache.get result: {exact_match is not None}")
-
-            if not exact_match:
-                try:
-                    r = redis.Redis.from_url(settings.CACHES["default"]["LOCATION"])
-                    redis_key_json = f"{settings.CACHES['default']['KEY_PREFIX']}:json:{cache_key}"
-                    print(f"DEBUG: Direct Redis lookup for JSON key: {redis_key_json}")
-                    redis_match = r.get(redis_key_json)
-                    print(f"DEBUG: Redis JSON lookup result: {redis_match is not None}")
-
-                    if redis_match:
-                        try:
-                            exact_match = json.loads(redis_match)
-                            print(f"DEBUG: Successfully deserialized Redis JSON data")
-                        except json.JSONDecodeError as e:
-                            print(f"DEBUG: Error deserializing Redis JSON data: {str(e)}")
-                except Exception as e:
-                    print(f"DEBUG: Error in direct Redis JSON lookup: {str(e)}")
-
+            corridor_key = get_corridor_cache_key(source_country, dest_country)
+            corridor_rate_key = get_corridor_rate_cache_key(
+                source_country, dest_country, source_currency, dest_currency
+            )
+            # Every key the lookup chain below may need, read in one round trip
+            exact_match, fallbacks = quote_cache.probe(cache_key, corridor_key, corridor_rate_key)
             if exact_match:
                 exact_match["cache_hit"] = True
                 logger.info(f"Exact cache hit for key: {cache_key}")
                 return Response(exact_match)
 
-            corridor_key = get_corridor_cache_key(source_country, dest_country)
-            corridor_available = cache.get(corridor_key)
+            corridor_available = fallbacks.get(corridor_key)
 
             if corridor_available is not None and not corridor_available:
                 logger.info(
@@ -345,7 +346,8 @@ class QuoteAPIView(APIView):
                     }
                 )
 
-            corridor_rate_response = get_quotes_from_corridor_rates(
+            corridor_rate_response = quotes_from_corridor_rate_data(
+                fallbacks.get(corridor_rate_key),
                 source_country,
                 dest_country,
                 source_currency,
@@ -365,8 +367,13 @@ class QuoteAPIView(APIView):
                 corridor_rate_response["filters_applied"]["sort_by"] = sort_by
 
                 jitter = random.randint(-settings.JITTER_MAX_SECONDS, settings.JITTER_MAX_SECONDS)
-                ttl = settings.QUOTE_CACHE_TTL + jitter
-                cache.set(cache_key, corridor_rate_response, timeout=ttl)
+                ttl = (
+                    self._quote_cache_ttl(
+                        corridor_rate_response.get("quotes", []), source_currency, dest_currency
+                    )
+                    + jitter
+                )
+                quote_cache.set(cache_key, corridor_rate_response, timeout=ttl)
 
                 logger.info(
                     f"Cached calculated response for amount {amount_decimal} with key: {cache_key}"
@@ -374,15 +381,21 @@ class QuoteAPIView(APIView):
                 return Response(corridor_rate_response)
 
             logger.info(f"No cache hits, fetching fresh quotes from aggregator")
-            return self._fetch_and_return_fresh_quotes(
-                source_country,
-                dest_country,
-                source_currency,
-                dest_currency,
-                amount_decimal,
-                sort_by,
-                cache_results=True,
+            # Concurrent misses for the same key share a single provider fan-out
+            response_data = quote_singleflight.do(
+                cache_key,
+                lambda: self._fetch_fresh_response_data(
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount_decimal,
+                    sort_by,
+                    cache_results=True,
+                ),
+                lambda: quote_cache.get(cache_key),
             )
+            return Response(response_data)
 
         except Exception as e:
             logger.exception(f"Error in QuoteAPIView: {str(e)}")
@@ -391,6 +404,137 @@ class QuoteAPIView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _parse_quote_params(self, request):
+        """
+        Read and validate the common quote query parameters.
+
+        Returns:
+            Tuple of (params dict, None) on success or (None, 400 Response) on error.
+        """
+        source_country = request.query_params.get("source_country")
+        dest_country = request.query_params.get("dest_country")
+        source_currency = request.query_params.get("source_currency")
+        dest_currency = request.query_params.get("dest_currency")
+        amount = request.query_params.get("amount")
+        amounts = request.query_params.get("amounts")
+
+        amount_given = amount or amounts
+        if not all([source_country, dest_country, source_currency, dest_currency, amount_given]):
+            return None, Response(
+                {
+                    "error": "Missing required parameters. Please provide source_country, dest_country, source_currency, dest_currency, and amount."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            amount_decimals = [Decimal(a.strip()) for a in (amounts or amount).split(",")]
+            if any(amount_decimal <= 0 for amount_decimal in amount_decimals):
+                raise ValueError("Amount must be positive")
+        except (InvalidOperation, ValueError):
+            return None, Response(
+                {"error": "Invalid amount. Please provide a valid positive number."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Duplicates are quoted once
+        amount_decimals = list(dict.fromkeys(amount_decimals))
+        max_amounts = getattr(settings, "QUOTE_MAX_AMOUNTS", 10)
+        if len(amount_decimals) > max_amounts:
+            return None, Response(
+                {"error": f"Too many amounts. Please provide at most {max_amounts}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        amount_decimal = amount_decimals[0]
+
+        params = {
+            "source_country": source_country,
+            "dest_country": dest_country,
+            "source_currency": source_currency,
+            "dest_currency": dest_currency,
+            "amount": amount_decimal,
+            "amounts": amount_decimals if amounts else None,
+            "sort_by": request.query_params.get("sort_by", "best_rate"),
+            "force_refresh": request.query_params.get("force_refresh", "false").lower() == "true",
+        }
+        return params, None
+
+    def _get_amounts_response_data(self, params, request):
+        """
+        Build the response for several amounts of one corridor.
+
+        Amounts with a cached response are served from the cache. The others are
+        quoted together in one aggregator fan-out (see
+        Aggregator.get_quotes_for_amounts), and each amount's response is cached
+        exactly as a single-amount request would cache it.
+        """
+        corridor = (
+            params["source_country"],
+            params["dest_country"],
+            params["source_currency"],
+            params["dest_currency"],
+        )
+        amounts = params["amounts"]
+        sort_by = params["sort_by"]
+
+        for amount_decimal in amounts:
+            self._log_query(*corridor, amount_decimal, request)
+
+        responses = [None] * len(amounts)
+        if not params["force_refresh"]:
+            for i, amount_decimal in enumerate(amounts):
+                cached = quote_cache.get(get_quote_cache_key(*corridor, amount_decimal))
+                if cached:
+                    cached["cache_hit"] = True
+                    responses[i] = cached
+
+        missing = [i for i, response_data in enumerate(responses) if response_data is None]
+        if missing:
+            logger.info(
+                f"Fetching quotes from aggregator for amounts {[amounts[i] for i in missing]}"
+            )
+            raw_response = Aggregator.get_quotes_for_amounts(
+                *corridor,
+                amounts=[amounts[i] for i in missing],
+                sort_by=sort_by,
+            )
+            for position, i in enumerate(missing):
+                amount_results = raw_response["results"][position]
+                response_data = self._transform_response(
+                    {
+                        "success": len(amount_results) > 0,
+                        "results": amount_results,
+                        "all_results": raw_response["all_results"][position],
+                        "execution_time": raw_response.get("execution_time", 0),
+                        "timed_out_providers": raw_response.get("timed_out_providers", []),
+                    },
+                    *corridor,
+                    amounts[i],
+                    sort_by,
+                )
+                self._cache_response_data(response_data, *corridor, amounts[i])
+                responses[i] = response_data
+
+        # provider_id -> quote per amount (None where the provider had no quote)
+        matrix = {}
+        for i, response_data in enumerate(responses):
+            for quote in response_data.get("quotes", []):
+                row = matrix.setdefault(quote.get("provider_id"), [None] * len(amounts))
+                row[i] = quote
+
+        return {
+            "success": any(r.get("success", False) for r in responses),
+            "source_country": params["source_country"],
+            "dest_country": params["dest_country"],
+            "source_currency": params["source_currency"],
+            "dest_currency": params["dest_currency"],
+            "amounts": [float(amount_decimal) for amount_decimal in amounts],
+            "responses": responses,
+            "matrix": matrix,
+            "cache_hits": sum(1 for r in responses if r.get("cache_hit")),
+            "timestamp": timezone.now().isoformat(),
+        }
+
     def _fetch_and_return_fresh_quotes(
         self,
         source_country,
@@ -402,6 +546,28 @@ class QuoteAPIView(APIView):
         cache_results=True,
     ):
         """Fetch fresh quotes from the aggregator and cache appropriately"""
+        response_data = self._fetch_fresh_response_data(
+            source_country,
+            dest_country,
+            source_currency,
+            dest_currency,
+            amount_decimal,
+            sort_by,
+            cache_results=cache_results,
+        )
+        return Response(response_data)
+
+    def _fetch_fresh_response_data(
+        self,
+        source_country,
+        dest_country,
+        source_currency,
+        dest_currency,
+        amount_decimal,
+        sort_by,
+        cache_results=True,
+    ):
+        """Build a fresh response from the aggregator, caching it if requested"""
         logger.info(
             f"Fetching quotes from aggregator for {amount_decimal} {source_currency} -> {dest_currency}"
         )
@@ -424,9 +590,38 @@ class QuoteAPIView(APIView):
             sort_by,
         )
 
-        if not cache_results:
-            return Response(response_data)
+        if cache_results:
+            self._cache_response_data(
+                response_data,
+                source_country,
+                dest_country,
+                source_currency,
+                dest_currency,
+                amount_decimal,
+            )
 
+        return response_data
+
+    @staticmethod
+    def _quote_cache_ttl(quotes, source_currency, dest_currency):
+        """QUOTE_CACHE_TTL, shortened or stretched by the volatility of the quoted rates"""
+        return rate_volatility.pair_ttl(
+            source_currency,
+            dest_currency,
+            [q.get("provider_id") for q in quotes if q.get("success", False)],
+            default=settings.QUOTE_CACHE_TTL,
+        )
+
+    def _cache_response_data(
+        self,
+        response_data,
+        source_country,
+        dest_country,
+        source_currency,
+        dest_currency,
+        amount_decimal,
+    ):
+        """Cache a freshly built response, its corridor availability and corridor rates"""
         all_quotes = response_data.get("quotes", [])
         successful_quotes = [q for q in all_quotes if q.get("success", False)]
         has_quotes = len(successful_quotes) > 0
@@ -444,36 +639,22 @@ class QuoteAPIView(APIView):
                 amount_decimal,
             )
             jitter = random.randint(-settings.JITTER_MAX_SECONDS, settings.JITTER_MAX_SECONDS)
-            ttl = settings.QUOTE_CACHE_TTL + jitter
+            ttl = self._quote_cache_ttl(successful_quotes, source_currency, dest_currency) + jitter
+            if response_data.get("timed_out_providers"):
+                # Partial results shouldn't hide the slow providers for the full TTL
+                ttl = min(ttl, getattr(settings, "PARTIAL_QUOTE_CACHE_TTL", 300))
 
             if "cache_hit" in response_data:
                 response_data["cache_hit"] = False
             else:
                 response_data.update({"cache_hit": False})
 
-            print(f"DEBUG: Setting cache with key: {specific_key}, TTL: {ttl}")
-
             try:
-                cache.set(specific_key, response_data, timeout=ttl)
-                print(f"DEBUG: Django cache.set for key: {specific_key}")
-
-                r = redis.Redis.from_url(settings.CACHES["default"]["LOCATION"])
-
-                redis_key_original = f"{settings.CACHES['default']['KEY_PREFIX']}:1:{specific_key}"
-                redis_key_json = f"{settings.CACHES['default']['KEY_PREFIX']}:json:{specific_key}"
-
-                serialized_data = json.dumps(response_data)
-                r.setex(redis_key_json, ttl, serialized_data)
-                print(f"DEBUG: Stored JSON data in Redis with key: {redis_key_json}")
-
-                redis_result = r.get(redis_key_json)
-                print(f"DEBUG: Redis verification result: {redis_result is not None}")
-
+                quote_cache.set(specific_key, response_data, timeout=ttl)
                 logger.info(
                     f"Cached specific amount response for {ttl} seconds with key: {specific_key}"
                 )
             except Exception as e:
-                print(f"DEBUG: Error setting cache: {str(e)}")
                 logger.exception(f"Error setting cache: {str(e)}")
 
             cache_corridor_rate_data(
@@ -494,33 +675,15 @@ class QuoteAPIView(APIView):
                 amount_decimal,
             )
             short_ttl = min(300, settings.QUOTE_CACHE_TTL)
-            cache.set(specific_key, response_data, timeout=short_ttl)
+            quote_cache.set(specific_key, response_data, timeout=short_ttl)
             logger.info(f"Cached failed response for {short_ttl} seconds: {specific_key}")
 
-        return Response(response_data)
-
     def _sort_quotes(self, quotes, sort_by):
-        """Sort quotes based on the specified criteria"""
+        """Sort quotes in place based on the specified criteria"""
         if not quotes or not sort_by:
             return
 
-        if sort_by == "best_rate":
-            quotes.sort(key=lambda q: (-(q.get("exchange_rate", 0) or 0)))
-        elif sort_by == "lowest_fee":
-            quotes.sort(key=lambda q: (q.get("fee", float("inf")) or float("inf")))
-        elif sort_by == "fastest_time":
-            quotes.sort(
-                key=lambda q: (q.get("delivery_time_minutes", float("inf")) or float("inf"))
-            )
-        elif sort_by == "best_value":
-
-            def value_score(quote):
-                rate_score = quote.get("exchange_rate", 0) or 0
-                fee_score = 100 - (quote.get("fee", 0) or 0) * 10
-                time_score = 100 - min(100, ((quote.get("delivery_time_minutes", 0) or 0) / 30))
-                return rate_score * 0.5 + fee_score * 0.3 + time_score * 0.2
-
-            quotes.sort(key=value_score, reverse=True)
+        quotes[:] = select_quotes(quotes, sort_by=sort_by)
 
     def _log_query(
         self,
@@ -606,7 +769,11 @@ class QuoteAPIView(APIView):
         }
         
         # Now use our transformation pipeline to clean and standardize the response
-        return transform_quotes_response(basic_response)
+        response_data = transform_quotes_response(basic_response)
+
+        # Providers that missed the fan-out deadline, so clients know the list is partial
+        response_data["timed_out_providers"] = raw_response.get("timed_out_providers", [])
+        return response_data
 
     def _store_quotes(self, response_data):
         """Store successful quotes in the database"""
@@ -681,3 +848,390 @@ class QuoteAPIView(APIView):
         except Exception as e:
             logger.warning(f"Failed to store quotes: {str(e)}")
             pass
+
+
+@extend_schema_view(
+    post=extend_schema(
+        summary="Get quotes for many corridors in one request",
+        description=(
+            "Quotes up to QUOTE_BULK_MAX_ITEMS (corridor, amount) items at once. Identical "
+            "provider calls are made once and all calls share one scheduled fan-out, so a "
+            "sweep over many corridors costs far fewer provider calls and much less time than "
+            "one request per corridor. Results are keyed by item id. Requires an enterprise "
+            "API key in the X-API-Key header."
+        ),
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {"type": "string"},
+                                "source_country": {"type": "string"},
+                                "dest_country": {"type": "string"},
+                                "source_currency": {"type": "string"},
+                                "dest_currency": {"type": "string"},
+                                "amount": {"type": "number"},
+                            },
+                            "required": [
+                                "source_country",
+                                "dest_country",
+                                "source_currency",
+                                "dest_currency",
+                                "amount",
+                            ],
+                        },
+                    },
+                    "sort_by": {"type": "string", "default": "best_rate"},
+                    "force_refresh": {"type": "boolean", "default": False},
+                },
+                "required": ["items"],
+            }
+        },
+        examples=[
+            OpenApiExample(
+                "Two Corridors",
+                request_only=True,
+                value={
+                    "items": [
+                        {
+                            "id": "us-mx-1000",
+                            "source_country": "US",
+                            "dest_country": "MX",
+                            "source_currency": "USD",
+                            "dest_currency": "MXN",
+                            "amount": 1000,
+                        },
+                        {
+                            "id": "gb-in-500",
+                            "source_country": "GB",
+                            "dest_country": "IN",
+                            "source_currency": "GBP",
+                            "dest_currency": "INR",
+                            "amount": 500,
+                        },
+                    ]
+                },
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description=(
+                    "items maps each item id to the response the quotes endpoint returns "
+                    "for that corridor and amount"
+                )
+            ),
+            400: OpenApiResponse(description="Invalid items"),
+            403: OpenApiResponse(description="Missing or non-enterprise API key"),
+        },
+        tags=["Quotes"],
+    )
+)
+class QuoteBulkAPIView(QuoteAPIView):
+    """
+    API endpoint to fetch quotes for many corridors and amounts in one request.
+
+    Items already cached are served from the cache exactly as QuoteAPIView would
+    serve them. The rest are quoted together by Aggregator.get_quotes_bulk, and each
+    item's response is cached like a regular quotes request, so later single
+    requests for the same corridor and amount hit the cache.
+
+    Requires an enterprise API key.
+
+    Version: 1.0
+    """
+
+    permission_classes = [IsEnterpriseAPIKey]
+
+    def post(self, request):
+        """Get quotes for every (corridor, amount) item of the request body."""
+        try:
+            items, error_response = self._parse_bulk_items(request)
+            if error_response is not None:
+                return error_response
+            return Response(self._get_bulk_response_data(items, request))
+        except Exception as e:
+            logger.exception(f"Error in QuoteBulkAPIView: {str(e)}")
+            return Response(
+                {"error": f"An error occurred: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def _parse_bulk_items(self, request):
+        """
+        Read and validate the items of a bulk request.
+
+        Returns:
+            Tuple of (list of item dicts, None) on success or (None, 400 Response) on error.
+        """
+        items = request.data.get("items") if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return None, Response(
+                {"error": "Please provide a non-empty list of items."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_items = getattr(settings, "QUOTE_BULK_MAX_ITEMS", 100)
+        if len(items) > max_items:
+            return None, Response(
+                {"error": f"Too many items. Please provide at most {max_items}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fields = ("source_country", "dest_country", "source_currency", "dest_currency")
+        parsed = []
+        for position, item in enumerate(items):
+            item_id = str(item.get("id", position)) if isinstance(item, dict) else str(position)
+            if not isinstance(item, dict) or not all(item.get(f) for f in (*fields, "amount")):
+                return None, Response(
+                    {
+                        "error": f"Item {item_id} is missing required fields. Please provide source_country, dest_country, source_currency, dest_currency, and amount."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            try:
+                amount_decimal = Decimal(str(item["amount"]))
+                if amount_decimal <= 0:
+                    raise ValueError("Amount must be positive")
+            except (InvalidOperation, ValueError):
+                return None, Response(
+                    {
+                        "error": f"Item {item_id} has an invalid amount. Please provide a valid positive number."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            parsed.append(
+                {
+                    "id": item_id,
+                    **{f: str(item[f]).upper() for f in fields},
+                    "amount": amount_decimal,
+                }
+            )
+
+        if len({item["id"] for item in parsed}) != len(parsed):
+            return None, Response(
+                {"error": "Item ids must be unique."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return parsed, None
+
+    def _get_bulk_response_data(self, items, request):
+        """Build the response for a bulk request, serving cached items from the cache."""
+        sort_by = request.data.get("sort_by", "best_rate")
+        force_refresh = str(request.data.get("force_refresh", "false")).lower() == "true"
+        fields = ("source_country", "dest_country", "source_currency", "dest_currency")
+
+        responses = {}
+        missing = []
+        for item in items:
+            corridor = tuple(item[f] for f in fields)
+            self._log_query(*corridor, item["amount"], request)
+            if not force_refresh:
+                cached = quote_cache.get(get_quote_cache_key(*corridor, item["amount"]))
+                if cached:
+                    cached["cache_hit"] = True
+                    responses[item["id"]] = cached
+                    continue
+            missing.append(item)
+
+        raw_response = {}
+        if missing:
+            logger.info(f"Fetching bulk quotes from aggregator for {len(missing)} items")
+            raw_response = Aggregator.get_quotes_bulk(missing, sort_by=sort_by)
+            # Items with the same corridor and amount share one response
+            transformed = {}
+            for item in missing:
+                corridor = tuple(item[f] for f in fields)
+                key = (*corridor, item["amount"])
+                if key not in transformed:
+                    transformed[key] = self._transform_response(
+                        {
+                            **raw_response["items"][item["id"]],
+                            "execution_time": raw_response["execution_time"],
+                        },
+                        *key,
+                        sort_by,
+                    )
+                    self._cache_response_data(transformed[key], *key)
+                responses[item["id"]] = transformed[key]
+
+        return {
+            "success": any(r.get("success", False) for r in responses.values()),
+            "items": {item["id"]: responses[item["id"]] for item in items},
+            "count": len(items),
+            "cache_hits": sum(1 for r in responses.values() if r.get("cache_hit")),
+            "provider_calls": raw_response.get("provider_calls", 0),
+            "requested_provider_calls": raw_response.get("requested_provider_calls", 0),
+            "elapsed_seconds": raw_response.get("execution_time", 0),
+            "timestamp": timezone.now().isoformat(),
+        }
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Stream quotes as providers respond",
+        description=(
+            "Server-Sent Events variant of the quotes endpoint. Each successful quote is sent "
+            "as a `quote` event as soon as its provider responds, failed providers are sent "
+            "as `provider_error` events, and a final `complete` event carries the summary. "
+            "A cached response for the same corridor and amount is replayed immediately."
+        ),
+        parameters=[
+            *CORRIDOR_QUERY_PARAMETERS,
+            OpenApiParameter(
+                name="force_refresh",
+                type=bool,
+                location=OpenApiParameter.QUERY,
+                description="Whether to bypass the cached response",
+                required=False,
+                default=False,
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description="text/event-stream of quote, provider_error and complete events"
+            ),
+            400: OpenApiResponse(description="Invalid parameters"),
+        },
+        tags=["Quotes"],
+    )
+)
+class QuoteStreamAPIView(QuoteAPIView):
+    """
+    API endpoint that streams remittance quotes using Server-Sent Events.
+
+    Shares parameter validation and caching with QuoteAPIView, but writes each
+    quote to the client as soon as its provider answers instead of waiting for
+    the slowest provider. When the stream finishes, the assembled response is
+    cached exactly like a regular quotes request.
+
+    This is a public endpoint - no authentication required.
+
+    Version: 1.0
+    """
+
+    permission_classes = [AllowAny]
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request):
+        """Stream quotes for a specific corridor and amount."""
+        params, error_response = self._parse_quote_params(request)
+        if error_response is not None:
+            return error_response
+
+        self._log_query(
+            params["source_country"],
+            params["dest_country"],
+            params["source_currency"],
+            params["dest_currency"],
+            params["amount"],
+            request,
+        )
+
+        response = StreamingHttpResponse(
+            self._stream_events(params), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # Disable proxy buffering (nginx)
+        return response
+
+    def _stream_events(self, params):
+        """Generate the SSE messages for a quote request"""
+        source_country = params["source_country"]
+        dest_country = params["dest_country"]
+        source_currency = params["source_currency"]
+        dest_currency = params["dest_currency"]
+        amount_decimal = params["amount"]
+
+        try:
+            if not params["force_refresh"]:
+                cache_key = get_quote_cache_key(
+                    source_country,
+                    dest_country,
+                    source_currency,
+                    dest_currency,
+                    amount_decimal,
+                )
+                cached_response = quote_cache.get(cache_key)
+                if cached_response:
+                    logger.info(f"Streaming cached response for key: {cache_key}")
+                    for quote in cached_response.get("quotes", []):
+                        yield format_sse_event("quote", quote)
+                    yield format_sse_event(
+                        "complete",
+                        {
+                            "success": cached_response.get("success", False),
+                            "count": len(cached_response.get("quotes", [])),
+                            "elapsed_seconds": 0,
+                            "cache_hit": True,
+                        },
+                    )
+                    return
+
+            start_time = time.time()
+            successful_results = []
+            all_results = []
+            timed_out_providers = []
+
+            for result in Aggregator.iter_quotes(
+                source_country=source_country,
+                dest_country=dest_country,
+                source_currency=source_currency,
+                dest_currency=dest_currency,
+                amount=amount_decimal,
+            ):
+                all_results.append(result)
+                if result.get("timed_out"):
+                    timed_out_providers.append(result.get("provider_id"))
+                if result.get("success", False):
+                    successful_results.append(result)
+                    yield format_sse_event("quote", normalize_quote(result))
+                else:
+                    yield format_sse_event(
+                        "provider_error",
+                        {
+                            "provider_id": result.get("provider_id"),
+                            "error_message": result.get("error_message"),
+                            "timed_out": result.get("timed_out", False),
+                        },
+                    )
+
+            response_data = self._transform_response(
+                {
+                    "success": len(successful_results) > 0,
+                    "results": successful_results,
+                    "all_results": all_results,
+                    "execution_time": time.time() - start_time,
+                    "timed_out_providers": timed_out_providers,
+                },
+                source_country,
+                dest_country,
+                source_currency,
+                dest_currency,
+                amount_decimal,
+                params["sort_by"],
+            )
+            self._cache_response_data(
+                response_data,
+                source_country,
+                dest_country,
+                source_currency,
+                dest_currency,
+                amount_decimal,
+            )
+
+            yield format_sse_event(
+                "complete",
+                {
+                    "success": response_data.get("success", False),
+                    "count": len(response_data.get("quotes", [])),
+                    "elapsed_seconds": response_data.get("elapsed_seconds", 0),
+                    "cache_hit": False,
+                },
+            )
+        except Exception as e:
+            logger.exception(f"Error in QuoteStreamAPIView: {str(e)}")
+            yield format_sse_event("error", {"error": f"An error occurred: {str(e)}"})
@@ -39,6 +39,11 @@ app.conf.beat_schedule = {
         "schedule": crontab(hour=3, minute=0),  # Run daily at 3:00 AM
         "args": (),
     },
+    "seed-rate-volatility-daily": {
+        "task": "quotes.tasks.seed_rate_volatility",
+        "schedule": crontab(hour=3, minute=30),  # Run daily at 3:30 AM
+        "args": (),
+    },
 }
 
 
@@ -225,11 +225,92 @@ CACHES = {
 
 # Cache timeout settings (TTL) in seconds
 QUOTE_CACHE_TTL = 60 * 30  # 30 minutes for quotes
+QUOTE_L1_CACHE_SIZE = 1024  # Quote responses each worker keeps in memory in front of Redis
+QUOTE_L1_CACHE_TTL = 30  # Seconds a worker serves a response from memory; bounds staleness after invalidation
+CACHE_GENERATION_LOCAL_TTL = 5  # Seconds a worker reuses the cache key generations it read
 PROVIDER_CACHE_TTL = 60 * 60 * 24  # 24 hours for provider details
+PROVIDER_CACHE_SOFT_TTL = 60 * 10  # 10 minutes - provider quotes older than this are refreshed in the background
+PROVIDER_CACHE_REVALIDATE_LEASE = 60  # Cross-worker lease held while one refresh of an entry runs
 CORRIDOR_CACHE_TTL = 60 * 60 * 12  # 12 hours for corridor availability
 CORRIDOR_RATE_CACHE_TTL = 60 * 60 * 3  # 3 hours for corridor rate data (exchange rates, fees)
 JITTER_MAX_SECONDS = 60  # Maximum jitter in seconds to prevent thundering herd
 
+# Volatility-adaptive TTLs: quote, corridor rate and provider soft TTLs are set so the
+# expected rate drift of a cached quote stays under the tolerance; the static TTLs above
+# apply to pairs without an estimate yet
+RATE_DRIFT_TOLERANCE_BPS = 10  # Expected drift tolerated in a cached rate, in basis points
+ADAPTIVE_CACHE_TTL_MIN = 60  # Shortest adaptive TTL, for the most volatile pairs
+ADAPTIVE_CACHE_TTL_MAX = 60 * 60 * 6  # Longest adaptive TTL, for pegged or quiet pairs
+RATE_VOLATILITY_SMOOTHING = 0.2  # Weight of each new rate observation in the moving average
+RATE_VOLATILITY_MIN_SAMPLES = 5  # Observations before a provider's own estimate replaces the pair's
+RATE_VOLATILITY_MIN_INTERVAL = 60  # Seconds between two rate observations that are both counted
+
+# Aggregator settings
+AGGREGATOR_BLOCKING_POOL_SIZE = int(os.getenv("AGGREGATOR_BLOCKING_POOL_SIZE", "32"))  # Threads for cache I/O in aget_all_quotes
+AGGREGATOR_PROVIDER_LANE_SIZE = int(os.getenv("AGGREGATOR_PROVIDER_LANE_SIZE", "4"))  # Worker threads per provider
+AGGREGATOR_PROVIDER_LANE_QUEUE = int(os.getenv("AGGREGATOR_PROVIDER_LANE_QUEUE", "16"))  # Calls that may wait per provider
+AGGREGATOR_PROVIDER_LANES = {
+    # Per-provider overrides, e.g. "TransferGoProvider": {"size": 2, "queue": 4}
+}
+AGGREGATOR_PROVIDER_POOL_SIZE = AGGREGATOR_PROVIDER_LANE_SIZE  # Warm instances per provider, one per concurrent call
+AGGREGATOR_PROVIDER_POOL_CHECKOUT_TIMEOUT = 30  # Seconds to wait for a free instance
+AGGREGATOR_PROVIDER_POOL_MAX_AGE = 60 * 60  # 1 hour - rebuild instances (and their sessions) after this
+AGGREGATOR_PROVIDER_POOLS = {
+    # Per-provider overrides, e.g. "RIAProvider": {"size": 2, "max_age_seconds": 600}
+}
+PROVIDER_METRICS_FLUSH_SECONDS = 5  # How often each worker pushes its provider call metrics to Redis
+PROVIDER_METRICS_TOKEN = os.getenv("PROVIDER_METRICS_TOKEN")  # Bearer token for scraping /api/aggregator/metrics/providers/
+AGGREGATOR_CORRIDOR_ROUTING = True  # Skip providers whose static corridor tables rule the corridor out
+UNSUPPORTED_CORRIDOR_TTL = 60 * 60 * 24 * 7  # 7 days - marker after a provider rejects a corridor
+UNSUPPORTED_CORRIDOR_REPROBE_SECONDS = 60 * 60 * 24  # 1 day - let one request re-probe a marked corridor
+
+# Provider circuit breakers, shared across workers through Redis
+CIRCUIT_BREAKER_DEFAULTS = {
+    "failure_threshold": 5,  # Failures within the window that open the circuit
+    "window_seconds": 60,  # Rolling window for counting failures
+    "cooldown_seconds": 30,  # Time open before a single probe is let through
+    "slow_call_seconds": 15,  # Calls at least this slow count as failures
+}
+CIRCUIT_BREAKER_PROVIDERS = {
+    # Per-provider overrides, e.g. "TransferGoProvider": {"failure_threshold": 3}
+}
+
+# Outbound rate budgets per provider (token buckets), shared across workers through Redis
+RATE_GOVERNOR_DEFAULTS = {
+    "rate_per_second": None,  # Calls per second to one provider, cluster-wide; None: no budget
+    "burst": 20,  # Calls allowed at once after a quiet period
+    "default_retry_after_seconds": 5,  # Back-off after a 429 without Retry-After
+    "min_rate_factor": 0.1,  # Repeated 429s halve the rate down to this fraction
+    "recovery_seconds": 300,  # 5 minutes without 429s before the full rate returns
+}
+RATE_GOVERNOR_PROVIDERS = {
+    # Per-provider overrides for APIs known to answer 429
+    "PaysendProvider": {"rate_per_second": 2, "burst": 5},
+    "TransferGoProvider": {"rate_per_second": 2, "burst": 5},
+}
+
+# Request hedging for providers with a long latency tail
+AGGREGATOR_HEDGED_PROVIDERS = {
+    # Provider class name -> optional overrides of percentile / min_samples
+    "RIAProvider": {},  # Session and calculator init
+    "XoomProvider": {},  # Homepage and CSRF token fetch
+    "WesternUnionProvider": {},  # Catalog call
+}
+AGGREGATOR_HEDGE_PERCENTILE = 95  # Hedge once a call outlives this percentile of recent latency
+AGGREGATOR_HEDGE_MIN_SAMPLES = 20  # Recent calls needed before hedging a provider
+AGGREGATOR_HEDGE_BUDGET_PERCENT = 5  # Max extra calls from hedging, per 100 calls
+
+# Single-flight coalescing of identical quote fan-outs
+QUOTE_SINGLEFLIGHT_LEASE_SECONDS = 30  # Cross-worker lease held while one fan-out runs
+QUOTE_SINGLEFLIGHT_WAIT_SECONDS = 30  # Max time other requests wait for that fan-out
+PARTIAL_QUOTE_CACHE_TTL = 300  # TTL for responses missing providers that timed out
+QUOTE_MAX_AMOUNTS = 10  # Most amounts accepted by one quote request (amounts=...)
+QUOTE_BULK_MAX_ITEMS = 100  # Most (corridor, amount) items accepted by one bulk request
+
+# Bulk quote sweeps (Aggregator.get_quotes_bulk)
+AGGREGATOR_BULK_MAX_CONCURRENCY = 32  # Provider calls in flight at once across all providers
+AGGREGATOR_BULK_TIMEOUT = 60  # Deadline in seconds for a whole bulk sweep
+
 # Enable the cache middleware
 CACHE_MIDDLEWARE_ALIAS = "default"
 CACHE_MIDDLEWARE_SECONDS = 60 * 5  # 5 minutes
@@ -15,7 +15,8 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/providers/", include("providers.urls")),  # Rate comparison API
     path("api/quotes/", include("quotes.urls")),  # Quotes API
-    # Removed aggregator API - redundant with quotes API
+    # Removed aggregator API - redundant with quotes API; only monitoring endpoints remain
+    path("api/aggregator/", include("aggregator.urls")),
 
     # API Documentation
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),  # API schema
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory and pickled size of Quote records against provider dicts.
+
+Builds the same batch of quotes both ways, as a cache would hold them, and prints
+the bytes allocated (tracemalloc) and the pickled size of each batch.
+
+Usage:
+    python scripts/bench_quote_record.py [count]
+"""
+
+import os
+import pickle
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from providers.base.quote import Quote  # noqa: E402
+
+PROVIDERS = ["WISE", "XE", "RIA", "REMITLY", "WESTERNUNION", "PANGEA", "REWIRE", "SENDWAVE"]
+
+
+def fresh(code):
+    """A new copy of a string, as parsing a provider response would produce."""
+    return code.encode().decode()
+
+
+def provider_dict(i):
+    """A quote in the shape RemittanceProvider.standardize_response builds."""
+    provider_id = PROVIDERS[i % len(PROVIDERS)]
+    return {
+        "provider_id": fresh(provider_id),
+        "provider_name": provider_id.title(),
+        "success": True,
+        "error_message": None,
+        "send_amount": 100.0 + i,
+        "source_currency": fresh("USD"),
+        "destination_amount": (100.0 + i) * 17.2,
+        "destination_currency": fresh("MXN"),
+        "exchange_rate": 17.2,
+        "fee": 3.99,
+        "payment_method": fresh("bank_transfer"),
+        "delivery_method": fresh("bank_deposit"),
+        "delivery_time_minutes": 1440,
+        "delivery_methods": [],
+        "timestamp": "2026-10-16T20:00:00",
+    }
+
+
+def measure(build, count):
+    tracemalloc.start()
+    quotes = [build(i) for i in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated, len(pickle.dumps(quotes, pickle.HIGHEST_PROTOCOL))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    results = {
+        "dict": measure(provider_dict, count),
+        "Quote": measure(lambda i: Quote.from_dict(provider_dict(i)), count),
+    }
+
+    print(f"{count} quotes")
+    print(f"{'':8}{'bytes/quote':>14}{'pickled/quote':>16}")
+    for name, (allocated, pickled) in results.items():
+        print(f"{name:8}{allocated / count:>14.0f}{pickled / count:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()